@@ -0,0 +1,121 @@
+import asyncio
+from weakref import WeakValueDictionary
+
+from langchain_core.messages import RemoveMessage
+from langchain_core.runnables import RunnableConfig
+from langgraph.graph.state import CompiledStateGraph
+from loguru import logger
+
+from .workflow.edges import is_over_summary_trigger
+from .workflow.nodes import summarize_conversation_node
+
+# One lock per conversation thread. A turn holds it while the graph runs, and a
+# background summary holds it only while writing its result, so the summary never
+# lands in the middle of a turn. The locks are process-local.
+_thread_locks: "WeakValueDictionary[str, asyncio.Lock]" = WeakValueDictionary()
+_pending_threads: set[str] = set()
+_background_tasks: set[asyncio.Task] = set()
+
+
+def get_thread_lock(thread_id: str) -> asyncio.Lock:
+    """Get the lock serializing checkpoint writes of a conversation thread.
+
+    Args:
+        thread_id: The conversation thread the lock belongs to.
+
+    Returns:
+        asyncio.Lock: The lock shared by every user of the thread in this process.
+    """
+    lock = _thread_locks.get(thread_id)
+    if lock is None:
+        lock = asyncio.Lock()
+        _thread_locks[thread_id] = lock
+
+    return lock
+
+
+def schedule_conversation_summary(
+    graph: CompiledStateGraph, config: RunnableConfig
+) -> asyncio.Task | None:
+    """Summarize the conversation in a background task once the response is delivered.
+
+    At most one summary per thread is pending at a time.
+
+    Args:
+        graph: The compiled workflow whose checkpointer holds the thread.
+        config: The config of the turn, identifying the thread.
+
+    Returns:
+        asyncio.Task | None: The scheduled task, or None if one is already pending.
+    """
+    thread_id = config["configurable"]["thread_id"]
+    if thread_id in _pending_threads:
+        return None
+
+    _pending_threads.add(thread_id)
+    task = asyncio.create_task(summarize_conversation(graph, config))
+    _background_tasks.add(task)
+
+    def _on_done(done: asyncio.Task) -> None:
+        _background_tasks.discard(done)
+        _pending_threads.discard(thread_id)
+
+    task.add_done_callback(_on_done)
+
+    return task
+
+
+async def summarize_conversation(
+    graph: CompiledStateGraph, config: RunnableConfig
+) -> None:
+    """Summarize a thread if it is over the trigger and write the result to its checkpoint.
+
+    The summary LLM call runs without holding the thread lock, so a new turn is not
+    delayed by it. The result is then applied under the lock: if another summary was
+    written in the meantime it is discarded, and only messages that still exist are
+    removed, so messages added by newer turns are kept.
+
+    Args:
+        graph: The compiled workflow whose checkpointer holds the thread.
+        config: The config of the turn, identifying the thread.
+    """
+    thread_id = config["configurable"]["thread_id"]
+    thread_config = {"configurable": {"thread_id": thread_id}}
+
+    try:
+        snapshot = await graph.aget_state(thread_config)
+        state = snapshot.values
+        if not is_over_summary_trigger(state):
+            return
+
+        update = await summarize_conversation_node(state)
+        if "messages" not in update:
+            return
+
+        async with get_thread_lock(thread_id):
+            latest = (await graph.aget_state(thread_config)).values
+            if latest.get("summary", "") != state.get("summary", ""):
+                logger.info(f"Discarding stale background summary for thread {thread_id}")
+                return
+
+            latest_ids = {message.id for message in latest.get("messages", [])}
+            update["messages"] = [
+                RemoveMessage(id=message.id)
+                for message in update["messages"]
+                if message.id in latest_ids
+            ]
+            await graph.aupdate_state(
+                thread_config, update, as_node="summarize_conversation_node"
+            )
+
+        logger.info(
+            f"Background summary written for thread {thread_id} | removed messages: {len(update['messages'])}"
+        )
+    except Exception as e:
+        logger.error(f"Error summarizing conversation thread {thread_id} in background: {e}")
+
+
+async def drain_background_summaries() -> None:
+    """Wait for all pending background summaries to finish."""
+    if _background_tasks:
+        await asyncio.gather(*_background_tasks, return_exceptions=True)
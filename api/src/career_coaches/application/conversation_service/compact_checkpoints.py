@@ -0,0 +1,167 @@
+from datetime import datetime, timedelta, timezone
+
+from langgraph.checkpoint.base.id import UUID
+from loguru import logger
+
+from career_coaches.config import settings
+from career_coaches.infrastructure.checkpointer import checkpointer_session
+
+# 100-ns intervals between the UUID epoch (1582-10-15) and the Unix epoch.
+_UUID_EPOCH_OFFSET = 0x01B21DD213814000
+
+
+def checkpoint_created_at(checkpoint_id: str) -> datetime:
+    """Get the creation time encoded in a LangGraph (UUIDv6) checkpoint id."""
+    timestamp = UUID(checkpoint_id).time - _UUID_EPOCH_OFFSET
+
+    return datetime.fromtimestamp(timestamp / 10_000_000, tz=timezone.utc)
+
+
+def _select_checkpoints_to_delete(
+    checkpoints: list[dict], keep_last: int
+) -> list[str]:
+    """Pick the checkpoints of a thread that fall outside the retention window.
+
+    Args:
+        checkpoints: The thread's checkpoints, newest first, with their
+            ``checkpoint_id`` and ``parent_checkpoint_id``.
+        keep_last: Number of most recent checkpoints to keep.
+
+    Returns:
+        list[str]: Ids of the checkpoints that can be deleted. Parents of kept
+            checkpoints are never included, so their history stays resolvable.
+    """
+    kept = checkpoints[:keep_last]
+    referenced = {
+        checkpoint["parent_checkpoint_id"]
+        for checkpoint in kept
+        if checkpoint.get("parent_checkpoint_id")
+    }
+    kept_ids = {checkpoint["checkpoint_id"] for checkpoint in kept} | referenced
+
+    return [
+        checkpoint["checkpoint_id"]
+        for checkpoint in checkpoints[keep_last:]
+        if checkpoint["checkpoint_id"] not in kept_ids
+    ]
+
+
+async def compact_checkpoints(
+    keep_last: int = 10,
+    ttl_days: int | None = None,
+    batch_size: int = 500,
+    dry_run: bool = False,
+) -> dict:
+    """Prune old checkpoints and their pending writes from the career coach collections.
+
+    Every thread keeps its ``keep_last`` most recent checkpoints, plus the parents
+    they reference. Threads whose latest checkpoint is older than ``ttl_days`` are
+    deleted entirely, along with their conversation index entry. Deletes are issued in batches of at most ``batch_size`` ids, so
+    the job can run next to live traffic.
+
+    Args:
+        keep_last: Number of most recent checkpoints to keep per thread.
+        ttl_days: Delete threads without activity for this many days. Disabled if None.
+        batch_size: Maximum number of checkpoints deleted per delete command.
+        dry_run: Only count what would be deleted.
+
+    Returns:
+        dict: The number of threads scanned and expired, and of checkpoints and
+            writes deleted (or that would be deleted on a dry run).
+
+    Raises:
+        ValueError: If ``keep_last`` or ``batch_size`` is lower than 1.
+    """
+    if keep_last < 1:
+        raise ValueError("keep_last must be at least 1.")
+    if batch_size < 1:
+        raise ValueError("batch_size must be at least 1.")
+
+    expire_before = (
+        datetime.now(timezone.utc) - timedelta(days=ttl_days)
+        if ttl_days is not None
+        else None
+    )
+    threads_scanned = 0
+    threads_expired = 0
+    checkpoints_deleted = 0
+    writes_deleted = 0
+
+    async with checkpointer_session() as checkpointer:
+        checkpoint_collection = checkpointer.checkpoint_collection
+        writes_collection = checkpointer.writes_collection
+
+        threads = await checkpoint_collection.aggregate(
+            [
+                {
+                    "$group": {
+                        "_id": {
+                            "thread_id": "$thread_id",
+                            "checkpoint_ns": "$checkpoint_ns",
+                        },
+                        "count": {"$sum": 1},
+                        "latest_checkpoint_id": {"$max": "$checkpoint_id"},
+                    }
+                }
+            ],
+            allowDiskUse=True,
+        ).to_list(length=None)
+
+        for thread in threads:
+            threads_scanned += 1
+            thread_filter = {
+                "thread_id": thread["_id"]["thread_id"],
+                "checkpoint_ns": thread["_id"]["checkpoint_ns"],
+            }
+
+            expired = (
+                expire_before is not None
+                and checkpoint_created_at(thread["latest_checkpoint_id"]) < expire_before
+            )
+            if expired:
+                threads_expired += 1
+            elif thread["count"] <= keep_last:
+                continue
+
+            checkpoints = await checkpoint_collection.find(
+                thread_filter,
+                {"_id": 0, "checkpoint_id": 1, "parent_checkpoint_id": 1},
+                sort=[("checkpoint_id", -1)],
+            ).to_list(length=None)
+
+            if expired:
+                to_delete = [checkpoint["checkpoint_id"] for checkpoint in checkpoints]
+            else:
+                to_delete = _select_checkpoints_to_delete(checkpoints, keep_last)
+
+            for start in range(0, len(to_delete), batch_size):
+                batch_filter = {
+                    **thread_filter,
+                    "checkpoint_id": {"$in": to_delete[start : start + batch_size]},
+                }
+                if dry_run:
+                    checkpoints_deleted += await checkpoint_collection.count_documents(batch_filter)
+                    writes_deleted += await writes_collection.count_documents(batch_filter)
+                    continue
+
+                # Writes first, so an interrupted run never leaves orphaned writes.
+                result = await writes_collection.delete_many(batch_filter)
+                writes_deleted += result.deleted_count
+                result = await checkpoint_collection.delete_many(batch_filter)
+                checkpoints_deleted += result.deleted_count
+
+            if expired and not dry_run and not thread_filter["checkpoint_ns"]:
+                await checkpointer.db[settings.MONGO_CAREER_CONVERSATION_INDEX_COLLECTION].delete_one(
+                    {"_id": thread_filter["thread_id"]}
+                )
+
+    logger.info(
+        f"{'Dry run: ' if dry_run else ''}Compacted career coach checkpoints | threads scanned: {threads_scanned} | threads expired: {threads_expired} | checkpoints deleted: {checkpoints_deleted} | writes deleted: {writes_deleted}"
+    )
+
+    return {
+        "threads_scanned": threads_scanned,
+        "threads_expired": threads_expired,
+        "checkpoints_deleted": checkpoints_deleted,
+        "writes_deleted": writes_deleted,
+    }
@@ -0,0 +1,177 @@
+from datetime import datetime, timezone
+
+from langgraph.checkpoint.base import BaseCheckpointSaver
+from loguru import logger
+from pymongo import UpdateOne
+
+from career_coaches.config import settings
+from career_coaches.domain.thread_ids import parse_thread_id
+from career_coaches.infrastructure.checkpointer import checkpointer_session
+from .compact_checkpoints import checkpoint_created_at
+
+# Characters of the last message kept as its preview.
+PREVIEW_CHARS = 200
+
+
+async def record_conversation_turn(
+    checkpointer: BaseCheckpointSaver,
+    thread_id: str,
+    user_id: str,
+    coach_id: str,
+    messages_added: int,
+    last_message: str,
+) -> None:
+    """Update the conversation index entry of a thread after a completed turn.
+
+    The entry is upserted with a single update, so it is created on the first turn
+    of a thread. Failures are logged and never fail the turn. The message count
+    keeps growing when older messages are folded into a summary.
+
+    Args:
+        checkpointer: The checkpointer of the turn; its database holds the index.
+        thread_id: The conversation thread.
+        user_id: The user of the thread.
+        coach_id: The coach of the thread.
+        messages_added: Number of messages the turn added, including the response.
+        last_message: The coach's response.
+    """
+    now = datetime.now(timezone.utc)
+
+    try:
+        await checkpointer.db[settings.MONGO_CAREER_CONVERSATION_INDEX_COLLECTION].update_one(
+            {"_id": thread_id},
+            {
+                "$setOnInsert": {
+                    "user_id": user_id,
+                    "coach_id": coach_id,
+                    "first_message_at": now,
+                },
+                "$set": {
+                    "last_message_at": now,
+                    "last_message_preview": last_message[:PREVIEW_CHARS],
+                },
+                "$inc": {"message_count": messages_added},
+            },
+            upsert=True,
+        )
+    except Exception as e:
+        logger.error(f"Error updating conversation index for thread {thread_id}: {e}")
+
+
+async def _count_thread_messages(writes_collection) -> dict[str, int]:
+    """Count the distinct user and coach messages of every thread in its writes.
+
+    Messages are identified by their ID, or by their type and content if they have
+    none.
+    """
+    counts = writes_collection.aggregate(
+        [
+            {"$unwind": "$state.messages"},
+            {"$match": {"state.messages.type": {"$in": ["human", "ai"]}}},
+            {
+                "$group": {
+                    "_id": {
+                        "thread_id": "$thread_id",
+                        "message": {
+                            "$ifNull": [
+                                "$state.messages.id",
+                                {"type": "$state.messages.type", "content": "$state.messages.content"},
+                            ]
+                        },
+                    }
+                }
+            },
+            {"$group": {"_id": "$_id.thread_id", "count": {"$sum": 1}}},
+        ],
+        allowDiskUse=True,
+    )
+
+    return {thread["_id"]: thread["count"] async for thread in counts}
+
+
+async def rebuild_conversation_index(batch_size: int = 500) -> dict:
+    """Rebuild the conversation index from the stored checkpoints.
+
+    Used to backfill threads that predate the index. Timestamps are read from the
+    time encoded in the checkpoint IDs. The message count is, as for the turns
+    recorded by `record_conversation_turn`, every user and coach message of the
+    thread, including those since folded into a summary: it is counted from the
+    stored writes, as the session history endpoint lists them.
+
+    Args:
+        batch_size: Number of index entries written per bulk write.
+
+    Returns:
+        dict: The number of threads indexed and skipped.
+    """
+    threads_indexed = 0
+    threads_skipped = 0
+
+    async with checkpointer_session() as checkpointer:
+        index_collection = checkpointer.db[settings.MONGO_CAREER_CONVERSATION_INDEX_COLLECTION]
+        message_counts = await _count_thread_messages(checkpointer.writes_collection)
+
+        threads = checkpointer.checkpoint_collection.aggregate(
+            [
+                {"$match": {"checkpoint_ns": ""}},
+                {
+                    "$group": {
+                        "_id": "$thread_id",
+                        "first_checkpoint_id": {"$min": "$checkpoint_id"},
+                        "last_checkpoint_id": {"$max": "$checkpoint_id"},
+                    }
+                },
+            ],
+            allowDiskUse=True,
+        )
+
+        operations = []
+        async for thread in threads:
+            parsed = parse_thread_id(thread["_id"])
+            checkpoint_tuple = await checkpointer.aget_tuple(
+                {"configurable": {"thread_id": thread["_id"], "checkpoint_ns": ""}}
+            )
+            if parsed is None or checkpoint_tuple is None:
+                threads_skipped += 1
+                continue
+
+            messages = [
+                message
+                for message in checkpoint_tuple.checkpoint["channel_values"].get("messages", [])
+                if message.type in ("human", "ai")
+            ]
+            if not messages:
+                threads_skipped += 1
+                continue
+
+            user_id, coach_id = parsed
+            operations.append(
+                UpdateOne(
+                    {"_id": thread["_id"]},
+                    {
+                        "$set": {
+                            "user_id": user_id,
+                            "coach_id": coach_id,
+                            "first_message_at": checkpoint_created_at(thread["first_checkpoint_id"]),
+                            "last_message_at": checkpoint_created_at(thread["last_checkpoint_id"]),
+                            "last_message_preview": str(messages[-1].content)[:PREVIEW_CHARS],
+                            "message_count": message_counts.get(thread["_id"], len(messages)),
+                        }
+                    },
+                    upsert=True,
+                )
+            )
+            if len(operations) >= batch_size:
+                await index_collection.bulk_write(operations, ordered=False)
+                threads_indexed += len(operations)
+                operations = []
+
+        if operations:
+            await index_collection.bulk_write(operations, ordered=False)
+            threads_indexed += len(operations)
+
+    logger.info(
+        f"Rebuilt conversation index | threads indexed: {threads_indexed} | threads skipped: {threads_skipped}"
+    )
+
+    return {"threads_indexed": threads_indexed, "threads_skipped": threads_skipped}
@@ -2,11 +2,23 @@ import uuid
 from typing import Any, AsyncGenerator, Union
 
 from langchain_core.messages import AIMessage, AIMessageChunk, HumanMessage
-from langgraph.checkpoint.mongodb.aio import AsyncMongoDBSaver
+from langchain_core.runnables import RunnableConfig
+from langgraph.checkpoint.base import BaseCheckpointSaver
+from langgraph.graph.state import CompiledStateGraph
 from opik.integrations.langchain import OpikTracer
 
 from career_coaches.config import settings
-from .workflow.graph import create_career_coach_workflow_graph
+from career_coaches.infrastructure.checkpointer import checkpointer_session, get_checkpointer
+from .background_summary import (
+    get_thread_lock,
+    schedule_conversation_summary,
+    summarize_conversation,
+)
+from .conversation_index import record_conversation_turn
+from .workflow.graph import (
+    get_career_coach_graph_definition,
+    get_compiled_career_coach_workflow_graph,
+)
 from .workflow.state import CareerCoachState
 
 
@@ -14,10 +26,6 @@ async def get_response(
     messages: str | list[str] | list[dict[str, Any]],
     user_id: str,
     coach_id: str,
-    coach_name: str,
-    coach_specialty: str,
-    coach_approach: str,
-    coach_focus_areas: list[str],
     user_context: str = "",
     session_goals: list[str] = None,
     new_thread: bool = False,
@@ -29,11 +37,8 @@ async def get_response(
     Args:
         messages: Initial message to start the conversation.
         user_id: Unique identifier for the user (for multi-user support).
-        coach_id: Unique identifier for the career coach.
-        coach_name: Name of the career coach.
-        coach_specialty: Coach's specialty area.
-        coach_approach: Coach's approach and methodology.
-        coach_focus_areas: List of coach's focus areas.
+        coach_id: Unique identifier for the career coach. The persona is hydrated
+            from `CoachFactory` inside the workflow.
         user_context: Additional context about the user's career situation.
         session_goals: Goals for the coaching session.
         new_thread: Whether to create a new conversation thread.
@@ -49,17 +54,10 @@ async def get_response(
     if session_goals is None:
         session_goals = []
 
-    graph_builder = create_career_coach_workflow_graph()
-
     try:
-        async with AsyncMongoDBSaver.from_conn_string(
-            conn_string=settings.MONGO_URI,
-            db_name=settings.MONGO_DB_NAME,
-            checkpoint_collection_name=settings.MONGO_CAREER_STATE_CHECKPOINT_COLLECTION,
-            writes_collection_name=settings.MONGO_CAREER_STATE_WRITES_COLLECTION,
-        ) as checkpointer:
-            graph = graph_builder.compile(checkpointer=checkpointer)
-            opik_tracer = OpikTracer(graph=graph.get_graph(xray=True))
+        async with checkpointer_session() as checkpointer:
+            graph = get_compiled_career_coach_workflow_graph(checkpointer)
+            opik_tracer = __create_opik_tracer()
 
             # Create thread ID with user_id and coach_id for multi-user support
             thread_id = (
@@ -71,23 +69,33 @@ async def get_response(
                 "callbacks": [opik_tracer],
             }
 
-            output_state = await graph.ainvoke(
-                input={
-                    "messages": __format_messages(messages=messages),
-                    "user_id": user_id,
-                    "coach_id": coach_id,
-                    "coach_name": coach_name,
-                    "coach_specialty": coach_specialty,
-                    "coach_approach": coach_approach,
-                    "coach_focus_areas": coach_focus_areas,
-                    "user_context": user_context,
-                    "session_goals": session_goals,
-                    "use_web_tools": use_web_tools,
-                    "search_tool_name": search_tool_name,
-                },
-                config=config,
+            input_messages = __format_messages(messages=messages)
+            async with get_thread_lock(thread_id):
+                output_state = await graph.ainvoke(
+                    input={
+                        "messages": input_messages,
+                        "user_id": user_id,
+                        "coach_id": coach_id,
+                        "user_context": user_context,
+                        "session_goals": session_goals,
+                        "use_web_tools": use_web_tools,
+                        "search_tool_name": search_tool_name,
+                    },
+                    config=config,
+                )
+
+            last_message = output_state["messages"][-1]
+            await record_conversation_turn(
+                checkpointer,
+                thread_id,
+                user_id,
+                coach_id,
+                messages_added=len(input_messages) + 1,
+                last_message=last_message.content,
             )
-        last_message = output_state["messages"][-1]
+
+            if settings.CAREER_COACH_BACKGROUND_SUMMARIZATION:
+                await __summarize_after_turn(graph, config, checkpointer)
         return last_message.content, CareerCoachState(**output_state)
     except Exception as e:
         raise RuntimeError(f"Error running career coach conversation workflow: {str(e)}") from e
@@ -97,10 +105,6 @@ async def get_streaming_response(
     messages: str | list[str] | list[dict[str, Any]],
     user_id: str,
     coach_id: str,
-    coach_name: str,
-    coach_specialty: str,
-    coach_approach: str,
-    coach_focus_areas: list[str],
     user_context: str = "",
     session_goals: list[str] = None,
     new_thread: bool = False,
@@ -112,11 +116,8 @@ async def get_streaming_response(
     Args:
         messages: Initial message to start the conversation.
         user_id: Unique identifier for the user.
-        coach_id: Unique identifier for the career coach.
-        coach_name: Name of the career coach.
-        coach_specialty: Coach's specialty area.
-        coach_approach: Coach's approach and methodology.
-        coach_focus_areas: List of coach's focus areas.
+        coach_id: Unique identifier for the career coach. The persona is hydrated
+            from `CoachFactory` inside the workflow.
         user_context: Additional context about the user's career situation.
         session_goals: Goals for the coaching session.
         new_thread: Whether to create a new conversation thread.
@@ -130,17 +131,10 @@ async def get_streaming_response(
     if session_goals is None:
         session_goals = []
 
-    graph_builder = create_career_coach_workflow_graph()
-
     try:
-        async with AsyncMongoDBSaver.from_conn_string(
-            conn_string=settings.MONGO_URI,
-            db_name=settings.MONGO_DB_NAME,
-            checkpoint_collection_name=settings.MONGO_CAREER_STATE_CHECKPOINT_COLLECTION,
-            writes_collection_name=settings.MONGO_CAREER_STATE_WRITES_COLLECTION,
-        ) as checkpointer:
-            graph = graph_builder.compile(checkpointer=checkpointer)
-            opik_tracer = OpikTracer(graph=graph.get_graph(xray=True))
+        async with checkpointer_session() as checkpointer:
+            graph = get_compiled_career_coach_workflow_graph(checkpointer)
+            opik_tracer = __create_opik_tracer()
 
             # Create thread ID with user_id and coach_id for multi-user support
             thread_id = (
@@ -152,27 +146,39 @@ async def get_streaming_response(
                 "callbacks": [opik_tracer],
             }
 
-            async for chunk in graph.astream(
-                input={
-                    "messages": __format_messages(messages=messages),
-                    "user_id": user_id,
-                    "coach_id": coach_id,
-                    "coach_name": coach_name,
-                    "coach_specialty": coach_specialty,
-                    "coach_approach": coach_approach,
-                    "coach_focus_areas": coach_focus_areas,
-                    "user_context": user_context,
-                    "session_goals": session_goals,
-                    "use_web_tools": use_web_tools,
-                    "search_tool_name": search_tool_name,
-                },
-                config=config,
-                stream_mode="messages",
-            ):
-                if chunk[1]["langgraph_node"] == "conversation_node" and isinstance(
-                    chunk[0], AIMessageChunk
+            input_messages = __format_messages(messages=messages)
+            response_chunks = []
+            async with get_thread_lock(thread_id):
+                async for chunk in graph.astream(
+                    input={
+                        "messages": input_messages,
+                        "user_id": user_id,
+                        "coach_id": coach_id,
+                        "user_context": user_context,
+                        "session_goals": session_goals,
+                        "use_web_tools": use_web_tools,
+                        "search_tool_name": search_tool_name,
+                    },
+                    config=config,
+                    stream_mode="messages",
                 ):
-                    yield chunk[0].content
+                    if chunk[1]["langgraph_node"] == "conversation_node" and isinstance(
+                        chunk[0], AIMessageChunk
+                    ):
+                        response_chunks.append(chunk[0].content)
+                        yield chunk[0].content
+
+            await record_conversation_turn(
+                checkpointer,
+                thread_id,
+                user_id,
+                coach_id,
+                messages_added=len(input_messages) + 1,
+                last_message="".join(response_chunks),
+            )
+
+            if settings.CAREER_COACH_BACKGROUND_SUMMARIZATION:
+                await __summarize_after_turn(graph, config, checkpointer)
 
     except Exception as e:
         raise RuntimeError(
@@ -180,6 +186,34 @@ async def get_streaming_response(
         ) from e
 
 
+async def __summarize_after_turn(
+    graph: CompiledStateGraph,
+    config: RunnableConfig,
+    checkpointer: BaseCheckpointSaver,
+) -> None:
+    """Summarize the conversation once the turn's response has been delivered.
+
+    With the shared API checkpointer the summary runs as a background task. A
+    short-lived checkpointer is closed right after the turn, so the summary is awaited
+    before returning instead.
+    """
+    if checkpointer is get_checkpointer():
+        schedule_conversation_summary(graph, config)
+    else:
+        await summarize_conversation(graph, config)
+
+
+def __create_opik_tracer() -> OpikTracer:
+    """Create a per-turn Opik tracer that reuses the cached graph definition.
+
+    Returns:
+        OpikTracer: A tracer whose traces carry the workflow graph definition.
+    """
+    return OpikTracer(
+        metadata={"_opik_graph_definition": get_career_coach_graph_definition()}
+    )
+
+
 def __format_messages(
     messages: Union[str, list[dict[str, Any]]],
 ) -> list[Union[HumanMessage, AIMessage]]:
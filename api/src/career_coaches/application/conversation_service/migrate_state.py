@@ -0,0 +1,81 @@
+from loguru import logger
+from pymongo import UpdateOne
+
+from career_coaches.infrastructure.checkpointer import checkpointer_session
+from .workflow.state import LEGACY_PERSONA_CHANNELS
+
+
+def _strip_legacy_persona_channels(checkpoint: dict) -> bool:
+    """Remove the legacy persona channels from a checkpoint in place.
+
+    Returns:
+        bool: Whether the checkpoint contained any legacy channel.
+    """
+    found = False
+    for channel in LEGACY_PERSONA_CHANNELS:
+        if checkpoint.get("channel_values", {}).pop(channel, None) is not None:
+            found = True
+        if checkpoint.get("channel_versions", {}).pop(channel, None) is not None:
+            found = True
+        for seen in checkpoint.get("versions_seen", {}).values():
+            seen.pop(channel, None)
+
+    return found
+
+
+async def compact_legacy_persona_state(batch_size: int = 500) -> dict:
+    """Remove persona text copied into checkpoints written before the compact state.
+
+    Threads keep working without this migration: LangGraph ignores the legacy
+    channels when loading a checkpoint and drops their values from the next one it
+    writes. Running it shrinks the documents already stored for older turns.
+
+    Args:
+        batch_size: Number of checkpoints rewritten per bulk write.
+
+    Returns:
+        dict: The number of checkpoints rewritten and legacy writes deleted.
+    """
+    checkpoints_updated = 0
+
+    async with checkpointer_session() as checkpointer:
+        checkpoint_collection = checkpointer.checkpoint_collection
+        writes_collection = checkpointer.writes_collection
+
+        operations = []
+        cursor = checkpoint_collection.find(
+            {}, {"type": 1, "checkpoint": 1}, batch_size=batch_size
+        )
+        async for doc in cursor:
+            checkpoint = checkpointer.serde.loads_typed((doc["type"], doc["checkpoint"]))
+            if not _strip_legacy_persona_channels(checkpoint):
+                continue
+
+            type_, serialized_checkpoint = checkpointer.serde.dumps_typed(checkpoint)
+            operations.append(
+                UpdateOne(
+                    {"_id": doc["_id"]},
+                    {"$set": {"type": type_, "checkpoint": serialized_checkpoint}},
+                )
+            )
+            if len(operations) >= batch_size:
+                await checkpoint_collection.bulk_write(operations, ordered=False)
+                checkpoints_updated += len(operations)
+                operations = []
+
+        if operations:
+            await checkpoint_collection.bulk_write(operations, ordered=False)
+            checkpoints_updated += len(operations)
+
+        result = await writes_collection.delete_many(
+            {"channel": {"$in": list(LEGACY_PERSONA_CHANNELS)}}
+        )
+
+    logger.info(
+        f"Compacted legacy persona state | checkpoints updated: {checkpoints_updated} | writes deleted: {result.deleted_count}"
+    )
+
+    return {
+        "checkpoints_updated": checkpoints_updated,
+        "writes_deleted": result.deleted_count,
+    }
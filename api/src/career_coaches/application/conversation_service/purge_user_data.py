@@ -0,0 +1,226 @@
+import asyncio
+from collections import OrderedDict
+from datetime import datetime, timezone
+from typing import Literal
+from uuid import uuid4
+
+from loguru import logger
+from motor.motor_asyncio import AsyncIOMotorCollection
+from pydantic import BaseModel, Field
+
+from career_coaches.config import settings
+from career_coaches.domain.thread_ids import parse_thread_id, user_thread_id_range
+from career_coaches.infrastructure.checkpointer import checkpointer_session
+from resume_editor.application.config import ApplicationConfig
+from resume_editor.infrastructure.repositories import FileResumeRepository
+
+# Finished jobs kept for the progress endpoint; the oldest are forgotten first.
+MAX_FINISHED_JOBS = 1000
+
+PurgeStatus = Literal["pending", "running", "completed", "failed"]
+
+
+class PurgeJob(BaseModel):
+    """Progress of a background purge of the data of one user.
+
+    Attributes:
+        job_id (str): Identifier of the job.
+        user_id (str): The user whose data is purged.
+        status (PurgeStatus): Current state of the job.
+        threads (int): Conversation threads of the user found by the job.
+        deleted (dict[str, int]): Documents deleted so far, by collection name.
+        resume_deleted (bool): Whether a stored resume was deleted.
+        error (str, optional): Error that failed the job.
+        created_at (datetime): When the job was started.
+        finished_at (datetime, optional): When the job completed or failed.
+    """
+
+    job_id: str
+    user_id: str
+    status: PurgeStatus = "pending"
+    threads: int = 0
+    deleted: dict[str, int] = Field(default_factory=dict)
+    resume_deleted: bool = False
+    error: str | None = None
+    created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+    finished_at: datetime | None = None
+
+
+# Jobs are process-local: the progress of a job is served by the worker running it.
+_jobs: "OrderedDict[str, PurgeJob]" = OrderedDict()
+_active_jobs: dict[str, str] = {}
+_background_tasks: set[asyncio.Task] = set()
+
+
+async def find_user_thread_ids(
+    checkpoint_collection: AsyncIOMotorCollection,
+    writes_collection: AsyncIOMotorCollection,
+    user_id: str,
+) -> list[str]:
+    """Get the conversation threads of a user.
+
+    The prefix range also holds the threads of users whose ID extends this one
+    (e.g. "bob_smith" for "bob"), so each thread ID is parsed and kept only if it
+    belongs to the user exactly.
+    """
+    query = {"thread_id": user_thread_id_range(user_id)}
+    thread_ids = set(await checkpoint_collection.distinct("thread_id", query))
+    thread_ids.update(await writes_collection.distinct("thread_id", query))
+
+    return sorted(
+        thread_id
+        for thread_id in thread_ids
+        if (parsed := parse_thread_id(thread_id)) is not None and parsed[0] == user_id
+    )
+
+
+async def _delete_in_batches(
+    collection: AsyncIOMotorCollection,
+    query: dict,
+    job: PurgeJob,
+    batch_size: int,
+    pause_s: float,
+) -> None:
+    deleted = job.deleted.setdefault(collection.name, 0)
+    while True:
+        ids = [doc["_id"] async for doc in collection.find(query, {"_id": 1}).limit(batch_size)]
+        if not ids:
+            break
+
+        result = await collection.delete_many({"_id": {"$in": ids}})
+        deleted += result.deleted_count
+        job.deleted[collection.name] = deleted
+        if len(ids) < batch_size:
+            break
+        await asyncio.sleep(pause_s)
+
+
+async def purge_user_data(
+    user_id: str,
+    job: PurgeJob | None = None,
+    batch_size: int | None = None,
+    pause_ms: int | None = None,
+) -> PurgeJob:
+    """Delete the conversations, conversation index entries and resume of a user.
+
+    Documents are deleted in batches of `batch_size` with a pause in between, so a
+    large purge does not hold MongoDB busy. Writes are deleted before checkpoints,
+    so a purge interrupted midway never leaves writes without their checkpoint.
+    Progress is recorded on `job` as the purge goes.
+
+    Args:
+        user_id: The user whose data is deleted.
+        job: The job tracking the purge. A new one is created if not provided.
+        batch_size: Documents deleted per batch. Defaults to the configured size.
+        pause_ms: Pause between two batches. Defaults to the configured pause.
+
+    Returns:
+        PurgeJob: The completed job.
+
+    Raises:
+        Exception: If a deletion fails; the job is marked as failed. A cancelled
+            purge is marked as failed as well, and can be started again.
+    """
+    job = job or PurgeJob(job_id=str(uuid4()), user_id=user_id)
+    batch_size = batch_size or settings.CAREER_COACH_PURGE_BATCH_SIZE
+    pause_s = (settings.CAREER_COACH_PURGE_BATCH_PAUSE_MS if pause_ms is None else pause_ms) / 1000
+    job.status = "running"
+
+    try:
+        async with checkpointer_session() as checkpointer:
+            thread_ids = await find_user_thread_ids(
+                checkpointer.checkpoint_collection, checkpointer.writes_collection, user_id
+            )
+            job.threads = len(thread_ids)
+
+            if thread_ids:
+                thread_query = {"thread_id": {"$in": thread_ids}}
+                await _delete_in_batches(
+                    checkpointer.writes_collection, thread_query, job, batch_size, pause_s
+                )
+                await _delete_in_batches(
+                    checkpointer.checkpoint_collection, thread_query, job, batch_size, pause_s
+                )
+
+            await _delete_in_batches(
+                checkpointer.db[settings.MONGO_CAREER_CONVERSATION_INDEX_COLLECTION],
+                {"user_id": user_id},
+                job,
+                batch_size,
+                pause_s,
+            )
+
+        resume_repository = FileResumeRepository(ApplicationConfig().absolute_data_path)
+        job.resume_deleted = await asyncio.to_thread(resume_repository.delete_resume, user_id)
+    except (Exception, asyncio.CancelledError) as e:
+        job.status = "failed"
+        job.error = str(e) or type(e).__name__
+        job.finished_at = datetime.now(timezone.utc)
+        logger.error(f"Error purging data for user {user_id}: {e}")
+        raise
+
+    job.status = "completed"
+    job.finished_at = datetime.now(timezone.utc)
+    logger.info(
+        f"Purged data for user {user_id} | threads: {job.threads} | deleted: {job.deleted} | resume deleted: {job.resume_deleted}"
+    )
+
+    return job
+
+
+def start_user_purge(user_id: str) -> PurgeJob:
+    """Purge the data of a user in a background task.
+
+    At most one purge per user runs at a time; starting another while one is running
+    returns the running job.
+
+    Args:
+        user_id: The user whose data is deleted.
+
+    Returns:
+        PurgeJob: The job to follow the purge with `get_purge_job`.
+    """
+    active_job_id = _active_jobs.get(user_id)
+    if active_job_id is not None:
+        return _jobs[active_job_id]
+
+    job = PurgeJob(job_id=str(uuid4()), user_id=user_id)
+    _jobs[job.job_id] = job
+    _active_jobs[user_id] = job.job_id
+    _forget_finished_jobs()
+
+    task = asyncio.create_task(purge_user_data(user_id, job))
+    _background_tasks.add(task)
+
+    def _on_done(done: asyncio.Task) -> None:
+        _background_tasks.discard(done)
+        _active_jobs.pop(user_id, None)
+        if not done.cancelled():
+            # Already logged and recorded on the job.
+            done.exception()
+
+    task.add_done_callback(_on_done)
+
+    return job
+
+
+def get_purge_job(job_id: str) -> PurgeJob | None:
+    """Get a purge job started in this process, or None if it is unknown."""
+    return _jobs.get(job_id)
+
+
+def _forget_finished_jobs() -> None:
+    finished = [job_id for job_id, job in _jobs.items() if job.finished_at is not None]
+    for job_id in finished[: max(len(finished) - MAX_FINISHED_JOBS, 0)]:
+        del _jobs[job_id]
+
+
+async def cancel_user_purges() -> None:
+    """Cancel the running purges, e.g. on shutdown.
+
+    A purge only deletes, so a cancelled one is completed by starting it again.
+    """
+    tasks = list(_background_tasks)
+    for task in tasks:
+        task.cancel()
+    await asyncio.gather(*tasks, return_exceptions=True)
@@ -2,14 +2,16 @@ from langchain_core.documents import Document
 from loguru import logger
 
 from career_coaches.config import settings
-from common.infrastructure.mongo.client import MongoClientWrapper
+from common.infrastructure.mongo.async_client import AsyncMongoClientWrapper
+from .purge_user_data import purge_user_data
 
 
 async def reset_conversation_state(user_id: str = None) -> dict:
     """Reset the conversation state for career coaches.
     
     Deletes the MongoDB collections used for keeping LangGraph state.
-    If user_id is provided, only resets state for that specific user.
+    If user_id is provided, only the data of that user is purged, in batches
+    (see `purge_user_data`).
 
     Args:
         user_id: Optional user ID to reset state for specific user only
@@ -20,56 +22,37 @@ async def reset_conversation_state(user_id: str = None) -> dict:
     Raises:
         Exception: If there is an error resetting the conversation state.
     """
-    try:
-        # Reset checkpoint collection
-        with MongoClientWrapper(
-            model=Document,
-            collection_name=settings.MONGO_CAREER_STATE_CHECKPOINT_COLLECTION,
-            database_name=settings.MONGO_DB_NAME,
-            mongodb_uri=settings.MONGO_URI,
-            app_name="career_coaches",
-        ) as client:
-            if user_id:
-                # Delete only checkpoints for specific user
-                query = {"thread_id": {"$regex": f"^{user_id}_"}}
-                result_checkpoints = client.collection.delete_many(query)
-                logger.info(f"Deleted {result_checkpoints.deleted_count} checkpoint documents for user {user_id}")
-            else:
-                # Clear entire collection
-                client.clear_collection()
-                logger.info("Cleared all career coach checkpoint documents")
+    if user_id:
+        job = await purge_user_data(user_id)
 
-        # Reset writes collection
-        with MongoClientWrapper(
-            model=Document,
-            collection_name=settings.MONGO_CAREER_STATE_WRITES_COLLECTION,
-            database_name=settings.MONGO_DB_NAME,
-            mongodb_uri=settings.MONGO_URI,
-            app_name="career_coaches",
-        ) as client:
-            if user_id:
-                # Delete only writes for specific user
-                query = {"thread_id": {"$regex": f"^{user_id}_"}}
-                result_writes = client.collection.delete_many(query)
-                logger.info(f"Deleted {result_writes.deleted_count} write documents for user {user_id}")
-            else:
-                # Clear entire collection
-                client.clear_collection()
-                logger.info("Cleared all career coach write documents")
+        return {
+            "message": f"Career coach conversation state reset successfully for user {user_id}",
+            "user_id": user_id,
+            "checkpoints_deleted": job.deleted.get(settings.MONGO_CAREER_STATE_CHECKPOINT_COLLECTION, 0),
+            "writes_deleted": job.deleted.get(settings.MONGO_CAREER_STATE_WRITES_COLLECTION, 0),
+        }
 
-        if user_id:
-            return {
-                "message": f"Career coach conversation state reset successfully for user {user_id}",
-                "user_id": user_id,
-                "checkpoints_deleted": result_checkpoints.deleted_count if user_id else "all",
-                "writes_deleted": result_writes.deleted_count if user_id else "all",
-            }
-        else:
-            return {
-                "message": "Career coach conversation state reset successfully for all users",
-                "checkpoints_deleted": "all",
-                "writes_deleted": "all",
-            }
+    try:
+        for collection_name in (
+            settings.MONGO_CAREER_STATE_CHECKPOINT_COLLECTION,
+            settings.MONGO_CAREER_STATE_WRITES_COLLECTION,
+            settings.MONGO_CAREER_CONVERSATION_INDEX_COLLECTION,
+        ):
+            async with AsyncMongoClientWrapper(
+                model=Document,
+                collection_name=collection_name,
+                database_name=settings.MONGO_DB_NAME,
+                mongodb_uri=settings.MONGO_URI,
+                app_name="career_coaches",
+            ) as client:
+                await client.clear_collection()
+                logger.info(f"Cleared all documents of {collection_name}")
+
+        return {
+            "message": "Career coach conversation state reset successfully for all users",
+            "checkpoints_deleted": "all",
+            "writes_deleted": "all",
+        }
 
     except Exception as e:
         logger.error(f"Error resetting career coach conversation state: {e}")
@@ -1,3 +1,10 @@
+import asyncio
+from collections import OrderedDict
+from typing import Any, Callable, Hashable
+from weakref import WeakKeyDictionary
+
+import groq
+import httpx
 from langchain_core.prompts import ChatPromptTemplate, MessagesPlaceholder
 from langchain_groq import ChatGroq
 from langchain.agents import AgentExecutor, create_openai_tools_agent
@@ -16,15 +23,137 @@ from common.domain.prompts import (
 )
 
 # Import the web search tools
-from career_coaches.application.conversation_service.workflow.tools import tools as web_tools
+from career_coaches.application.conversation_service.workflow.tools import configure_web_tools
+
+# Ready-to-run chains and the HTTP connection pool they share, one set per event
+# loop. The API runs a single loop, so in practice there is one pool per process;
+# tools that call asyncio.run() repeatedly get a fresh pool for each loop instead of
+# reusing connections that belong to a closed one.
+_chain_caches: "WeakKeyDictionary[asyncio.AbstractEventLoop, OrderedDict]" = (
+    WeakKeyDictionary()
+)
+_http_async_clients: "WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient]" = (
+    WeakKeyDictionary()
+)
+_http_client: httpx.Client | None = None
+_sync_chain_cache: OrderedDict = OrderedDict()
+
+
+def _get_running_loop() -> asyncio.AbstractEventLoop | None:
+    try:
+        return asyncio.get_running_loop()
+    except RuntimeError:
+        return None
+
+
+def _get_http_limits() -> httpx.Limits:
+    return httpx.Limits(
+        max_connections=settings.GROQ_HTTP_MAX_CONNECTIONS,
+        max_keepalive_connections=settings.GROQ_HTTP_MAX_KEEPALIVE_CONNECTIONS,
+    )
+
+
+def get_llm_http_client() -> httpx.Client:
+    """Get the HTTP client shared by all synchronous LLM calls."""
+    global _http_client
+
+    if _http_client is None:
+        _http_client = groq.DefaultHttpxClient(limits=_get_http_limits())
+
+    return _http_client
+
+
+def get_llm_http_async_client() -> httpx.AsyncClient | None:
+    """Get the HTTP client shared by all asynchronous LLM calls on the running loop.
+
+    Returns:
+        httpx.AsyncClient | None: The shared client, or None when called outside an
+            event loop, in which case the Groq SDK creates its own client.
+    """
+    loop = _get_running_loop()
+    if loop is None:
+        return None
+
+    client = _http_async_clients.get(loop)
+    if client is None:
+        client = groq.DefaultAsyncHttpxClient(limits=_get_http_limits())
+        _http_async_clients[loop] = client
+
+    return client
+
+
+async def aclose_llm_http_clients() -> None:
+    """Close the shared LLM HTTP clients and drop the chains built on top of them."""
+    global _http_client
+
+    loop = _get_running_loop()
+    if loop is not None:
+        _chain_caches.pop(loop, None)
+        client = _http_async_clients.pop(loop, None)
+        if client is not None:
+            await client.aclose()
+
+    if _http_client is not None:
+        _http_client.close()
+        _http_client = None
+        _sync_chain_cache.clear()
+
+
+def _get_or_create_chain(key: Hashable, factory: Callable[[], Any]) -> Any:
+    """Return the cached chain for ``key``, building it with ``factory`` on a miss.
+
+    The cache is an LRU bounded by ``CAREER_COACH_CHAIN_CACHE_SIZE``.
+    """
+    loop = _get_running_loop()
+    if loop is None:
+        cache = _sync_chain_cache
+    else:
+        cache = _chain_caches.get(loop)
+        if cache is None:
+            cache = OrderedDict()
+            _chain_caches[loop] = cache
+
+    chain = cache.get(key)
+    if chain is not None:
+        cache.move_to_end(key)
+        return chain
+
+    chain = factory()
+    cache[key] = chain
+    if len(cache) > settings.CAREER_COACH_CHAIN_CACHE_SIZE:
+        cache.popitem(last=False)
+
+    return chain
+
+
+# Appended to the coach system prompt when web search tools are enabled.
+WEB_TOOLS_INSTRUCTION = """
+        
+        You now have access to real-time web search tools. Use them when you need current information about:
+        - Job market trends and statistics
+        - Industry-specific developments
+        - Company information
+        - Current in-demand skills
+        - Recent changes in career fields
+        
+        When using search tools, form concise, specific queries to get the most relevant results.
+        After getting search results, integrate that information naturally into your response.
+        Always attribute information from web searches by mentioning "According to recent information..." 
+        or similar phrases.
+        
+        Only use web search when truly necessary - for general career advice or timeless information,
+        rely on your existing knowledge.
+        """
 
 
 def get_chat_model(temperature: float = 0.7, model_name: str = settings.GROQ_LLM_MODEL) -> ChatGroq:
-    """Get a configured ChatGroq model instance."""
+    """Get a configured ChatGroq model instance backed by the shared HTTP clients."""
     return ChatGroq(
         api_key=settings.GROQ_API_KEY,
         model_name=model_name,
         temperature=temperature,
+        http_client=get_llm_http_client(),
+        http_async_client=get_llm_http_async_client(),
     )
 
 
@@ -40,39 +169,59 @@ def get_prompt_by_coach_id(coach_id: str):
     return prompt_mapping.get(coach_id.lower(), CAREER_ASSESSMENT_PROMPT)
 
 
-def get_career_coach_response_chain(coach_id: str = "career_assessment", use_web_tools: bool = False):
-    """Create a chain for generating career coach responses.
-    
+def get_career_coach_response_chain(
+    coach_id: str = "career_assessment",
+    use_web_tools: bool = False,
+    search_tool_name: str = "all",
+    model_name: str = settings.GROQ_LLM_MODEL,
+    temperature: float = 0.7,
+):
+    """Get a chain for generating career coach responses.
+
+    Chains are cached by coach, tool mode, search tool set, model and temperature,
+    so prompt parsing and client construction only happen on a cache miss.
+
     Args:
         coach_id: The type of coach to use
         use_web_tools: Whether to enable web search capabilities
-        
+        search_tool_name: Which search tools to enable (tavily, serper, ddg, all)
+        model_name: The Groq model to generate responses with
+        temperature: Sampling temperature of the model
+
     Returns:
         A chain that can be invoked with messages to get responses
     """
-    model = get_chat_model()
+    key = (
+        "response",
+        coach_id.lower(),
+        use_web_tools,
+        search_tool_name if use_web_tools else None,
+        model_name,
+        temperature,
+    )
+
+    return _get_or_create_chain(
+        key,
+        lambda: _create_career_coach_response_chain(
+            coach_id, use_web_tools, search_tool_name, model_name, temperature
+        ),
+    )
+
+
+def _create_career_coach_response_chain(
+    coach_id: str,
+    use_web_tools: bool,
+    search_tool_name: str,
+    model_name: str,
+    temperature: float,
+):
+    model = get_chat_model(temperature=temperature, model_name=model_name)
     system_message = get_prompt_by_coach_id(coach_id)
-    
-    if use_web_tools and web_tools:
+    search_tools = configure_web_tools(search_tool_name) if use_web_tools else []
+
+    if use_web_tools and search_tools:
         # Add web search instructions to the prompt
-        web_tools_instruction = """
-        
-        You now have access to real-time web search tools. Use them when you need current information about:
-        - Job market trends and statistics
-        - Industry-specific developments
-        - Company information
-        - Current in-demand skills
-        - Recent changes in career fields
-        
-        When using search tools, form concise, specific queries to get the most relevant results.
-        After getting search results, integrate that information naturally into your response.
-        Always attribute information from web searches by mentioning "According to recent information..." 
-        or similar phrases.
-        
-        Only use web search when truly necessary - for general career advice or timeless information,
-        rely on your existing knowledge.
-        """
-        system_prompt = system_message.prompt + web_tools_instruction
+        system_prompt = system_message.prompt + WEB_TOOLS_INSTRUCTION
         
         # Create an agent with web search tools
         prompt = ChatPromptTemplate.from_messages(
@@ -84,8 +233,8 @@ def get_career_coach_response_chain(coach_id: str = "career_assessment", use_web
         )
         
         # Create the agent with search tools
-        agent = create_openai_tools_agent(model, web_tools, prompt)
-        return AgentExecutor(agent=agent, tools=web_tools, handle_parsing_errors=True)
+        agent = create_openai_tools_agent(model, search_tools, prompt)
+        return AgentExecutor(agent=agent, tools=search_tools, handle_parsing_errors=True)
     else:
         # Regular career coach without web tools
         prompt = ChatPromptTemplate.from_messages(
@@ -100,7 +249,13 @@ def get_career_coach_response_chain(coach_id: str = "career_assessment", use_web
 
 
 def get_conversation_summary_chain(summary: str = ""):
-    """Create a chain for summarizing conversations."""
+    """Get a chain for summarizing conversations."""
+    key = ("conversation_summary", bool(summary), settings.GROQ_LLM_MODEL_CONTEXT_SUMMARY)
+
+    return _get_or_create_chain(key, lambda: _create_conversation_summary_chain(summary))
+
+
+def _create_conversation_summary_chain(summary: str):
     model = get_chat_model(model_name=settings.GROQ_LLM_MODEL_CONTEXT_SUMMARY)
 
     summary_message = EXTEND_SUMMARY_PROMPT if summary else SUMMARY_PROMPT
@@ -117,7 +272,13 @@ def get_conversation_summary_chain(summary: str = ""):
 
 
 def get_context_summary_chain():
-    """Create a chain for summarizing context information."""
+    """Get a chain for summarizing context information."""
+    key = ("context_summary", settings.GROQ_LLM_MODEL_CONTEXT_SUMMARY)
+
+    return _get_or_create_chain(key, _create_context_summary_chain)
+
+
+def _create_context_summary_chain():
     model = get_chat_model(model_name=settings.GROQ_LLM_MODEL_CONTEXT_SUMMARY)
     prompt = ChatPromptTemplate.from_messages(
         [
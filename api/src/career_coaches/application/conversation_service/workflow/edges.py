@@ -2,10 +2,33 @@ from langgraph.graph import END
 
 from career_coaches.config import settings
 from .state import CareerCoachState
+from .tokens import count_context_tokens, trim_messages_to_budget
+
+
+def is_over_summary_trigger(state: CareerCoachState) -> bool:
+    """Check whether the conversation context has grown past the summary trigger.
+
+    The context counts the coach system prompt, the summary and the full history.
+    Only history older than the tail retained after a summary can be summarized, so
+    the trigger also requires such messages: a context over the trigger because of
+    the prompt and summary alone would otherwise summarize nothing on every turn.
+    """
+    if count_context_tokens(state) < settings.CAREER_COACH_SUMMARY_TRIGGER_TOKENS:
+        return False
+
+    messages = state.get("messages", [])
+    kept_messages = trim_messages_to_budget(
+        messages, settings.CAREER_COACH_HISTORY_TOKENS_AFTER_SUMMARY
+    )
+
+    return len(kept_messages) < len(messages)
 
 
 def should_summarize_conversation(state: CareerCoachState) -> str:
-    """Determine if the conversation should be summarized based on message count.
+    """Determine if the conversation should be summarized based on its token count.
+
+    When background summarization is enabled the graph always ends after the reply,
+    and the summary is written to the checkpoint once the response is delivered.
     
     Args:
         state: Current conversation state
@@ -13,9 +36,10 @@ def should_summarize_conversation(state: CareerCoachState) -> str:
     Returns:
         str: Next node to execute ("summarize_conversation_node" or END)
     """
-    messages = state.get("messages", [])
-    
-    if len(messages) >= settings.TOTAL_MESSAGES_SUMMARY_TRIGGER:
+    if settings.CAREER_COACH_BACKGROUND_SUMMARIZATION:
+        return END
+
+    if is_over_summary_trigger(state):
         return "summarize_conversation_node"
     
     return END
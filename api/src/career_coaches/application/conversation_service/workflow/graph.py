@@ -1,6 +1,9 @@
+from collections import OrderedDict
 from functools import lru_cache
 
+from langgraph.checkpoint.base import BaseCheckpointSaver
 from langgraph.graph import END, START, StateGraph
+from langgraph.graph.state import CompiledStateGraph
 
 from .edges import should_summarize_conversation
 from .nodes import (
@@ -36,3 +39,63 @@ def create_career_coach_workflow_graph():
 
 # Compiled without a checkpointer. Used for LangGraph Studio
 graph = create_career_coach_workflow_graph().compile()
+
+# Compiled graphs of the most recently used checkpointers, keyed by checkpointer id.
+# A compiled graph holds its checkpointer, so the cache is bounded: the API's shared
+# checkpointer stays hot while short-lived CLI checkpointers are evicted.
+MAX_COMPILED_GRAPHS = 4
+_compiled_graphs: "OrderedDict[int, tuple[BaseCheckpointSaver, CompiledStateGraph]]" = OrderedDict()
+
+
+def get_compiled_career_coach_workflow_graph(
+    checkpointer: BaseCheckpointSaver,
+) -> CompiledStateGraph:
+    """Get the career coach workflow compiled with the given checkpointer.
+
+    The graph is compiled the first time a checkpointer is seen and reused for every
+    following turn that runs with the same checkpointer.
+
+    Args:
+        checkpointer: The checkpointer the compiled graph persists its state with.
+
+    Returns:
+        CompiledStateGraph: The compiled career coach workflow.
+    """
+    key = id(checkpointer)
+    entry = _compiled_graphs.get(key)
+    if entry is not None and entry[0] is checkpointer:
+        _compiled_graphs.move_to_end(key)
+        return entry[1]
+
+    compiled_graph = create_career_coach_workflow_graph().compile(
+        checkpointer=checkpointer
+    )
+    _compiled_graphs[key] = (checkpointer, compiled_graph)
+    _compiled_graphs.move_to_end(key)
+    while len(_compiled_graphs) > MAX_COMPILED_GRAPHS:
+        _compiled_graphs.popitem(last=False)
+
+    return compiled_graph
+
+
+def evict_compiled_career_coach_workflow_graph(checkpointer: BaseCheckpointSaver) -> None:
+    """Drop the graph compiled with a checkpointer, e.g. before closing it."""
+    entry = _compiled_graphs.get(id(checkpointer))
+    if entry is not None and entry[0] is checkpointer:
+        del _compiled_graphs[id(checkpointer)]
+
+
+@lru_cache(maxsize=1)
+def get_career_coach_graph_definition() -> dict:
+    """Get the Mermaid description of the workflow used by Opik to render traces.
+
+    The graph structure does not depend on the checkpointer, so the xray rendering is
+    done once per process from the Studio graph.
+
+    Returns:
+        dict: The graph definition in the format Opik stores in trace metadata.
+    """
+    return {
+        "format": "mermaid",
+        "data": graph.get_graph(xray=True).draw_mermaid(),
+    }
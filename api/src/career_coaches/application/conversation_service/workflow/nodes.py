@@ -7,7 +7,12 @@ from .chains import (
     get_conversation_summary_chain,
     get_career_coach_response_chain,
 )
-from .state import CareerCoachState
+from .state import CareerCoachState, get_coach_persona
+from .tokens import (
+    get_history_token_budget,
+    split_messages_to_budget,
+    trim_messages_to_budget,
+)
 
 
 async def conversation_node(state: CareerCoachState, config: RunnableConfig):
@@ -17,18 +22,19 @@ async def conversation_node(state: CareerCoachState, config: RunnableConfig):
     use_web_tools = state.get("use_web_tools", False)
     search_tool_name = state.get("search_tool_name", "all")
     
-    # Get the appropriate chain based on whether web tools are enabled
-    if use_web_tools:
-        from .tools import configure_web_tools
-        # Configure the web tools with the specified search tool name
-        web_tools = configure_web_tools(search_tool_name)
-        conversation_chain = get_career_coach_response_chain(coach_id, use_web_tools=True)
-    else:
-        conversation_chain = get_career_coach_response_chain(coach_id, use_web_tools=False)
+    # Get the cached chain for this coach, tool mode and search tool set
+    conversation_chain = get_career_coach_response_chain(
+        coach_id,
+        use_web_tools=use_web_tools,
+        search_tool_name=search_tool_name,
+    )
+
+    # Keep the input within the context token budget, however long the history is
+    messages = trim_messages_to_budget(state["messages"], get_history_token_budget(state))
 
     response = await conversation_chain.ainvoke(
         {
-            "messages": state["messages"],
+            "messages": messages,
             "summary": summary,
         },
         config,
@@ -38,24 +44,37 @@ async def conversation_node(state: CareerCoachState, config: RunnableConfig):
 
 
 async def summarize_conversation_node(state: CareerCoachState):
-    """Node that summarizes the conversation when it gets too long."""
+    """Node that summarizes the conversation when it gets too long.
+
+    Every message older than the retained tail is folded into the summary, in
+    chunks fitting the context budget, and then removed from the history.
+    """
     summary = state.get("summary", "")
-    summary_chain = get_conversation_summary_chain(summary)
+    agent_name = get_coach_persona(state).name  # Using agent_name for compatibility with shared prompts
 
-    response = await summary_chain.ainvoke(
-        {
-            "messages": state["messages"],
-            "agent_name": state["coach_name"],  # Using agent_name for compatibility with shared prompts
-            "summary": summary,
-        }
+    # Keep only the most recent messages within the retained budget
+    kept_messages = trim_messages_to_budget(
+        state["messages"], settings.CAREER_COACH_HISTORY_TOKENS_AFTER_SUMMARY
     )
+    old_messages = state["messages"][: len(state["messages"]) - len(kept_messages)]
+    if not old_messages:
+        return {}
+
+    for chunk in split_messages_to_budget(
+        old_messages, get_history_token_budget({**state, "summary": summary})
+    ):
+        summary_chain = get_conversation_summary_chain(summary)
+        response = await summary_chain.ainvoke(
+            {
+                "messages": chunk,
+                "agent_name": agent_name,
+                "summary": summary,
+            }
+        )
+        summary = response.content
 
-    # Remove old messages, keeping only the most recent ones
-    delete_messages = [
-        RemoveMessage(id=m.id)
-        for m in state["messages"][: -settings.TOTAL_MESSAGES_AFTER_SUMMARY]
-    ]
-    return {"summary": response.content, "messages": delete_messages}
+    delete_messages = [RemoveMessage(id=m.id) for m in old_messages]
+    return {"summary": summary, "messages": delete_messages}
 
 
 async def connector_node(state: CareerCoachState):
@@ -1,5 +1,8 @@
 from langgraph.graph import MessagesState
 
+from career_coaches.domain.coach import Coach
+from career_coaches.domain.coach_factory import CoachFactory
+
 
 class CareerCoachState(MessagesState):
     """State class for the Career Coach LangGraph workflow.
@@ -9,11 +12,9 @@ class CareerCoachState(MessagesState):
 
     Attributes:
         user_id (str): Unique identifier for the user (for multi-user support).
-        coach_id (str): Unique identifier for the career coach type.
-        coach_name (str): The name of the career coach.
-        coach_specialty (str): The specialty area of the career coach.
-        coach_approach (str): The coaching approach and methodology.
-        coach_focus_areas (str): The key focus areas of the coach.
+        coach_id (str): Unique identifier for the career coach type. The coach persona
+            (name, specialty, approach, focus areas) is hydrated from `CoachFactory`
+            with `get_coach_persona` instead of being stored in every checkpoint.
         summary (str): A summary of the conversation. This is used to reduce token usage.
         session_goals (list): Goals set for the current coaching session.
         user_context (str): Additional context about the user's career situation.
@@ -23,10 +24,6 @@ class CareerCoachState(MessagesState):
 
     user_id: str
     coach_id: str
-    coach_name: str
-    coach_specialty: str
-    coach_approach: str
-    coach_focus_areas: str
     summary: str
     session_goals: list
     user_context: str
@@ -34,6 +31,15 @@ class CareerCoachState(MessagesState):
     search_tool_name: str = "all"
 
 
+# Persona fields stored in checkpoints written before the state only kept the coach ID.
+LEGACY_PERSONA_CHANNELS = ("coach_name", "coach_specialty", "coach_approach", "coach_focus_areas")
+
+
+def get_coach_persona(state: CareerCoachState) -> Coach:
+    """Hydrate the coach persona for the coach referenced by the state."""
+    return CoachFactory.get_coach(state.get("coach_id", "career_assessment"))
+
+
 def state_to_str(state: CareerCoachState) -> str:
     """Convert CareerCoachState to string representation for logging/debugging."""
     if "summary" in state and bool(state["summary"]):
@@ -43,14 +49,16 @@ def state_to_str(state: CareerCoachState) -> str:
     else:
         conversation = ""
 
+    coach = get_coach_persona(state)
+
     return f"""
 CareerCoachState(
     user_id={state["user_id"]},
     coach_id={state["coach_id"]},
-    coach_name={state["coach_name"]},
-    coach_specialty={state["coach_specialty"]},
-    coach_approach={state["coach_approach"]},
-    coach_focus_areas={state["coach_focus_areas"]},
+    coach_name={coach.name},
+    coach_specialty={coach.specialty},
+    coach_approach={coach.approach},
+    coach_focus_areas={coach.focus_areas},
     session_goals={state.get("session_goals", [])},
     use_web_tools={state.get("use_web_tools", False)},
     search_tool_name={state.get("search_tool_name", "all")},
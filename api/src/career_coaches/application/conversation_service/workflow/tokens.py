@@ -0,0 +1,177 @@
+from collections import OrderedDict
+from functools import lru_cache
+
+import tiktoken
+from langchain_core.messages import BaseMessage
+from loguru import logger
+
+from career_coaches.config import settings
+from .chains import WEB_TOOLS_INSTRUCTION, get_prompt_by_coach_id
+from .state import CareerCoachState
+
+# Approximate per-message overhead added by chat formatting (role, separators).
+MESSAGE_OVERHEAD_TOKENS = 4
+# Characters per token assumed when the tokenizer cannot be loaded.
+FALLBACK_CHARS_PER_TOKEN = 4
+
+_message_token_counts: OrderedDict[str, int] = OrderedDict()
+
+
+@lru_cache(maxsize=1)
+def get_token_encoding() -> tiktoken.Encoding | None:
+    """Load the tokenizer used to count tokens, once per process.
+
+    tiktoken downloads the encoding on first use, so the API loads it at startup.
+    If it cannot be loaded, e.g. without network access, token counts fall back
+    to a character-based estimate instead of failing conversations.
+
+    Returns:
+        tiktoken.Encoding | None: The encoding, or None if it could not be loaded.
+    """
+    try:
+        return tiktoken.get_encoding("cl100k_base")
+    except Exception as e:
+        logger.warning(f"Could not load the tiktoken encoding, estimating token counts from characters: {e}")
+        return None
+
+
+def count_text_tokens(text: str) -> int:
+    """Count the tokens of a piece of text."""
+    if not text:
+        return 0
+
+    encoding = get_token_encoding()
+    if encoding is None:
+        return -(-len(text) // FALLBACK_CHARS_PER_TOKEN)
+
+    return len(encoding.encode(text, disallowed_special=()))
+
+
+def count_message_tokens(message: BaseMessage) -> int:
+    """Count the tokens of a message, caching the result by message id.
+
+    Messages are immutable once they are in the conversation state, so a message is
+    only tokenized the first time it is seen. The cache is an LRU bounded by
+    ``CAREER_COACH_TOKEN_COUNT_CACHE_SIZE``.
+
+    Args:
+        message: The message to count.
+
+    Returns:
+        int: The number of tokens of the message, including formatting overhead.
+    """
+    if message.id is not None and message.id in _message_token_counts:
+        _message_token_counts.move_to_end(message.id)
+        return _message_token_counts[message.id]
+
+    content = message.content if isinstance(message.content, str) else str(message.content)
+    tokens = count_text_tokens(content) + MESSAGE_OVERHEAD_TOKENS
+
+    if message.id is not None:
+        _message_token_counts[message.id] = tokens
+        if len(_message_token_counts) > settings.CAREER_COACH_TOKEN_COUNT_CACHE_SIZE:
+            _message_token_counts.popitem(last=False)
+
+    return tokens
+
+
+def count_messages_tokens(messages: list[BaseMessage]) -> int:
+    """Count the tokens of a list of messages."""
+    return sum(count_message_tokens(message) for message in messages)
+
+
+@lru_cache(maxsize=32)
+def count_system_prompt_tokens(coach_id: str, use_web_tools: bool = False) -> int:
+    """Count the tokens of a coach's system prompt."""
+    prompt = get_prompt_by_coach_id(coach_id).prompt
+    if use_web_tools:
+        prompt += WEB_TOOLS_INSTRUCTION
+
+    return count_text_tokens(prompt)
+
+
+@lru_cache(maxsize=256)
+def _count_summary_tokens(summary: str) -> int:
+    return count_text_tokens(summary)
+
+
+def _count_state_system_prompt_tokens(state: CareerCoachState) -> int:
+    return count_system_prompt_tokens(
+        state.get("coach_id", "career_assessment").lower(),
+        state.get("use_web_tools", False),
+    )
+
+
+def count_context_tokens(state: CareerCoachState) -> int:
+    """Count the input tokens of a conversation call for the given state.
+
+    Accounts for the coach system prompt, the conversation summary and the history.
+    """
+    return (
+        _count_state_system_prompt_tokens(state)
+        + _count_summary_tokens(state.get("summary", ""))
+        + count_messages_tokens(state.get("messages", []))
+    )
+
+
+def get_history_token_budget(state: CareerCoachState) -> int:
+    """Get how many tokens of history fit in the context budget for the given state."""
+    return max(
+        0,
+        settings.CAREER_COACH_CONTEXT_TOKEN_BUDGET
+        - _count_state_system_prompt_tokens(state)
+        - _count_summary_tokens(state.get("summary", "")),
+    )
+
+
+def trim_messages_to_budget(
+    messages: list[BaseMessage], max_tokens: int
+) -> list[BaseMessage]:
+    """Keep the most recent messages whose tokens fit within ``max_tokens``.
+
+    The latest message is always kept, even if it alone exceeds the budget.
+
+    Args:
+        messages: The conversation history, oldest first.
+        max_tokens: The token budget for the returned messages.
+
+    Returns:
+        list[BaseMessage]: The most recent messages fitting the budget, oldest first.
+    """
+    kept_tokens = 0
+    start = len(messages)
+    for index in range(len(messages) - 1, -1, -1):
+        tokens = count_message_tokens(messages[index])
+        if kept_tokens + tokens > max_tokens and start < len(messages):
+            break
+        kept_tokens += tokens
+        start = index
+
+    return messages[start:]
+
+
+def split_messages_to_budget(
+    messages: list[BaseMessage], max_tokens: int
+) -> list[list[BaseMessage]]:
+    """Split messages into consecutive chunks whose tokens fit within ``max_tokens``.
+
+    A message exceeding the budget on its own gets a chunk of its own.
+
+    Args:
+        messages: The messages to split, oldest first.
+        max_tokens: The token budget of each chunk.
+
+    Returns:
+        list[list[BaseMessage]]: The chunks, oldest first, covering every message.
+    """
+    chunks: list[list[BaseMessage]] = []
+    chunk_tokens = 0
+    for message in messages:
+        tokens = count_message_tokens(message)
+        if not chunks or chunk_tokens + tokens > max_tokens:
+            chunks.append([])
+            chunk_tokens = 0
+        chunks[-1].append(message)
+        chunk_tokens += tokens
+
+    return chunks
@@ -44,10 +44,6 @@ async def career_coach_evaluation_task(x: dict) -> dict:
         messages=input_messages,
         user_id=user_id,
         coach_id=coach.id,
-        coach_name=coach.name,
-        coach_specialty=coach.specialty,
-        coach_approach=coach.approach,
-        coach_focus_areas=coach.focus_areas,
         user_context="",
         new_thread=True,
     )
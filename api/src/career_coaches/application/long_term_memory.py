@@ -1,10 +1,93 @@
+import hashlib
+import json
+from datetime import datetime, timezone
+from typing import Literal
+
 from langchain_core.documents import Document
 from loguru import logger
+from pydantic import BaseModel, Field
+from pymongo.database import Database
 
 from career_coaches.config import settings
-from common.application.rag.retrievers import Retriever, get_retriever
+from common.application.rag.embedding_cache import CachedEmbeddings
+from common.application.rag.retrievers import Retriever, get_hybrid_search_retriever, get_retriever
 from common.application.rag.splitters import Splitter, get_splitter
-from common.infrastructure.mongo import MongoClientWrapper, MongoIndex
+from common.infrastructure.mongo import (
+    MongoClientWrapper,
+    MongoIndex,
+    get_mongo_client,
+    resolve_collection_alias,
+    swap_collection_alias,
+)
+
+
+SyncMode = Literal["incremental", "blue_green"]
+
+SOURCE_ID_KEY = "source_id"
+SOURCE_HASH_KEY = "source_hash"
+# Blue/green collections are named "<alias>__<timestamp>".
+GENERATION_SEPARATOR = "__"
+
+
+class MemorySyncReport(BaseModel):
+    """Outcome of a long-term memory sync.
+
+    Attributes:
+        collection (str): The collection the memory was written to.
+        added (int): Source documents not in memory before.
+        changed (int): Source documents whose content or metadata changed.
+        removed (int): Source documents deleted from memory.
+        unchanged (int): Source documents left as they were.
+        chunks_written (int): Chunks embedded and upserted.
+        chunks_deleted (int): Stale chunks deleted.
+        indexes_created (list[str]): Search indexes that had to be created.
+    """
+
+    collection: str
+    added: int = 0
+    changed: int = 0
+    removed: int = 0
+    unchanged: int = 0
+    chunks_written: int = 0
+    chunks_deleted: int = 0
+    indexes_created: list[str] = Field(default_factory=list)
+
+
+def _source_id(document: Document) -> str:
+    """Get the stable identity of a source document."""
+    source = document.metadata.get("source")
+    if source:
+        return str(source)
+
+    return hashlib.sha256(document.page_content.encode("utf-8")).hexdigest()
+
+
+def _source_hash(document: Document) -> str:
+    """Get the fingerprint of a source document's content and metadata."""
+    payload = json.dumps(
+        {"page_content": document.page_content, "metadata": document.metadata},
+        sort_keys=True,
+        default=str,
+    )
+
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+def _index_sources(documents: list[Document]) -> dict[str, tuple[str, Document]]:
+    """Map each source ID to the hash and document of its source."""
+    sources = {}
+    for document in documents:
+        source_id = _source_id(document)
+        if source_id in sources:
+            raise ValueError(f"Several documents have the source {source_id!r}")
+        sources[source_id] = (_source_hash(document), document)
+
+    return sources
+
+
+def _chunk_id(source_id: str, chunk_index: int) -> str:
+    """Get the deterministic ID of a chunk, as ObjectId hex so the vector store keeps it an ObjectId."""
+    return hashlib.sha256(f"{source_id}\0{chunk_index}".encode("utf-8")).hexdigest()[:24]
 
 
 class CareerCoachLongTermMemoryCreator:
@@ -24,55 +107,198 @@ class CareerCoachLongTermMemoryCreator:
             collection_name=settings.MONGO_CAREER_LONG_TERM_MEMORY_COLLECTION,
             k=settings.RAG_TOP_K,
             device=settings.RAG_DEVICE,
+            embedding_cache_dir=settings.RAG_EMBEDDING_CACHE_DIR,
+            embedding_cache_dtype=settings.RAG_EMBEDDING_CACHE_DTYPE,
         )
         splitter = get_splitter(chunk_size=settings.RAG_CHUNK_SIZE)
 
         return cls(retriever, splitter)
 
-    def create_memory_from_documents(self, documents: list[Document]) -> None:
-        """Create long-term memory from a list of documents.
-        
+    def create_memory_from_documents(
+        self,
+        documents: list[Document],
+        mode: SyncMode | None = None,
+    ) -> MemorySyncReport | None:
+        """Create or update long-term memory from a list of documents.
+
+        Source documents are identified by their `source` metadata, or by their
+        content if they have none, and fingerprinted by a hash of their content and
+        metadata. Memory then holds exactly these documents, in one of two modes:
+
+        - "incremental": only the chunks of added and changed documents are
+          upserted and the chunks of removed documents deleted, in the live
+          collection. Retrieval keeps serving the other documents meanwhile.
+        - "blue_green": every document is ingested into a new shadow collection,
+          whose search indexes are built before the collection alias is swapped to
+          it. The previous collection is kept for readers that resolved the alias
+          before the swap; older ones are dropped.
+
+        Search indexes are only created when missing.
+
         Args:
             documents: List of documents to process and store
+            mode: The sync mode. Defaults to `CAREER_LONG_TERM_MEMORY_SYNC_MODE`.
+
+        Returns:
+            MemorySyncReport | None: What changed, or None if there were no documents.
+
+        Raises:
+            ValueError: If two documents share the same source.
         """
         if len(documents) == 0:
             logger.warning("No documents to process for career coach memory. Exiting.")
-            return
+            return None
+
+        sources = _index_sources(documents)
+        mode = mode or settings.CAREER_LONG_TERM_MEMORY_SYNC_MODE
+        alias = settings.MONGO_CAREER_LONG_TERM_MEMORY_COLLECTION
 
-        # First clear the long term memory collection to avoid duplicates.
         with MongoClientWrapper(
-            model=Document, 
-            collection_name=settings.MONGO_CAREER_LONG_TERM_MEMORY_COLLECTION,
+            model=Document,
+            collection_name=alias,
             database_name=settings.MONGO_DB_NAME,
             mongodb_uri=settings.MONGO_URI,
             app_name="career_coaches",
         ) as client:
-            client.clear_collection()
+            live_collection = resolve_collection_alias(client.database, alias)
+            if mode == "blue_green":
+                report = self.__rebuild_and_swap(client.database, alias, live_collection, sources)
+            else:
+                report = self.__sync(live_collection, sources)
 
-        # Process documents
-        chunked_docs = self.splitter.split_documents(documents)
-        
-        # Add documents to vector store
-        self.retriever.vectorstore.add_documents(chunked_docs)
-        
-        # Create search index
-        self.__create_index()
+        logger.info(
+            f"Synced career coach memory | mode: {mode} | collection: {report.collection} | "
+            f"added: {report.added} | changed: {report.changed} | removed: {report.removed} | "
+            f"unchanged: {report.unchanged} | chunks written: {report.chunks_written} | "
+            f"chunks deleted: {report.chunks_deleted}"
+        )
+        embeddings = self.retriever.vectorstore.embeddings
+        if isinstance(embeddings, CachedEmbeddings):
+            logger.info(f"Embedding cache | cached: {embeddings.hits} | computed: {embeddings.misses}")
+
+        return report
+
+    def __sync(self, collection_name: str, sources: dict[str, tuple[str, Document]]) -> MemorySyncReport:
+        """Upsert the chunks of added and changed sources and delete the stale ones."""
+        retriever = self.__get_collection_retriever(collection_name)
+        collection = retriever.vectorstore.collection
+
+        stored = {
+            group["_id"]: set(group["hashes"])
+            for group in collection.aggregate(
+                [{"$group": {"_id": f"${SOURCE_ID_KEY}", "hashes": {"$addToSet": f"${SOURCE_HASH_KEY}"}}}]
+            )
+        }
+        report = MemorySyncReport(collection=collection_name)
+        stale_filters = []
+        pending = []
+        for source_id, (source_hash, document) in sources.items():
+            stored_hashes = stored.get(source_id)
+            if stored_hashes == {source_hash}:
+                report.unchanged += 1
+                continue
+
+            if stored_hashes is None:
+                report.added += 1
+            else:
+                report.changed += 1
+                stale_filters.append({SOURCE_ID_KEY: source_id, SOURCE_HASH_KEY: {"$ne": source_hash}})
+            pending.append((source_id, source_hash, document))
+
+        # Upserts replace the chunks of changed sources in place, then the leftover
+        # chunks of their previous version and of removed sources are deleted.
+        report.chunks_written = self.__add_sources(retriever, pending)
+        report.removed = len(set(stored) - set(sources) - {None})
+        stale_filters.append({SOURCE_ID_KEY: {"$nin": list(sources)}})
+        report.chunks_deleted = collection.delete_many({"$or": stale_filters}).deleted_count
+        report.indexes_created = self.__create_index(retriever)
+
+        return report
+
+    def __rebuild_and_swap(
+        self,
+        database: Database,
+        alias: str,
+        live_collection: str,
+        sources: dict[str, tuple[str, Document]],
+    ) -> MemorySyncReport:
+        """Build the memory into a shadow collection and swap the alias to it."""
+        shadow_collection = f"{alias}{GENERATION_SEPARATOR}{datetime.now(timezone.utc):%Y%m%d%H%M%S%f}"
+        retriever = self.__get_collection_retriever(shadow_collection)
+
+        report = MemorySyncReport(collection=shadow_collection, added=len(sources))
+        report.chunks_written = self.__add_sources(
+            retriever,
+            [(source_id, source_hash, document) for source_id, (source_hash, document) in sources.items()],
+        )
+
+        # Secondary indexes created on the live collection follow it to the new one.
+        if live_collection in database.list_collection_names():
+            for index in database[live_collection].list_indexes():
+                if index["name"] != "_id_":
+                    database[shadow_collection].create_index(list(index["key"].items()), name=index["name"])
 
-    def __create_index(self) -> None:
-        """Create the search index for the memory collection."""
+        report.indexes_created = self.__create_index(
+            retriever, wait_until_complete=settings.CAREER_LONG_TERM_MEMORY_INDEX_TIMEOUT_S
+        )
+        previous_collection = swap_collection_alias(database, alias, shadow_collection)
+        logger.info(f"Swapped {alias} from {previous_collection} to {shadow_collection}")
+
+        for name in database.list_collection_names():
+            is_generation = name == alias or name.startswith(f"{alias}{GENERATION_SEPARATOR}")
+            if is_generation and name not in (shadow_collection, previous_collection):
+                database.drop_collection(name)
+                logger.info(f"Dropped old career coach memory collection {name}")
+
+        return report
+
+    def __add_sources(self, retriever: Retriever, sources: list[tuple[str, str, Document]]) -> int:
+        """Split the sources and upsert their chunks under deterministic IDs."""
+        chunks = []
+        ids = []
+        for source_id, source_hash, document in sources:
+            for chunk_index, chunk in enumerate(self.splitter.split_documents([document])):
+                chunk.metadata.update(
+                    {SOURCE_ID_KEY: source_id, SOURCE_HASH_KEY: source_hash, "chunk_index": chunk_index}
+                )
+                chunks.append(chunk)
+                ids.append(_chunk_id(source_id, chunk_index))
+
+        if chunks:
+            retriever.vectorstore.add_documents(chunks, ids=ids)
+
+        return len(chunks)
+
+    def __get_collection_retriever(self, collection_name: str) -> Retriever:
+        """Get a retriever sharing this creator's embedding model, on the given collection."""
+        if self.retriever.vectorstore.collection.name == collection_name:
+            return self.retriever
+
+        return get_hybrid_search_retriever(
+            self.retriever.vectorstore.embeddings,
+            self.retriever.top_k,
+            settings.MONGO_URI,
+            settings.MONGO_DB_NAME,
+            collection_name,
+        )
+
+    def __create_index(self, retriever: Retriever, wait_until_complete: float | None = None) -> list[str]:
+        """Create the missing search indexes of a memory collection."""
         with MongoClientWrapper(
-            model=Document, 
-            collection_name=settings.MONGO_CAREER_LONG_TERM_MEMORY_COLLECTION,
+            model=Document,
+            collection_name=retriever.vectorstore.collection.name,
             database_name=settings.MONGO_DB_NAME,
             mongodb_uri=settings.MONGO_URI,
             app_name="career_coaches",
         ) as client:
-            self.index = MongoIndex(
-                retriever=self.retriever,
+            index = MongoIndex(
+                retriever=retriever,
                 mongodb_client=client,
             )
-            self.index.create(
-                is_hybrid=True, embedding_dim=settings.RAG_TEXT_EMBEDDING_MODEL_DIM
+            return index.create(
+                is_hybrid=True,
+                embedding_dim=settings.RAG_TEXT_EMBEDDING_MODEL_DIM,
+                wait_until_complete=wait_until_complete,
             )
 
 
@@ -84,14 +310,23 @@ class CareerCoachLongTermMemoryRetriever:
 
     @classmethod
     def build_from_settings(cls) -> "CareerCoachLongTermMemoryRetriever":
-        """Build the memory retriever from configuration settings."""
+        """Build the memory retriever from configuration settings.
+
+        The collection alias is resolved once, so a retriever keeps reading the
+        collection that was live when it was built.
+        """
+        database = get_mongo_client(settings.MONGO_URI, app_name="career_coaches")[settings.MONGO_DB_NAME]
         retriever = get_retriever(
             embedding_model_id=settings.RAG_TEXT_EMBEDDING_MODEL_ID,
             mongo_uri=settings.MONGO_URI,
             db_name=settings.MONGO_DB_NAME,
-            collection_name=settings.MONGO_CAREER_LONG_TERM_MEMORY_COLLECTION,
+            collection_name=resolve_collection_alias(
+                database, settings.MONGO_CAREER_LONG_TERM_MEMORY_COLLECTION
+            ),
             k=settings.RAG_TOP_K,
             device=settings.RAG_DEVICE,
+            embedding_batch_window_ms=settings.RAG_EMBEDDING_BATCH_WINDOW_MS,
+            embedding_max_batch_size=settings.RAG_EMBEDDING_MAX_BATCH_SIZE,
         )
 
         return cls(retriever)
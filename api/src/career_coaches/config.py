@@ -1,4 +1,6 @@
 from pathlib import Path
+from typing import Literal
+
 from pydantic import Field
 
 from common.config.base_settings import BaseAgentSettings
@@ -11,12 +13,126 @@ class CareerCoachSettings(BaseAgentSettings):
     MONGO_CAREER_STATE_CHECKPOINT_COLLECTION: str = "career_coach_state_checkpoints"
     MONGO_CAREER_STATE_WRITES_COLLECTION: str = "career_coach_state_writes"
     MONGO_CAREER_LONG_TERM_MEMORY_COLLECTION: str = "career_coach_long_term_memory"
+    MONGO_CAREER_CONVERSATION_INDEX_COLLECTION: str = "career_coach_conversation_index"
+
+    # --- Checkpointer Connection Pool ---
+    MONGO_CHECKPOINTER_MAX_POOL_SIZE: int = Field(
+        default=50,
+        description="Maximum number of connections the shared checkpointer keeps open.",
+    )
+    MONGO_CHECKPOINTER_MIN_POOL_SIZE: int = Field(
+        default=5,
+        description="Connections kept warm by the shared checkpointer between turns.",
+    )
+    MONGO_CHECKPOINTER_MAX_IDLE_TIME_MS: int = Field(
+        default=300_000,
+        description="How long an idle checkpointer connection is kept before being closed.",
+    )
+    MONGO_CHECKPOINTER_SERVER_SELECTION_TIMEOUT_MS: int = Field(
+        default=10_000,
+        description="How long to wait for a suitable server before failing a checkpoint operation.",
+    )
+
+    # --- Checkpoint Serialization ---
+    CAREER_COACH_CHECKPOINT_COMPRESSION: bool = Field(
+        default=True,
+        description="Compress large checkpoint payloads with zstd. Uncompressed checkpoints stay readable either way.",
+    )
+    CAREER_COACH_CHECKPOINT_COMPRESSION_THRESHOLD_BYTES: int = Field(
+        default=1024,
+        description="Encoded size from which a checkpoint payload is compressed.",
+    )
+    CAREER_COACH_CHECKPOINT_COMPRESSION_LEVEL: int = Field(
+        default=3,
+        description="zstd compression level used for checkpoint payloads.",
+    )
+
+    # --- Checkpoint Cache ---
+    CAREER_COACH_CHECKPOINT_CACHE_SIZE: int = Field(
+        default=1000,
+        description="Conversation threads whose latest checkpoint the API keeps in memory. 0 disables the cache.",
+    )
+
+    # --- Checkpoint Retention ---
+    CAREER_COACH_CHECKPOINT_KEEP_LAST: int = Field(
+        default=10,
+        description="Most recent checkpoints kept per conversation thread by the compaction job.",
+    )
+    CAREER_COACH_CHECKPOINT_THREAD_TTL_DAYS: int | None = Field(
+        default=None,
+        description="Days without activity after which the compaction job deletes a thread. Disabled if unset.",
+    )
+
+    # --- User Data Purge ---
+    CAREER_COACH_PURGE_BATCH_SIZE: int = Field(
+        default=500,
+        description="Documents deleted per batch when purging the data of a user.",
+    )
+    CAREER_COACH_PURGE_BATCH_PAUSE_MS: int = Field(
+        default=50,
+        description="Pause between two purge batches, leaving MongoDB room for live traffic.",
+    )
+
+    # --- Long-term Memory Sync ---
+    CAREER_LONG_TERM_MEMORY_SYNC_MODE: Literal["incremental", "blue_green"] = Field(
+        default="incremental",
+        description="How long-term memory is updated: in place, or rebuilt in a shadow collection and swapped in.",
+    )
+    CAREER_LONG_TERM_MEMORY_INDEX_TIMEOUT_S: float = Field(
+        default=300.0,
+        description="How long a blue/green sync waits for the shadow collection's search indexes before failing.",
+    )
 
     # --- Career Coach Specific Configuration ---
     CAREER_COACH_PROJECT: str = Field(
         default="career_coaches",
         description="Project name for career coach tracking.",
     )
+    CAREER_COACH_CHAIN_CACHE_SIZE: int = Field(
+        default=64,
+        description="Maximum number of ready-to-run LLM chains kept per event loop.",
+    )
+
+    CAREER_COACH_BACKGROUND_SUMMARIZATION: bool = Field(
+        default=False,
+        description="Summarize long conversations in a background task after the reply is delivered.",
+    )
+
+    # --- Conversation Token Budget ---
+    CAREER_COACH_CONTEXT_TOKEN_BUDGET: int = Field(
+        default=8000,
+        description="Maximum input tokens of a conversation call: system prompt, summary and history.",
+    )
+    CAREER_COACH_SUMMARY_TRIGGER_TOKENS: int = Field(
+        default=6000,
+        description="Context tokens at which the conversation is summarized.",
+    )
+    CAREER_COACH_HISTORY_TOKENS_AFTER_SUMMARY: int = Field(
+        default=1500,
+        description="Tokens of the most recent history kept verbatim after summarizing.",
+    )
+    CAREER_COACH_TOKEN_COUNT_CACHE_SIZE: int = Field(
+        default=10_000,
+        description="Maximum number of per-message token counts kept in memory.",
+    )
+
+    # --- WebSocket Streaming ---
+    CAREER_COACH_WS_STREAM_MODE: Literal["coalesced", "chunk"] = Field(
+        default="coalesced",
+        description="Default /ws/chat streaming mode: coalesced frames or one frame per chunk.",
+    )
+    CAREER_COACH_WS_FLUSH_INTERVAL_MS: int = Field(
+        default=50,
+        description="Maximum time a chunk waits in the buffer before its frame is sent.",
+    )
+    CAREER_COACH_WS_FLUSH_MAX_CHARS: int = Field(
+        default=512,
+        description="Buffered characters that trigger sending a frame immediately.",
+    )
+    CAREER_COACH_WS_SEND_QUEUE_SIZE: int = Field(
+        default=8,
+        description="Maximum number of frames waiting to be sent to a websocket client.",
+    )
 
     # --- Evaluation Dataset Path ---
     CAREER_EVALUATION_DATASET_FILE_PATH: Path = Path("data/career_evaluation_dataset.json")
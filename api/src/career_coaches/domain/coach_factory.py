@@ -96,7 +96,6 @@ COACH_FOCUS_AREAS = {
 
 AVAILABLE_COACHES = list(COACH_NAMES.keys())
 
-
 class CoachFactory:
     @staticmethod
     def get_coach(id: str) -> Coach:
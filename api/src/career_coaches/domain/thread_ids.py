@@ -0,0 +1,37 @@
+import re
+from functools import lru_cache
+
+from .coach_factory import CoachFactory
+
+
+@lru_cache(maxsize=1)
+def _thread_id_pattern() -> re.Pattern:
+    coach_ids = "|".join(re.escape(coach_id) for coach_id in CoachFactory.get_available_coaches())
+
+    return re.compile(f"^(.+)_({coach_ids})(?:_[0-9a-f-]{{36}})?$")
+
+
+def parse_thread_id(thread_id: str) -> tuple[str, str] | None:
+    """Split a thread ID into its user ID and coach ID.
+
+    Thread IDs are "{user_id}_{coach_id}", optionally followed by "_{uuid}" for new
+    threads. Both IDs may contain underscores, so the coach ID is matched against
+    the known coaches rather than by position.
+
+    Returns:
+        tuple[str, str] | None: The user ID and coach ID, or None if the thread ID
+            does not belong to a known coach.
+    """
+    match = _thread_id_pattern().match(thread_id)
+
+    return match.groups() if match else None
+
+
+def user_thread_id_range(user_id: str) -> dict:
+    """Get the thread ID range holding every thread of a user.
+
+    Thread IDs start with "{user_id}_" and "`" is the character following "_", so
+    the range holds exactly the IDs with that prefix. Unlike a regex it needs no
+    escaping, and it is served by the thread_id indexes as a bounded scan.
+    """
+    return {"$gte": f"{user_id}_", "$lt": f"{user_id}`"}
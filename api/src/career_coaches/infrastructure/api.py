@@ -1,7 +1,9 @@
+import asyncio
 from contextlib import asynccontextmanager
 
 from fastapi import FastAPI, HTTPException, WebSocket, WebSocketDisconnect
 from fastapi.middleware.cors import CORSMiddleware
+from loguru import logger
 from opik.integrations.langchain import OpikTracer
 from pydantic import BaseModel
 
@@ -11,11 +13,37 @@ from career_coaches.application.conversation_service.generate_response import (
     get_response,
     get_streaming_response,
 )
+from career_coaches.application.conversation_service.background_summary import (
+    drain_background_summaries,
+)
+from career_coaches.application.conversation_service.purge_user_data import (
+    cancel_user_purges,
+    get_purge_job,
+    start_user_purge,
+)
 from career_coaches.application.conversation_service.reset_conversation import (
     reset_conversation_state,
 )
+from career_coaches.application.conversation_service.workflow.chains import (
+    aclose_llm_http_clients,
+)
+from career_coaches.application.conversation_service.workflow.graph import (
+    evict_compiled_career_coach_workflow_graph,
+)
+from career_coaches.application.conversation_service.workflow.tokens import (
+    get_token_encoding,
+)
 from career_coaches.config import settings
 from career_coaches.domain.coach_factory import CoachFactory
+from career_coaches.infrastructure.checkpointer import (
+    close_checkpointer,
+    open_checkpointer,
+)
+from career_coaches.infrastructure.indexes import ensure_career_coach_indexes
+from career_coaches.infrastructure.streaming import stream_coalesced, stream_per_chunk
+from common.application.rag.embeddings import warm_up_embedding_models
+from common.infrastructure.mongo.async_client import close_async_mongo_clients
+from common.infrastructure.mongo.client import close_mongo_clients
 from common.infrastructure.opik_utils import configure
 
 configure(settings.COMET_API_KEY, settings.CAREER_COACH_PROJECT)
@@ -24,11 +52,25 @@ configure(settings.COMET_API_KEY, settings.CAREER_COACH_PROJECT)
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Handles startup and shutdown events for the Career Coach API."""
-    # Startup code (if any) goes here
-    yield
-    # Shutdown code goes here
-    opik_tracer = OpikTracer()
-    opik_tracer.flush()
+    checkpointer = await open_checkpointer()
+    await ensure_career_coach_indexes(checkpointer.db)
+    await asyncio.to_thread(get_token_encoding)
+    if settings.RAG_WARM_UP_EMBEDDING_MODEL:
+        await asyncio.to_thread(
+            warm_up_embedding_models, [(settings.RAG_TEXT_EMBEDDING_MODEL_ID, settings.RAG_DEVICE)]
+        )
+    try:
+        yield
+    finally:
+        await drain_background_summaries()
+        await cancel_user_purges()
+        evict_compiled_career_coach_workflow_graph(checkpointer)
+        await close_checkpointer()
+        close_mongo_clients()
+        close_async_mongo_clients()
+        await aclose_llm_http_clients()
+        opik_tracer = OpikTracer()
+        opik_tracer.flush()
 
 
 app = FastAPI(
@@ -69,16 +111,12 @@ async def chat(chat_message: ChatMessage):
     """Chat endpoint for career coaching conversations."""
     try:
         coach_factory = CoachFactory()
-        coach = coach_factory.get_coach(chat_message.coach_id)
+        coach_factory.get_coach(chat_message.coach_id)  # Rejects unknown coaches
 
         response, _ = await get_response(
             messages=chat_message.message,
             user_id=chat_message.user_id,
             coach_id=chat_message.coach_id,
-            coach_name=coach.name,
-            coach_specialty=coach.specialty,
-            coach_approach=coach.approach,
-            coach_focus_areas=coach.focus_areas,
             user_context=chat_message.user_context,
             session_goals=chat_message.session_goals,
             use_web_tools=chat_message.web_tools,
@@ -112,17 +150,13 @@ async def websocket_chat(websocket: WebSocket):
 
             try:
                 coach_factory = CoachFactory()
-                coach = coach_factory.get_coach(data["coach_id"])
+                coach_factory.get_coach(data["coach_id"])  # Rejects unknown coaches
 
                 # Use streaming response
                 response_stream = get_streaming_response(
                     messages=data["message"],
                     user_id=data["user_id"],
                     coach_id=data["coach_id"],
-                    coach_name=coach.name,
-                    coach_specialty=coach.specialty,
-                    coach_approach=coach.approach,
-                    coach_focus_areas=coach.focus_areas,
                     user_context=data.get("user_context", ""),
                     session_goals=data.get("session_goals", []),
                     use_web_tools=data.get("web_tools", False),
@@ -132,16 +166,25 @@ async def websocket_chat(websocket: WebSocket):
                 # Send initial message to indicate streaming has started
                 await websocket.send_json({"streaming": True})
 
-                # Stream each chunk of the response
-                full_response = ""
-                async for chunk in response_stream:
-                    full_response += chunk
-                    await websocket.send_json({"chunk": chunk})
+                stream_mode = data.get("stream_mode", settings.CAREER_COACH_WS_STREAM_MODE)
+                if stream_mode == "chunk":
+                    result = await stream_per_chunk(websocket, response_stream)
+                else:
+                    result = await stream_coalesced(
+                        websocket,
+                        response_stream,
+                        flush_interval_ms=settings.CAREER_COACH_WS_FLUSH_INTERVAL_MS,
+                        flush_max_chars=settings.CAREER_COACH_WS_FLUSH_MAX_CHARS,
+                        send_queue_size=settings.CAREER_COACH_WS_SEND_QUEUE_SIZE,
+                    )
+                logger.debug(f"Streamed career coach response | mode: {stream_mode} | {result.stats}")
 
                 await websocket.send_json(
-                    {"response": full_response, "streaming": False}
+                    {"response": result.response, "streaming": False}
                 )
 
+            except WebSocketDisconnect:
+                raise
             except Exception as e:
                 opik_tracer = OpikTracer()
                 opik_tracer.flush()
@@ -156,20 +199,44 @@ async def websocket_chat(websocket: WebSocket):
 async def reset_memory(request: ResetMemoryRequest):
     """Resets the conversation state for career coaches.
     
-    Can reset for all users or a specific user.
+    Can reset for all users or a specific user. The data of a specific user is
+    purged by a background job; poll `GET /reset-memory/{job_id}` for its progress.
 
     Raises:
         HTTPException: If there is an error resetting the conversation state.
     Returns:
-        dict: A dictionary containing the result of the reset operation.
+        dict: A dictionary containing the result of the reset operation, or the
+            started purge job when resetting a specific user.
     """
     try:
-        result = await reset_conversation_state(user_id=request.user_id)
+        if request.user_id:
+            job = start_user_purge(request.user_id)
+            return {
+                "message": f"Purge started for user {request.user_id}",
+                "job_id": job.job_id,
+                "status": job.status,
+            }
+
+        result = await reset_conversation_state()
         return result
     except Exception as e:
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@app.get("/reset-memory/{job_id}")
+async def get_reset_memory_job(job_id: str):
+    """Get the progress of a user data purge started by `POST /reset-memory`.
+
+    Raises:
+        HTTPException: If no purge with this ID was started by this worker.
+    """
+    job = get_purge_job(job_id)
+    if job is None:
+        raise HTTPException(status_code=404, detail=f"Purge job {job_id} not found")
+
+    return job
+
+
 @app.get("/coaches")
 async def get_available_coaches():
     """Get list of available career coaches."""
@@ -0,0 +1,384 @@
+import asyncio
+from collections import OrderedDict
+from dataclasses import dataclass, field
+from typing import Any, Optional, Sequence
+
+from langchain_core.runnables import RunnableConfig
+from langgraph.checkpoint.base import (
+    ChannelVersions,
+    Checkpoint,
+    CheckpointMetadata,
+    CheckpointTuple,
+    get_checkpoint_id,
+)
+from langgraph.checkpoint.mongodb.aio import AsyncMongoDBSaver
+from langgraph.checkpoint.mongodb.utils import dumps_metadata, loads_metadata
+from loguru import logger
+
+ThreadKey = tuple[str, str]
+
+# Seconds to wait before reopening a change stream that failed.
+_WATCH_RETRY_DELAY = 5.0
+
+
+@dataclass
+class _CachedCheckpoint:
+    """The latest checkpoint of a thread, kept in its serialized form.
+
+    Storing the serialized payload means every hit deserializes a fresh copy, so
+    callers can never mutate the cached state.
+    """
+
+    doc_id: Any
+    checkpoint_id: str
+    parent_checkpoint_id: str | None
+    type: str
+    checkpoint: bytes
+    metadata: dict
+    pending_writes: list[tuple[str, str, str, bytes]] = field(default_factory=list)
+
+
+class CachedAsyncMongoDBSaver(AsyncMongoDBSaver):
+    """MongoDB checkpointer that keeps the latest checkpoint of active threads in memory.
+
+    Reads of a thread's latest checkpoint are served from a bounded LRU cache, and
+    checkpoints are written through to MongoDB before the cache is updated. Other
+    workers' writes are picked up from a MongoDB change stream on the checkpoint and
+    writes collections, which invalidates the affected threads.
+
+    The cache is only used while the change stream is open. Change streams require a
+    replica set (MongoDB Atlas always is one); on a standalone server, or while the
+    stream is reconnecting, every call goes straight to MongoDB.
+
+    Args:
+        client: The Motor client the checkpointer should borrow connections from.
+        max_entries (int): Maximum number of threads kept in the cache.
+        **kwargs: Forwarded to `AsyncMongoDBSaver`.
+    """
+
+    def __init__(self, client, max_entries: int = 1000, **kwargs: Any) -> None:
+        super().__init__(client, **kwargs)
+        self.max_entries = max_entries
+        self._cache: OrderedDict[ThreadKey, _CachedCheckpoint] = OrderedDict()
+        self._keys_by_doc_id: dict[Any, ThreadKey] = {}
+        # Last change event seen per thread: its sequence number and the newest
+        # checkpoint id any event named. A checkpoint read from MongoDB is only cached
+        # if no event for its thread arrived meanwhile; a checkpoint this worker wrote
+        # is cached unless an event named a newer one.
+        self._event_seq = 0
+        self._thread_events: OrderedDict[ThreadKey, tuple[int, str]] = OrderedDict()
+        self._evicted_event_seq = 0
+        self._cache_enabled = False
+        self._watch_task: asyncio.Task | None = None
+
+    # --- Change stream ---
+
+    async def start_invalidation(self) -> None:
+        """Start watching for writes from other workers and enable the cache.
+
+        Returns once the change stream is open, or failed to open, in which case the
+        watcher keeps retrying in the background.
+        """
+        if self._watch_task is not None:
+            return
+
+        opened = asyncio.Event()
+        self._watch_task = asyncio.create_task(self._watch(opened))
+        await opened.wait()
+
+    async def stop_invalidation(self) -> None:
+        """Stop watching for writes and disable the cache."""
+        self._disable_cache()
+        if self._watch_task is not None:
+            self._watch_task.cancel()
+            try:
+                await self._watch_task
+            except asyncio.CancelledError:
+                pass
+            self._watch_task = None
+
+    async def _watch(self, opened: asyncio.Event) -> None:
+        pipeline = [
+            {
+                "$match": {
+                    "ns.coll": {
+                        "$in": [
+                            self.checkpoint_collection.name,
+                            self.writes_collection.name,
+                        ]
+                    }
+                }
+            },
+            {
+                "$project": {
+                    "operationType": 1,
+                    "ns": 1,
+                    "documentKey": 1,
+                    "fullDocument.thread_id": 1,
+                    "fullDocument.checkpoint_ns": 1,
+                    "fullDocument.checkpoint_id": 1,
+                }
+            },
+        ]
+
+        while True:
+            try:
+                async with self.db.watch(pipeline) as stream:
+                    self._enable_cache()
+                    opened.set()
+                    async for change in stream:
+                        self._handle_change(change)
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning(
+                    f"Checkpoint cache change stream unavailable, serving checkpoints from MongoDB: {e}"
+                )
+            finally:
+                self._disable_cache()
+                opened.set()
+
+            await asyncio.sleep(_WATCH_RETRY_DELAY)
+
+    def _enable_cache(self) -> None:
+        self._clear()
+        self._cache_enabled = True
+
+    def _disable_cache(self) -> None:
+        self._cache_enabled = False
+        self._clear()
+
+    def _clear(self) -> None:
+        self._event_seq += 1
+        self._evicted_event_seq = self._event_seq
+        self._thread_events.clear()
+        self._cache.clear()
+        self._keys_by_doc_id.clear()
+
+    def _handle_change(self, change: dict) -> None:
+        operation = change["operationType"]
+        collection = change.get("ns", {}).get("coll")
+        document = change.get("fullDocument") or {}
+
+        if operation in ("drop", "dropDatabase", "rename", "invalidate"):
+            self._clear()
+            return
+
+        if operation == "insert":
+            key = (document.get("thread_id"), document.get("checkpoint_ns", ""))
+            checkpoint_id = document.get("checkpoint_id", "")
+            self._mark(key, checkpoint_id)
+
+            entry = self._cache.get(key)
+            if entry is None:
+                return
+            if collection == self.checkpoint_collection.name:
+                # Checkpoint ids grow over time, so only a newer checkpoint replaces
+                # the cached one. This also skips the echo of this worker's own writes.
+                if checkpoint_id > entry.checkpoint_id:
+                    self._evict(key)
+            elif entry.checkpoint_id == checkpoint_id:
+                self._evict(key)
+            return
+
+        if collection == self.writes_collection.name:
+            if operation in ("update", "replace"):
+                # Replaced error or interrupt writes only carry the document id.
+                self._clear()
+            return
+
+        key = self._keys_by_doc_id.get(change["documentKey"]["_id"])
+        if key is not None:
+            self._mark(key, "")
+            self._evict(key)
+
+    # --- Cache bookkeeping ---
+
+    def _mark(self, key: ThreadKey, checkpoint_id: str) -> None:
+        self._event_seq += 1
+        _, newest_checkpoint_id = self._thread_events.pop(key, (0, ""))
+        self._thread_events[key] = (
+            self._event_seq,
+            max(newest_checkpoint_id, checkpoint_id),
+        )
+        if len(self._thread_events) > self.max_entries * 4:
+            _, (seq, _) = self._thread_events.popitem(last=False)
+            self._evicted_event_seq = max(self._evicted_event_seq, seq)
+
+    def _evict(self, key: ThreadKey) -> None:
+        entry = self._cache.pop(key, None)
+        if entry is not None:
+            self._keys_by_doc_id.pop(entry.doc_id, None)
+
+    def _can_cache_read(self, key: ThreadKey, started_at_seq: int) -> bool:
+        seq, _ = self._thread_events.get(key, (self._evicted_event_seq, ""))
+
+        return self._cache_enabled and seq <= started_at_seq
+
+    def _can_cache_write(self, key: ThreadKey, checkpoint_id: str) -> bool:
+        _, newest_checkpoint_id = self._thread_events.get(key, (0, ""))
+
+        return self._cache_enabled and newest_checkpoint_id <= checkpoint_id
+
+    def _store(self, key: ThreadKey, entry: _CachedCheckpoint) -> None:
+        previous = self._cache.pop(key, None)
+        if previous is not None:
+            self._keys_by_doc_id.pop(previous.doc_id, None)
+
+        self._cache[key] = entry
+        self._keys_by_doc_id[entry.doc_id] = key
+        if len(self._cache) > self.max_entries:
+            _, evicted = self._cache.popitem(last=False)
+            self._keys_by_doc_id.pop(evicted.doc_id, None)
+
+    def _to_tuple(self, key: ThreadKey, entry: _CachedCheckpoint) -> CheckpointTuple:
+        thread_id, checkpoint_ns = key
+
+        return CheckpointTuple(
+            {
+                "configurable": {
+                    "thread_id": thread_id,
+                    "checkpoint_ns": checkpoint_ns,
+                    "checkpoint_id": entry.checkpoint_id,
+                }
+            },
+            self.serde.loads_typed((entry.type, entry.checkpoint)),
+            loads_metadata(entry.metadata),
+            (
+                {
+                    "configurable": {
+                        "thread_id": thread_id,
+                        "checkpoint_ns": checkpoint_ns,
+                        "checkpoint_id": entry.parent_checkpoint_id,
+                    }
+                }
+                if entry.parent_checkpoint_id
+                else None
+            ),
+            [
+                (task_id, channel, self.serde.loads_typed((type_, value)))
+                for task_id, channel, type_, value in entry.pending_writes
+            ],
+        )
+
+    # --- Checkpointer API ---
+
+    async def aget_tuple(self, config: RunnableConfig) -> Optional[CheckpointTuple]:
+        """Get a checkpoint tuple, serving a thread's latest checkpoint from the cache."""
+        if not self._cache_enabled:
+            return await super().aget_tuple(config)
+
+        key = (
+            config["configurable"]["thread_id"],
+            config["configurable"].get("checkpoint_ns", ""),
+        )
+        checkpoint_id = get_checkpoint_id(config)
+
+        entry = self._cache.get(key)
+        if entry is not None and checkpoint_id in (None, entry.checkpoint_id):
+            self._cache.move_to_end(key)
+            return self._to_tuple(key, entry)
+
+        if checkpoint_id:
+            return await super().aget_tuple(config)
+
+        await self._setup()
+        started_at_seq = self._event_seq
+        query = {"thread_id": key[0], "checkpoint_ns": key[1]}
+        doc = await self.checkpoint_collection.find_one(
+            query, sort=[("checkpoint_id", -1)]
+        )
+        if doc is None:
+            return None
+
+        serialized_writes = self.writes_collection.find(
+            {**query, "checkpoint_id": doc["checkpoint_id"]}
+        )
+        entry = _CachedCheckpoint(
+            doc_id=doc["_id"],
+            checkpoint_id=doc["checkpoint_id"],
+            parent_checkpoint_id=doc.get("parent_checkpoint_id"),
+            type=doc["type"],
+            checkpoint=doc["checkpoint"],
+            metadata=doc["metadata"],
+            pending_writes=[
+                (write["task_id"], write["channel"], write["type"], write["value"])
+                async for write in serialized_writes
+            ],
+        )
+        if self._can_cache_read(key, started_at_seq):
+            self._store(key, entry)
+
+        return self._to_tuple(key, entry)
+
+    async def aput(
+        self,
+        config: RunnableConfig,
+        checkpoint: Checkpoint,
+        metadata: CheckpointMetadata,
+        new_versions: ChannelVersions,
+    ) -> RunnableConfig:
+        """Save a checkpoint to MongoDB, then make it the cached latest checkpoint."""
+        await self._setup()
+        thread_id = config["configurable"]["thread_id"]
+        checkpoint_ns = config["configurable"]["checkpoint_ns"]
+        key = (thread_id, checkpoint_ns)
+
+        type_, serialized_checkpoint = self.serde.dumps_typed(checkpoint)
+        doc = {
+            "parent_checkpoint_id": config["configurable"].get("checkpoint_id"),
+            "type": type_,
+            "checkpoint": serialized_checkpoint,
+            "metadata": dumps_metadata(metadata),
+        }
+        result = await self.checkpoint_collection.update_one(
+            {
+                "thread_id": thread_id,
+                "checkpoint_ns": checkpoint_ns,
+                "checkpoint_id": checkpoint["id"],
+            },
+            {"$set": doc},
+            upsert=True,
+        )
+
+        # Only a newly inserted checkpoint is known to be the thread's latest.
+        if result.upserted_id is not None and self._can_cache_write(key, checkpoint["id"]):
+            self._store(
+                key,
+                _CachedCheckpoint(
+                    doc_id=result.upserted_id,
+                    checkpoint_id=checkpoint["id"],
+                    parent_checkpoint_id=doc["parent_checkpoint_id"],
+                    type=type_,
+                    checkpoint=serialized_checkpoint,
+                    metadata=doc["metadata"],
+                ),
+            )
+        else:
+            self._evict(key)
+
+        return {
+            "configurable": {
+                "thread_id": thread_id,
+                "checkpoint_ns": checkpoint_ns,
+                "checkpoint_id": checkpoint["id"],
+            }
+        }
+
+    async def aput_writes(
+        self,
+        config: RunnableConfig,
+        writes: Sequence[tuple[str, Any]],
+        task_id: str,
+        task_path: str = "",
+    ) -> None:
+        """Store intermediate writes, dropping the thread from the cache if they belong to its latest checkpoint."""
+        await super().aput_writes(config, writes, task_id, task_path)
+
+        key = (
+            config["configurable"]["thread_id"],
+            config["configurable"]["checkpoint_ns"],
+        )
+        entry = self._cache.get(key)
+        if entry is not None and entry.checkpoint_id == config["configurable"]["checkpoint_id"]:
+            self._evict(key)
@@ -0,0 +1,160 @@
+from contextlib import asynccontextmanager
+from importlib.metadata import version
+from typing import AsyncIterator
+
+from langgraph.checkpoint.mongodb.aio import AsyncMongoDBSaver
+from loguru import logger
+from motor.motor_asyncio import AsyncIOMotorClient
+from pymongo.driver_info import DriverInfo
+
+from career_coaches.config import settings
+from career_coaches.infrastructure.checkpoint_cache import CachedAsyncMongoDBSaver
+from common.infrastructure.serde import ZstdCompressedSerializer
+
+_client: AsyncIOMotorClient | None = None
+_checkpointer: AsyncMongoDBSaver | None = None
+
+
+def _create_client() -> AsyncIOMotorClient:
+    """Create a Motor client sized from the career coach settings.
+
+    Returns:
+        AsyncIOMotorClient: A client whose connection pool is configured for checkpointing.
+    """
+    return AsyncIOMotorClient(
+        settings.MONGO_URI,
+        appname="career_coaches",
+        maxPoolSize=settings.MONGO_CHECKPOINTER_MAX_POOL_SIZE,
+        minPoolSize=settings.MONGO_CHECKPOINTER_MIN_POOL_SIZE,
+        maxIdleTimeMS=settings.MONGO_CHECKPOINTER_MAX_IDLE_TIME_MS,
+        serverSelectionTimeoutMS=settings.MONGO_CHECKPOINTER_SERVER_SELECTION_TIMEOUT_MS,
+        driver=DriverInfo(
+            name="Langgraph", version=version("langgraph-checkpoint-mongodb")
+        ),
+    )
+
+
+async def _create_checkpointer(
+    client: AsyncIOMotorClient, cached: bool = False
+) -> AsyncMongoDBSaver:
+    """Create a checkpointer bound to the career coach collections.
+
+    Args:
+        client: The Motor client the checkpointer should borrow connections from.
+        cached: Whether to keep the latest checkpoint of active threads in memory.
+
+    Returns:
+        AsyncMongoDBSaver: A checkpointer with its indexes already set up.
+    """
+    collections = dict(
+        db_name=settings.MONGO_DB_NAME,
+        checkpoint_collection_name=settings.MONGO_CAREER_STATE_CHECKPOINT_COLLECTION,
+        writes_collection_name=settings.MONGO_CAREER_STATE_WRITES_COLLECTION,
+    )
+    if cached:
+        checkpointer = CachedAsyncMongoDBSaver(
+            client,
+            max_entries=settings.CAREER_COACH_CHECKPOINT_CACHE_SIZE,
+            **collections,
+        )
+    else:
+        checkpointer = AsyncMongoDBSaver(client, **collections)
+    if settings.CAREER_COACH_CHECKPOINT_COMPRESSION:
+        # AsyncMongoDBSaver does not forward a serde to its base class.
+        checkpointer.serde = ZstdCompressedSerializer(
+            threshold_bytes=settings.CAREER_COACH_CHECKPOINT_COMPRESSION_THRESHOLD_BYTES,
+            level=settings.CAREER_COACH_CHECKPOINT_COMPRESSION_LEVEL,
+        )
+    await checkpointer._setup()
+
+    return checkpointer
+
+
+async def open_checkpointer() -> AsyncMongoDBSaver:
+    """Open the process-wide checkpointer.
+
+    Meant to be called once from the FastAPI lifespan. Calling it again while the
+    checkpointer is open returns the existing instance.
+
+    Returns:
+        AsyncMongoDBSaver: The shared checkpointer.
+    """
+    global _client, _checkpointer
+
+    if _checkpointer is not None:
+        return _checkpointer
+
+    cached = settings.CAREER_COACH_CHECKPOINT_CACHE_SIZE > 0
+    client = _create_client()
+    try:
+        checkpointer = await _create_checkpointer(client, cached=cached)
+        if cached:
+            await checkpointer.start_invalidation()
+    except Exception:
+        client.close()
+        raise
+    _client = client
+    _checkpointer = checkpointer
+
+    logger.info(
+        f"Opened shared career coach checkpointer | max pool size: {settings.MONGO_CHECKPOINTER_MAX_POOL_SIZE} | checkpoint cache size: {settings.CAREER_COACH_CHECKPOINT_CACHE_SIZE}"
+    )
+
+    return _checkpointer
+
+
+async def close_checkpointer() -> None:
+    """Close the process-wide checkpointer and release its connection pool."""
+    global _client, _checkpointer
+
+    if isinstance(_checkpointer, CachedAsyncMongoDBSaver):
+        await _checkpointer.stop_invalidation()
+
+    if _client is not None:
+        _client.close()
+        logger.info("Closed shared career coach checkpointer.")
+
+    _client = None
+    _checkpointer = None
+
+
+def get_mongo_client() -> AsyncIOMotorClient | None:
+    """Get the process-wide Motor client, if it has been opened.
+
+    It is shared by the checkpointer and the API routes reading MongoDB directly.
+
+    Returns:
+        AsyncIOMotorClient | None: The shared client, or None outside the API lifespan.
+    """
+    return _client
+
+
+def get_checkpointer() -> AsyncMongoDBSaver | None:
+    """Get the process-wide checkpointer, if it has been opened.
+
+    Returns:
+        AsyncMongoDBSaver | None: The shared checkpointer, or None outside the API lifespan.
+    """
+    return _checkpointer
+
+
+@asynccontextmanager
+async def checkpointer_session() -> AsyncIterator[AsyncMongoDBSaver]:
+    """Yield a checkpointer for a single conversation turn.
+
+    Inside the API the shared checkpointer is reused and left open. Outside of it
+    (CLI tools, evaluation runs) a short-lived checkpointer is created and closed
+    when the turn finishes.
+
+    Yields:
+        AsyncMongoDBSaver: The checkpointer to compile the workflow with.
+    """
+    if _checkpointer is not None:
+        yield _checkpointer
+        return
+
+    client = _create_client()
+    try:
+        yield await _create_checkpointer(client)
+    finally:
+        client.close()
@@ -1,13 +1,17 @@
+import base64
+import hashlib
+import json
 from typing import List, Optional, Dict
 from datetime import datetime
 
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query
+from motor.motor_asyncio import AsyncIOMotorCollection, AsyncIOMotorDatabase
 from pydantic import BaseModel, Field
-from pymongo import MongoClient
-from bson.objectid import ObjectId
+from pymongo import ASCENDING, DESCENDING
 
 from career_coaches.config import settings
 from career_coaches.domain.coach_factory import CoachFactory
+from career_coaches.infrastructure.checkpointer import get_mongo_client
 
 router = APIRouter()
 
@@ -28,7 +32,22 @@ class ChatSession(BaseModel):
     start_time: datetime
     end_time: Optional[datetime] = None
     messages: List[ChatMessage]
-    
+    next_message_cursor: Optional[str] = None
+    message_count: Optional[int] = None
+    last_message_preview: Optional[str] = None
+
+
+class ChatSessionPage(BaseModel):
+    """A page of chat sessions, newest first."""
+    sessions: List[ChatSession]
+    next_cursor: Optional[str] = None
+
+
+class ChatMessagePage(BaseModel):
+    """A page of messages of one chat session, oldest first."""
+    messages: List[ChatMessage]
+    next_cursor: Optional[str] = None
+
 
 class UserInfo(BaseModel):
     """User information with first seen date."""
@@ -45,193 +64,301 @@ class Coach(BaseModel):
     focus_areas: List[str]
 
 
+def _get_coach_name(coach_id: str) -> str:
+    """Get a coach's display name from `CoachFactory`."""
+    try:
+        return CoachFactory.get_coach(coach_id).name
+    except Exception:
+        return f"Coach {coach_id}"
+
+
+def _to_datetime(timestamp) -> datetime:
+    if isinstance(timestamp, str):
+        return datetime.fromisoformat(timestamp.replace('Z', '+00:00'))
+
+    return timestamp
+
+
+async def get_database() -> AsyncIOMotorDatabase:
+    """FastAPI dependency providing the database on the process-wide Motor client.
+
+    Raises:
+        HTTPException: 503 if the client is not open, i.e. outside the API lifespan.
+    """
+    client = get_mongo_client()
+    if client is None:
+        raise HTTPException(status_code=503, detail="Database connection is not available")
+
+    return client[settings.MONGO_DB_NAME]
+
+
 @router.get("/users", response_model=List[UserInfo])
-async def get_users():
-    """Get all users with their first seen date and available coaches."""
+async def get_users(
+    skip: int = Query(0, ge=0, description="Number of users to skip."),
+    limit: int = Query(100, ge=1, le=1000, description="Maximum number of users to return."),
+    db: AsyncIOMotorDatabase = Depends(get_database),
+):
+    """Get users with their first seen date and available coaches, newest first."""
     try:
-        client = MongoClient(settings.MONGO_URI)
-        db = client[settings.MONGO_DB_NAME]
-        writes_collection = db[settings.MONGO_CAREER_STATE_WRITES_COLLECTION]
-        
-        # Get all unique users from thread_id field directly
-        # This is a more direct approach since thread_ids are formatted as "user_id_coach_id"
-        all_threads = writes_collection.distinct("thread_id")
-        
-        # Extract unique user IDs from thread IDs
-        users_dict = {}
-        for thread in all_threads:
-            if thread and "_" in thread:
-                parts = thread.split("_")
-                if len(parts) >= 2:
-                    user_id = parts[0]
-                    coach_id = parts[1]
-                    
-                    # Get the earliest record for this user
-                    if user_id not in users_dict:
-                        # Find the earliest record for this thread
-                        earliest = writes_collection.find({"thread_id": thread}).sort("timestamp", 1).limit(1)
-                        earliest_doc = next(earliest, None)
-                        
-                        if earliest_doc:
-                            timestamp = earliest_doc.get("timestamp", "")
-                            state = earliest_doc.get("state", {})
-                            coach_name = state.get("coach_name", f"Coach {coach_id}")
-                            
-                            users_dict[user_id] = {
-                                "user_id": user_id,
-                                "first_seen": timestamp,
-                                "coach_sessions": {coach_id: coach_name}
-                            }
-                        else:
-                            # Fallback if no document is found
-                            users_dict[user_id] = {
-                                "user_id": user_id,
-                                "first_seen": datetime.now(),
-                                "coach_sessions": {coach_id: f"Coach {coach_id}"}
-                            }
-                    else:
-                        # Add this coach to existing user
-                        state = writes_collection.find_one(
-                            {"thread_id": thread, "state.coach_name": {"$exists": True}},
-                            {"state.coach_name": 1}
-                        )
-                        coach_name = state.get("state", {}).get("coach_name", f"Coach {coach_id}") if state else f"Coach {coach_id}"
-                        users_dict[user_id]["coach_sessions"][coach_id] = coach_name
-        
-        # Convert to list of UserInfo objects
-        user_results = list(users_dict.values())
-        
-        # Format the results
+        index_collection = db[settings.MONGO_CAREER_CONVERSATION_INDEX_COLLECTION]
+
+        pipeline = [
+            {
+                "$group": {
+                    "_id": "$user_id",
+                    "first_seen": {"$min": "$first_message_at"},
+                    "coach_ids": {"$addToSet": "$coach_id"},
+                }
+            },
+            {"$sort": {"first_seen": -1, "_id": 1}},
+            {"$skip": skip},
+            {"$limit": limit},
+        ]
+
         users = []
-        for user in user_results:
-            # Create a dictionary of coach_id -> coach_name
-            coach_sessions = {}
-            if "coach_ids" in user and "coach_names" in user:
-                for i, coach_id in enumerate(user.get("coach_ids", [])):
-                    if i < len(user.get("coach_names", [])):
-                        coach_sessions[coach_id] = user["coach_names"][i]
-                    else:
-                        coach_sessions[coach_id] = f"Coach {coach_id}"
-            
-            # Convert timestamp string to datetime
-            first_seen = user.get("first_seen")
-            if isinstance(first_seen, str):
-                first_seen = datetime.fromisoformat(first_seen.replace('Z', '+00:00'))
-            
+        async for user in index_collection.aggregate(pipeline, allowDiskUse=True):
             users.append(UserInfo(
-                user_id=user.get("user_id"),
-                first_seen=first_seen,
-                coach_sessions=coach_sessions
+                user_id=user["_id"],
+                first_seen=user["first_seen"],
+                coach_sessions={
+                    coach_id: _get_coach_name(coach_id)
+                    for coach_id in sorted(user["coach_ids"])
+                },
             ))
-            
-        return sorted(users, key=lambda x: x.first_seen, reverse=True)
-    
+
+        return users
+
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error retrieving users: {str(e)}")
-    finally:
-        client.close()
 
 
-@router.get("/sessions/{user_id}", response_model=List[ChatSession])
-async def get_user_sessions(user_id: str, coach_id: Optional[str] = None):
-    """Get all chat sessions for a specific user, optionally filtered by coach."""
+def _encode_cursor(timestamp: datetime, key: str) -> str:
+    payload = json.dumps({"ts": timestamp.isoformat(), "key": key})
+
+    return base64.urlsafe_b64encode(payload.encode()).decode()
+
+
+def _decode_cursor(cursor: str) -> tuple[datetime, str]:
     try:
-        client = MongoClient(settings.MONGO_URI)
-        db = client[settings.MONGO_DB_NAME]
+        payload = json.loads(base64.urlsafe_b64decode(cursor.encode()))
+        return datetime.fromisoformat(payload["ts"]), payload["key"]
+    except Exception:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+
+def _time_filter(start: Optional[datetime], end: Optional[datetime]) -> dict:
+    time_filter = {}
+    if start is not None:
+        time_filter["$gte"] = start
+    if end is not None:
+        time_filter["$lt"] = end
+
+    return {"timestamp": time_filter} if time_filter else {}
+
+
+def _message_key(message: dict) -> str:
+    """Key identifying a message across the writes of a session.
+
+    Every write carries the conversation up to that point, so the same message
+    appears in many writes. Messages are identified by their ID, or by a hash of
+    their type and content if they have none.
+    """
+    if message.get("id"):
+        return message["id"]
+
+    return hashlib.sha1(f"{message.get('type')}:{message.get('content')}".encode()).hexdigest()
+
+
+async def _get_session_messages(
+    writes_collection: AsyncIOMotorCollection,
+    thread_id: str,
+    time_filter: dict,
+    limit: int,
+    cursor: Optional[str] = None,
+) -> tuple[List[ChatMessage], Optional[str]]:
+    """Read one page of a session's messages, in order of first appearance.
+
+    Only message fields are fetched, and the scan stops as soon as the page is full.
+    The cursor holds the timestamp of the write where the last returned message
+    first appeared, and that message's key. Every write carries the conversation up
+    to that point, so that write alone tells which messages were already returned:
+    its messages up to the cursor's. A page therefore reads the writes from the
+    cursor on only, whatever the length of the session. For the same reason, with
+    a start time the messages of the last write before it are skipped: they were
+    first seen earlier.
+
+    Returns:
+        The messages of the page and the cursor of the next page, if any.
+
+    Raises:
+        HTTPException: 400 if the cursor's message is no longer stored, e.g. after
+            its writes were compacted; pagination must then restart.
+    """
+    query = {"thread_id": thread_id, **time_filter}
+    seen: set[str] = set()
+    after_key = None
+    message_fields = {"state.messages.id": 1, "state.messages.type": 1, "state.messages.content": 1}
+
+    if cursor is not None:
+        cursor_timestamp, after_key = _decode_cursor(cursor)
+        query["timestamp"] = {**query.get("timestamp", {}), "$gte": cursor_timestamp}
+    elif "$gte" in query.get("timestamp", {}):
+        previous_write = await writes_collection.find_one(
+            {"thread_id": thread_id, "timestamp": {"$lt": query["timestamp"]["$gte"]}},
+            {"_id": 0, **message_fields},
+            sort=[("timestamp", DESCENDING)],
+        )
+        if previous_write is not None:
+            seen.update(
+                _message_key(message) for message in previous_write.get("state", {}).get("messages", [])
+            )
+
+    messages: List[ChatMessage] = []
+    keys: List[str] = []
+    passed_cursor = after_key is None
+    writes = writes_collection.find(
+        query,
+        {"_id": 0, "timestamp": 1, **message_fields},
+    ).sort("timestamp", ASCENDING)
+
+    async for write in writes:
+        timestamp = _to_datetime(write.get("timestamp"))
+        for message in write.get("state", {}).get("messages", []):
+            if message.get("type") not in ("human", "ai"):
+                continue
+
+            key = _message_key(message)
+            if key in seen:
+                continue
+            seen.add(key)
+
+            if not passed_cursor:
+                passed_cursor = key == after_key
+                continue
+
+            if len(messages) == limit:
+                await writes.close()
+                return messages, _encode_cursor(messages[-1].timestamp, keys[-1])
+
+            messages.append(ChatMessage(
+                role="user" if message["type"] == "human" else "assistant",
+                content=message.get("content", ""),
+                timestamp=timestamp,
+            ))
+            keys.append(key)
+
+    if not passed_cursor:
+        raise HTTPException(status_code=400, detail="Cursor no longer valid, restart pagination")
+
+    return messages, None
+
+
+@router.get("/sessions/{user_id}", response_model=ChatSessionPage)
+async def get_user_sessions(
+    user_id: str,
+    coach_id: Optional[str] = None,
+    start: Optional[datetime] = Query(None, description="Only include sessions active at or after this time."),
+    end: Optional[datetime] = Query(None, description="Only include sessions active before this time."),
+    cursor: Optional[str] = Query(None, description="Cursor of the session page to return."),
+    limit: int = Query(20, ge=1, le=100, description="Maximum number of sessions to return."),
+    message_limit: int = Query(50, ge=0, le=500, description="Maximum number of messages returned per session."),
+    db: AsyncIOMotorDatabase = Depends(get_database),
+):
+    """Get a page of chat sessions for a specific user, optionally filtered by coach.
+
+    Sessions are listed from the conversation index. Each session holds its first
+    `message_limit` messages; the rest are read with
+    `/sessions/{user_id}/{session_id}/messages` from `next_message_cursor`. With
+    `message_limit=0` only the index is read.
+    """
+    try:
+        index_collection = db[settings.MONGO_CAREER_CONVERSATION_INDEX_COLLECTION]
         writes_collection = db[settings.MONGO_CAREER_STATE_WRITES_COLLECTION]
-        
-        # Construct the query
-        query = {
-            "state.user_id": user_id
-        }
-        
+
+        query = {"user_id": user_id}
         if coach_id:
-            query["state.coach_id"] = coach_id
-        
-        # Find all writes for this user/coach
-        writes = writes_collection.find(query).sort("timestamp", 1)
-        
-        # Group messages by thread_id (session)
-        sessions = {}
-        for write in writes:
-            thread_id = write.get("thread_id", "")
-            if not thread_id:
-                continue
-                
-            # Get timestamp
-            timestamp = write.get("timestamp", "")
-            if isinstance(timestamp, str):
-                timestamp = datetime.fromisoformat(timestamp.replace('Z', '+00:00'))
-            
-            # Process the state to extract messages
-            if "state" in write and "messages" in write["state"]:
-                state = write["state"]
-                user_id = state.get("user_id", "")
-                coach_id = state.get("coach_id", "")
-                coach_name = state.get("coach_name", f"Coach {coach_id}")
-                
-                # Initialize session if new
-                if thread_id not in sessions:
-                    sessions[thread_id] = {
-                        "session_id": thread_id,
-                        "user_id": user_id,
-                        "coach_id": coach_id,
-                        "coach_name": coach_name,
-                        "start_time": timestamp,
-                        "end_time": timestamp,
-                        "messages": []
-                    }
-                
-                # Update end time (always the latest timestamp)
-                if timestamp > sessions[thread_id]["end_time"]:
-                    sessions[thread_id]["end_time"] = timestamp
-                
-                # Process messages
-                messages = []
-                for msg in state.get("messages", []):
-                    if msg.get("type") in ["human", "ai"]:
-                        messages.append({
-                            "role": "user" if msg.get("type") == "human" else "assistant",
-                            "content": msg.get("content", ""),
-                            "timestamp": timestamp
-                        })
-                
-                # Add any new messages (avoid duplicates)
-                existing_contents = [m["content"] for m in sessions[thread_id]["messages"]]
-                for msg in messages:
-                    if msg["content"] not in existing_contents:
-                        sessions[thread_id]["messages"].append(msg)
-        
-        # Convert to list of ChatSession objects
-        result = []
-        for session_data in sessions.values():
-            # Sort messages by timestamp
-            sorted_messages = sorted(session_data["messages"], key=lambda x: x["timestamp"])
-            
-            # Create ChatSession object
-            session = ChatSession(
-                session_id=session_data["session_id"],
-                user_id=session_data["user_id"],
-                coach_id=session_data["coach_id"],
-                coach_name=session_data["coach_name"],
-                start_time=session_data["start_time"],
-                end_time=session_data["end_time"],
-                messages=[ChatMessage(
-                    role=msg["role"],
-                    content=msg["content"],
-                    timestamp=msg["timestamp"]
-                ) for msg in sorted_messages]
-            )
-            result.append(session)
-        
-        # Sort sessions by start time (newest first)
-        result.sort(key=lambda x: x.start_time, reverse=True)
-        return result
-    
+            query["coach_id"] = coach_id
+        if start is not None:
+            query["last_message_at"] = {"$gte": start}
+        if end is not None:
+            query["first_message_at"] = {"$lt": end}
+        if cursor is not None:
+            cursor_start, cursor_thread_id = _decode_cursor(cursor)
+            query["$or"] = [
+                {"first_message_at": {"$lt": cursor_start}},
+                {"first_message_at": cursor_start, "_id": {"$lt": cursor_thread_id}},
+            ]
+
+        entries = await (
+            index_collection.find(query)
+            .sort([("first_message_at", DESCENDING), ("_id", DESCENDING)])
+            .limit(limit + 1)
+            .to_list(length=None)
+        )
+        has_more = len(entries) > limit
+
+        time_filter = _time_filter(start, end)
+        sessions = []
+        for entry in entries[:limit]:
+            messages, next_message_cursor = [], None
+            if message_limit:
+                messages, next_message_cursor = await _get_session_messages(
+                    writes_collection, entry["_id"], time_filter, message_limit
+                )
+            sessions.append(ChatSession(
+                session_id=entry["_id"],
+                user_id=user_id,
+                coach_id=entry["coach_id"],
+                coach_name=_get_coach_name(entry["coach_id"]),
+                start_time=entry["first_message_at"],
+                end_time=entry["last_message_at"],
+                messages=messages,
+                next_message_cursor=next_message_cursor,
+                message_count=entry.get("message_count"),
+                last_message_preview=entry.get("last_message_preview"),
+            ))
+
+        next_cursor = (
+            _encode_cursor(sessions[-1].start_time, sessions[-1].session_id)
+            if has_more
+            else None
+        )
+
+        return ChatSessionPage(sessions=sessions, next_cursor=next_cursor)
+
+    except HTTPException:
+        raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error retrieving chat sessions: {str(e)}")
-    finally:
-        client.close()
+
+
+@router.get("/sessions/{user_id}/{session_id}/messages", response_model=ChatMessagePage)
+async def get_session_messages(
+    user_id: str,
+    session_id: str,
+    start: Optional[datetime] = Query(None, description="Only include messages first seen at or after this time."),
+    end: Optional[datetime] = Query(None, description="Only include messages first seen before this time."),
+    cursor: Optional[str] = Query(None, description="Cursor of the message page to return."),
+    limit: int = Query(50, ge=1, le=500, description="Maximum number of messages to return."),
+    db: AsyncIOMotorDatabase = Depends(get_database),
+):
+    """Get a page of messages of one chat session, oldest first."""
+    try:
+        writes_collection = db[settings.MONGO_CAREER_STATE_WRITES_COLLECTION]
+
+        if not session_id.startswith(f"{user_id}_"):
+            raise HTTPException(status_code=404, detail="Session not found")
+
+        messages, next_cursor = await _get_session_messages(
+            writes_collection, session_id, _time_filter(start, end), limit, cursor
+        )
+
+        return ChatMessagePage(messages=messages, next_cursor=next_cursor)
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Error retrieving chat messages: {str(e)}")
 
 
 @router.get("/coaches", response_model=List[Coach])
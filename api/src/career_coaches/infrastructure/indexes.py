@@ -0,0 +1,154 @@
+from datetime import datetime
+
+from loguru import logger
+from motor.motor_asyncio import AsyncIOMotorDatabase
+from pymongo import ASCENDING, DESCENDING
+
+from career_coaches.config import settings
+from career_coaches.domain.thread_ids import user_thread_id_range
+from common.infrastructure.mongo.index_registry import (
+    HotQuery,
+    IndexSpec,
+    QueryPlan,
+    ensure_indexes,
+    explain_query,
+    find_missing_indexes,
+)
+
+# User and thread used to explain the hot queries; they do not need to exist.
+_SAMPLE_USER_ID = "explain_user"
+_SAMPLE_THREAD_ID = f"{_SAMPLE_USER_ID}_career_assessment"
+
+
+def get_required_indexes() -> dict[str, list[IndexSpec]]:
+    """Get the secondary indexes required on each career coach collection.
+
+    The LangGraph checkpointer's own unique indexes are listed as well: the saver
+    only creates them on a collection without secondary indexes, so registering them
+    keeps them in place whatever order the indexes are created in.
+
+    The long-term memory collection is left out on purpose: its name is an alias
+    swapped by blue/green syncs, and its search indexes are created by the sync.
+
+    Returns:
+        dict[str, list[IndexSpec]]: Required indexes by collection name.
+    """
+    return {
+        settings.MONGO_CAREER_STATE_CHECKPOINT_COLLECTION: [
+            IndexSpec(
+                keys=[("thread_id", ASCENDING), ("checkpoint_ns", ASCENDING), ("checkpoint_id", DESCENDING)],
+                name="thread_id_1_checkpoint_ns_1_checkpoint_id_-1",
+                unique=True,
+            ),
+        ],
+        settings.MONGO_CAREER_STATE_WRITES_COLLECTION: [
+            IndexSpec(
+                keys=[
+                    ("thread_id", ASCENDING),
+                    ("checkpoint_ns", ASCENDING),
+                    ("checkpoint_id", DESCENDING),
+                    ("task_id", ASCENDING),
+                    ("idx", ASCENDING),
+                ],
+                name="thread_id_1_checkpoint_ns_1_checkpoint_id_-1_task_id_1_idx_1",
+                unique=True,
+            ),
+            IndexSpec(
+                keys=[("thread_id", ASCENDING), ("timestamp", ASCENDING)],
+                name="thread_id_timestamp",
+            ),
+            IndexSpec(
+                keys=[("state.user_id", ASCENDING), ("state.coach_id", ASCENDING), ("timestamp", ASCENDING)],
+                name="state_user_id_coach_id_timestamp",
+            ),
+        ],
+        settings.MONGO_CAREER_CONVERSATION_INDEX_COLLECTION: [
+            IndexSpec(
+                keys=[("user_id", ASCENDING), ("first_message_at", DESCENDING)],
+                name="user_id_first_message_at",
+            ),
+        ],
+    }
+
+
+def get_hot_queries() -> list[HotQuery]:
+    """Get the history and purge queries whose plans must use an index."""
+    return [
+        HotQuery(
+            name="history: user sessions",
+            collection=settings.MONGO_CAREER_CONVERSATION_INDEX_COLLECTION,
+            filter={"user_id": _SAMPLE_USER_ID},
+            sort=[("first_message_at", DESCENDING), ("_id", DESCENDING)],
+        ),
+        HotQuery(
+            name="history: session messages",
+            collection=settings.MONGO_CAREER_STATE_WRITES_COLLECTION,
+            filter={"thread_id": _SAMPLE_THREAD_ID, "timestamp": {"$gte": datetime(1970, 1, 1)}},
+            sort=[("timestamp", ASCENDING)],
+        ),
+        HotQuery(
+            name="conversation: latest checkpoint",
+            collection=settings.MONGO_CAREER_STATE_CHECKPOINT_COLLECTION,
+            filter={"thread_id": _SAMPLE_THREAD_ID, "checkpoint_ns": ""},
+            sort=[("checkpoint_id", DESCENDING)],
+        ),
+        HotQuery(
+            name="purge: user checkpoint threads",
+            collection=settings.MONGO_CAREER_STATE_CHECKPOINT_COLLECTION,
+            filter={"thread_id": user_thread_id_range(_SAMPLE_USER_ID)},
+        ),
+        HotQuery(
+            name="purge: user write threads",
+            collection=settings.MONGO_CAREER_STATE_WRITES_COLLECTION,
+            filter={"thread_id": user_thread_id_range(_SAMPLE_USER_ID)},
+        ),
+        HotQuery(
+            name="purge: user conversation index",
+            collection=settings.MONGO_CAREER_CONVERSATION_INDEX_COLLECTION,
+            filter={"user_id": _SAMPLE_USER_ID},
+        ),
+    ]
+
+
+async def ensure_career_coach_indexes(db: AsyncIOMotorDatabase) -> dict[str, list[str]]:
+    """Create the missing indexes of the career coach collections.
+
+    Idempotent; meant to run at API startup. Missing indexes are logged before
+    they are created.
+
+    Returns:
+        dict[str, list[str]]: Names of the created indexes by collection name.
+    """
+    created = {}
+    for collection_name, specs in get_required_indexes().items():
+        missing = await ensure_indexes(db[collection_name], specs)
+        if missing:
+            created[collection_name] = [spec.name for spec in missing]
+            logger.warning(
+                f"Created missing indexes on {collection_name}: {', '.join(created[collection_name])}"
+            )
+
+    return created
+
+
+async def find_missing_career_coach_indexes(db: AsyncIOMotorDatabase) -> dict[str, list[IndexSpec]]:
+    """Get the required indexes that do not exist, by collection name."""
+    missing = {}
+    for collection_name, specs in get_required_indexes().items():
+        collection_missing = await find_missing_indexes(db[collection_name], specs)
+        if collection_missing:
+            missing[collection_name] = collection_missing
+
+    return missing
+
+
+async def explain_hot_queries(db: AsyncIOMotorDatabase) -> list[tuple[HotQuery, QueryPlan]]:
+    """Explain the hot history and purge queries.
+
+    Returns:
+        list[tuple[HotQuery, QueryPlan]]: Each query with its winning plan.
+    """
+    return [
+        (query, await explain_query(db[query.collection], query.filter, query.sort))
+        for query in get_hot_queries()
+    ]
@@ -0,0 +1,163 @@
+import asyncio
+import time
+from typing import AsyncIterator
+
+from fastapi import WebSocket
+from pydantic import BaseModel, Field
+
+
+class StreamStats(BaseModel):
+    """Measurements collected while streaming one response to a client.
+
+    Args:
+        chunks_received (int): Number of chunks produced by the response stream.
+        frames_sent (int): Number of chunk frames sent to the client.
+        chars_sent (int): Number of response characters sent to the client.
+        cpu_time_ms (float): CPU time spent by the loop thread during the turn. Under
+            concurrent sockets this includes work interleaved from other tasks, so
+            compare totals across runs rather than reading it as an exact per-turn cost.
+        duration_ms (float): Wall-clock duration of the turn.
+    """
+
+    chunks_received: int = Field(default=0, description="Chunks produced by the stream")
+    frames_sent: int = Field(default=0, description="Chunk frames sent to the client")
+    chars_sent: int = Field(default=0, description="Response characters sent")
+    cpu_time_ms: float = Field(default=0.0, description="Loop thread CPU time of the turn")
+    duration_ms: float = Field(default=0.0, description="Wall-clock duration of the turn")
+
+
+class StreamResult(BaseModel):
+    """The full response text together with its streaming measurements."""
+
+    response: str
+    stats: StreamStats
+
+
+async def stream_per_chunk(
+    websocket: WebSocket, response_stream: AsyncIterator[str]
+) -> StreamResult:
+    """Send one frame per chunk of the response stream.
+
+    Args:
+        websocket: The client the ``{"chunk": ...}`` frames are sent to.
+        response_stream: The chunks of the response, as produced by the LLM.
+
+    Returns:
+        StreamResult: The full response and the streaming measurements.
+    """
+    stats = StreamStats()
+    cpu_start, wall_start = time.thread_time(), time.perf_counter()
+    parts: list[str] = []
+
+    try:
+        async for chunk in response_stream:
+            stats.chunks_received += 1
+            parts.append(chunk)
+            await websocket.send_json({"chunk": chunk})
+            stats.frames_sent += 1
+            stats.chars_sent += len(chunk)
+    finally:
+        if hasattr(response_stream, "aclose"):
+            await response_stream.aclose()
+
+    stats.cpu_time_ms = (time.thread_time() - cpu_start) * 1000
+    stats.duration_ms = (time.perf_counter() - wall_start) * 1000
+
+    return StreamResult(response="".join(parts), stats=stats)
+
+
+async def stream_coalesced(
+    websocket: WebSocket,
+    response_stream: AsyncIterator[str],
+    flush_interval_ms: int,
+    flush_max_chars: int,
+    send_queue_size: int,
+) -> StreamResult:
+    """Send the response stream as coalesced frames with a bounded send queue.
+
+    Chunks are accumulated in a buffer and flushed as one frame when either
+    ``flush_interval_ms`` has elapsed or ``flush_max_chars`` characters are pending.
+    Flushed frames go through a queue of at most ``send_queue_size`` frames. When the
+    client reads slowly the queue fills up and chunks keep accumulating in the buffer,
+    so frames grow larger instead of stalling the response stream.
+
+    If the client disconnects, the response stream is cancelled so the upstream
+    generation stops, and the ``WebSocketDisconnect`` raised by the send is
+    propagated to the caller.
+
+    Args:
+        websocket: The client the ``{"chunk": ...}`` frames are sent to.
+        response_stream: The chunks of the response, as produced by the LLM.
+        flush_interval_ms: Maximum time a chunk waits in the buffer before being sent.
+        flush_max_chars: Buffered characters that trigger an immediate flush.
+        send_queue_size: Maximum number of frames waiting to be sent.
+
+    Returns:
+        StreamResult: The full response and the streaming measurements.
+    """
+    stats = StreamStats()
+    cpu_start, wall_start = time.thread_time(), time.perf_counter()
+    parts: list[str] = []
+    pending: list[str] = []
+    pending_chars = 0
+    stream_done = False
+    flush_requested = asyncio.Event()
+    send_queue: asyncio.Queue[str | None] = asyncio.Queue(maxsize=send_queue_size)
+
+    async def read_stream() -> None:
+        nonlocal pending_chars, stream_done
+        try:
+            async for chunk in response_stream:
+                stats.chunks_received += 1
+                parts.append(chunk)
+                pending.append(chunk)
+                pending_chars += len(chunk)
+                if pending_chars >= flush_max_chars:
+                    flush_requested.set()
+        finally:
+            stream_done = True
+            flush_requested.set()
+
+    async def flush_frames() -> None:
+        nonlocal pending_chars
+        interval = flush_interval_ms / 1000
+        while True:
+            try:
+                await asyncio.wait_for(flush_requested.wait(), timeout=interval)
+            except asyncio.TimeoutError:
+                pass
+            flush_requested.clear()
+
+            if pending:
+                frame = "".join(pending)
+                pending.clear()
+                pending_chars = 0
+                await send_queue.put(frame)
+
+            if stream_done and not pending:
+                await send_queue.put(None)
+                return
+
+    async def send_frames() -> None:
+        while (frame := await send_queue.get()) is not None:
+            await websocket.send_json({"chunk": frame})
+            stats.frames_sent += 1
+            stats.chars_sent += len(frame)
+
+    reader = asyncio.create_task(read_stream())
+    flusher = asyncio.create_task(flush_frames())
+    try:
+        await send_frames()
+        # Surface errors raised by the response stream.
+        await reader
+    finally:
+        for task in (reader, flusher):
+            task.cancel()
+        await asyncio.gather(reader, flusher, return_exceptions=True)
+        if hasattr(response_stream, "aclose"):
+            await response_stream.aclose()
+
+    stats.cpu_time_ms = (time.thread_time() - cpu_start) * 1000
+    stats.duration_ms = (time.perf_counter() - wall_start) * 1000
+
+    return StreamResult(response="".join(parts), stats=stats)
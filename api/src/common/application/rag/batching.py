@@ -0,0 +1,160 @@
+import asyncio
+import queue
+import threading
+import time
+from concurrent.futures import Future
+
+from langchain_core.embeddings import Embeddings
+from loguru import logger
+
+from .embeddings import get_embedding_model
+
+_STOP = object()
+
+
+class MicroBatchedEmbeddings(Embeddings):
+    """Embeddings that batch concurrent query embeddings into a single encode.
+
+    Each `embed_query` call is queued; a worker thread collects the calls arriving
+    within `window_ms` of the first one, up to `max_batch_size`, encodes them in one
+    forward pass and hands each caller its vector. Under concurrent load this
+    replaces many single-sentence passes with a few batched ones; a lone query
+    waits at most `window_ms` more than before.
+
+    Queries are encoded with the model's `embed_documents`, so models with
+    query-specific encode kwargs are not batched. `embed_documents` calls are
+    already batched and go straight to the model.
+
+    Args:
+        model (Embeddings): The embedding model to batch queries for.
+        window_ms (float): Time to wait for more queries after the first one.
+        max_batch_size (int): Maximum queries encoded together.
+
+    Attributes:
+        batches (int): Batched encodes run so far.
+        queries (int): Queries embedded through the batches so far.
+    """
+
+    def __init__(self, model: Embeddings, window_ms: float = 5.0, max_batch_size: int = 32) -> None:
+        self.model = model
+        self.window_ms = window_ms
+        self.max_batch_size = max_batch_size
+        self.batches = 0
+        self.queries = 0
+
+        self._queue: queue.SimpleQueue = queue.SimpleQueue()
+        self._worker: threading.Thread | None = None
+        self._worker_lock = threading.Lock()
+        self._batch_queries = not getattr(model, "query_encode_kwargs", None)
+
+    def embed_documents(self, texts: list[str]) -> list[list[float]]:
+        return self.model.embed_documents(texts)
+
+    def embed_query(self, text: str) -> list[float]:
+        if not self._batch_queries:
+            return self.model.embed_query(text)
+
+        return self._submit(text).result()
+
+    async def aembed_query(self, text: str) -> list[float]:
+        if not self._batch_queries:
+            return await asyncio.to_thread(self.model.embed_query, text)
+
+        return await asyncio.wrap_future(self._submit(text))
+
+    @property
+    def mean_batch_size(self) -> float:
+        return self.queries / self.batches if self.batches else 0.0
+
+    def close(self) -> None:
+        """Stop the worker thread once the queued queries are embedded."""
+        with self._worker_lock:
+            if self._worker is not None:
+                self._queue.put(_STOP)
+                self._worker.join()
+                self._worker = None
+
+    def _submit(self, text: str) -> Future:
+        future: Future = Future()
+        with self._worker_lock:
+            if self._worker is None:
+                self._worker = threading.Thread(
+                    target=self._run, name="embedding-micro-batcher", daemon=True
+                )
+                self._worker.start()
+            self._queue.put((text, future))
+
+        return future
+
+    def _collect_batch(self, first) -> tuple[list, bool]:
+        batch = [first]
+        deadline = time.monotonic() + self.window_ms / 1000
+        while len(batch) < self.max_batch_size:
+            timeout = deadline - time.monotonic()
+            if timeout <= 0:
+                break
+            try:
+                item = self._queue.get(timeout=timeout)
+            except queue.Empty:
+                break
+            if item is _STOP:
+                return batch, True
+            batch.append(item)
+
+        return batch, False
+
+    def _run(self) -> None:
+        stop = False
+        while not stop:
+            item = self._queue.get()
+            if item is _STOP:
+                break
+
+            batch, stop = self._collect_batch(item)
+            texts = [text for text, _ in batch]
+            try:
+                vectors = self.model.embed_documents(texts)
+            except Exception as e:
+                logger.error(f"Error embedding a batch of {len(texts)} queries: {e}")
+                for _, future in batch:
+                    future.set_exception(e)
+                continue
+
+            self.batches += 1
+            self.queries += len(texts)
+            for (_, future), vector in zip(batch, vectors):
+                future.set_result(vector)
+
+
+# One batcher per model and device, so concurrent retrievers share their batches.
+_batchers: dict[tuple[str, str], MicroBatchedEmbeddings] = {}
+_batchers_lock = threading.Lock()
+
+
+def get_batched_embedding_model(
+    model_id: str,
+    device: str = "cpu",
+    window_ms: float = 5.0,
+    max_batch_size: int = 32,
+) -> MicroBatchedEmbeddings:
+    """Gets the shared micro-batcher of an embedding model.
+
+    The window and batch size of the first call for a model are kept for the
+    lifetime of the process.
+
+    Args:
+        model_id (str): The ID/name of the HuggingFace embedding model to use
+        device (str): The compute device to run the model on (e.g. "cpu", "cuda").
+        window_ms (float): Time to wait for more queries after the first one.
+        max_batch_size (int): Maximum queries encoded together.
+
+    Returns:
+        MicroBatchedEmbeddings: The shared batcher wrapping the shared model.
+    """
+    model = get_embedding_model(model_id, device)
+    with _batchers_lock:
+        batcher = _batchers.setdefault(
+            (model_id, device), MicroBatchedEmbeddings(model, window_ms, max_batch_size)
+        )
+
+    return batcher
@@ -0,0 +1,202 @@
+import hashlib
+import json
+import re
+import threading
+from pathlib import Path
+
+import numpy as np
+from langchain_core.embeddings import Embeddings
+from loguru import logger
+
+_DIGEST_SIZE = hashlib.sha256().digest_size
+
+
+class EmbeddingCache:
+    """Persistent store of embeddings keyed by the SHA-256 of the embedded text.
+
+    Each model gets its own directory holding three files:
+    - `vectors.bin`: the vectors, one row per text, read through a memory map.
+    - `keys.bin`: the SHA-256 digest of each row's text, in row order.
+    - `meta.json`: the model ID, vector dimension and dtype.
+
+    Rows are only appended, vectors before keys, so a write interrupted midway
+    leaves at worst a vector without a key, which is ignored on the next open. The
+    cache is meant for a single writing process at a time.
+
+    Args:
+        directory (Path | str): Root directory of the cache.
+        model_id (str): The embedding model the vectors come from.
+        dtype (str): Storage dtype of the vectors, "float32" or "float16".
+    """
+
+    def __init__(self, directory: Path | str, model_id: str, dtype: str = "float32") -> None:
+        self.model_id = model_id
+        self.dtype = np.dtype(dtype)
+        self.path = Path(directory) / re.sub(r"[^A-Za-z0-9_.-]", "_", model_id)
+        self.path.mkdir(parents=True, exist_ok=True)
+
+        self._vectors_path = self.path / "vectors.bin"
+        self._keys_path = self.path / "keys.bin"
+        self._meta_path = self.path / "meta.json"
+        self._lock = threading.Lock()
+        self._rows: dict[bytes, int] = {}
+        self._dim: int | None = None
+        self._vectors: np.memmap | None = None
+
+        self._load()
+
+    def __len__(self) -> int:
+        return len(self._rows)
+
+    def get_many(self, digests: list[bytes]) -> list[list[float] | None]:
+        """Get the cached vectors of texts by digest, or None for texts not cached."""
+        with self._lock:
+            rows = [self._rows.get(digest) for digest in digests]
+            vectors = self._memmap()
+
+            return [
+                vectors[row].astype(np.float32).tolist() if row is not None else None
+                for row in rows
+            ]
+
+    def put_many(self, digests: list[bytes], vectors: list[list[float]]) -> None:
+        """Append the vectors of texts not cached yet."""
+        with self._lock:
+            new = {}
+            for digest, vector in zip(digests, vectors):
+                if digest not in self._rows:
+                    new[digest] = vector
+            if not new:
+                return
+
+            array = np.asarray(list(new.values()), dtype=self.dtype)
+            if self._dim is None:
+                self._dim = array.shape[1]
+                self._meta_path.write_text(
+                    json.dumps({"model_id": self.model_id, "dim": self._dim, "dtype": self.dtype.name})
+                )
+
+            with open(self._vectors_path, "ab") as vectors_file:
+                vectors_file.write(array.tobytes())
+            with open(self._keys_path, "ab") as keys_file:
+                keys_file.write(b"".join(new))
+
+            for digest in new:
+                self._rows[digest] = len(self._rows)
+            self._vectors = None
+
+    def _load(self) -> None:
+        if not self._meta_path.exists():
+            self._reset()
+            return
+
+        meta = json.loads(self._meta_path.read_text())
+        if meta.get("model_id") != self.model_id or meta.get("dtype") != self.dtype.name:
+            logger.warning(f"Embedding cache at {self.path} was written with other settings, resetting it")
+            self._reset()
+            return
+        if not self._vectors_path.exists() or not self._keys_path.exists():
+            logger.warning(f"Embedding cache at {self.path} is missing its data files, resetting it")
+            self._reset()
+            return
+
+        self._dim = meta["dim"]
+        keys = self._keys_path.read_bytes()
+        vector_rows = self._vectors_path.stat().st_size // (self._dim * self.dtype.itemsize)
+        rows = min(len(keys) // _DIGEST_SIZE, vector_rows)
+
+        # Drop the tail of an interrupted append so new rows stay aligned.
+        with open(self._vectors_path, "r+b") as vectors_file:
+            vectors_file.truncate(rows * self._dim * self.dtype.itemsize)
+        with open(self._keys_path, "r+b") as keys_file:
+            keys_file.truncate(rows * _DIGEST_SIZE)
+
+        self._rows = {
+            keys[row * _DIGEST_SIZE : (row + 1) * _DIGEST_SIZE]: row for row in range(rows)
+        }
+        logger.info(f"Loaded embedding cache | model: {self.model_id} | vectors: {rows}")
+
+    def _reset(self) -> None:
+        for path in (self._vectors_path, self._keys_path, self._meta_path):
+            path.unlink(missing_ok=True)
+        self._vectors_path.touch()
+        self._keys_path.touch()
+        self._rows = {}
+        self._dim = None
+
+    def _memmap(self) -> np.memmap | None:
+        if self._vectors is None and self._rows:
+            self._vectors = np.memmap(
+                self._vectors_path, dtype=self.dtype, mode="r", shape=(len(self._rows), self._dim)
+            )
+
+        return self._vectors
+
+
+class CachedEmbeddings(Embeddings):
+    """Embeddings that reuse cached document vectors instead of re-embedding them.
+
+    `embed_documents` looks every text up in the cache by content hash and only
+    sends the missing ones to the model, in a single call. Queries are not cached.
+
+    Args:
+        model (Embeddings): The embedding model to cache vectors of.
+        cache (EmbeddingCache): The cache of this model's vectors.
+
+    Attributes:
+        hits (int): Texts served from the cache so far.
+        misses (int): Texts embedded by the model so far.
+    """
+
+    def __init__(self, model: Embeddings, cache: EmbeddingCache) -> None:
+        self.model = model
+        self.cache = cache
+        self.hits = 0
+        self.misses = 0
+
+    def embed_documents(self, texts: list[str]) -> list[list[float]]:
+        digests = [hashlib.sha256(text.encode("utf-8")).digest() for text in texts]
+        vectors = self.cache.get_many(digests)
+
+        missing = [index for index, vector in enumerate(vectors) if vector is None]
+        if missing:
+            embedded = self.model.embed_documents([texts[index] for index in missing])
+            self.cache.put_many([digests[index] for index in missing], embedded)
+            for index, vector in zip(missing, embedded):
+                vectors[index] = vector
+
+        self.hits += len(texts) - len(missing)
+        self.misses += len(missing)
+
+        return vectors
+
+    def embed_query(self, text: str) -> list[float]:
+        return self.model.embed_query(text)
+
+    async def aembed_query(self, text: str) -> list[float]:
+        return await self.model.aembed_query(text)
+
+
+# One cache per directory and model, so every writer in the process shares its lock.
+_caches: dict[tuple[Path, str, str], EmbeddingCache] = {}
+_caches_lock = threading.Lock()
+
+
+def get_embedding_cache(directory: Path | str, model_id: str, dtype: str = "float32") -> EmbeddingCache:
+    """Gets the shared embedding cache of a model.
+
+    Args:
+        directory (Path | str): Root directory of the cache.
+        model_id (str): The embedding model the vectors come from.
+        dtype (str): Storage dtype of the vectors, "float32" or "float16".
+
+    Returns:
+        EmbeddingCache: The cache, loaded from disk on first use.
+    """
+    key = (Path(directory).resolve(), model_id, dtype)
+    with _caches_lock:
+        cache = _caches.get(key)
+        if cache is None:
+            cache = _caches[key] = EmbeddingCache(directory, model_id, dtype)
+
+    return cache
@@ -1,13 +1,54 @@
+import os
+import threading
+import time
+
 from langchain_huggingface import HuggingFaceEmbeddings
+from loguru import logger
+from pydantic import BaseModel
 
 EmbeddingsModel = HuggingFaceEmbeddings
 
 
+class EmbeddingModelStats(BaseModel):
+    """Cost of loading an embedding model.
+
+    Attributes:
+        model_id (str): The ID/name of the embedding model.
+        device (str): The compute device the model runs on.
+        load_seconds (float): Time taken to load the model.
+        rss_delta_bytes (int, optional): Growth of the process resident memory while
+            loading, if it can be measured. Approximate when models load concurrently.
+    """
+
+    model_id: str
+    device: str
+    load_seconds: float
+    rss_delta_bytes: int | None = None
+
+
+# Each (model_id, device) is loaded once per process and shared by every caller.
+_models: dict[tuple[str, str], EmbeddingsModel] = {}
+_model_stats: dict[tuple[str, str], EmbeddingModelStats] = {}
+_load_locks: dict[tuple[str, str], threading.Lock] = {}
+_registry_lock = threading.Lock()
+
+
+def _resident_memory_bytes() -> int | None:
+    try:
+        with open("/proc/self/statm") as statm:
+            return int(statm.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+    except (OSError, ValueError, IndexError):
+        return None
+
+
 def get_embedding_model(
     model_id: str,
     device: str = "cpu",
 ) -> EmbeddingsModel:
-    """Gets an instance of a HuggingFace embedding model.
+    """Gets the shared instance of a HuggingFace embedding model.
+
+    The model is loaded on first use and reused by every later call with the same
+    model and device. Loading is thread-safe: concurrent first calls load it once.
 
     Args:
         model_id (str): The ID/name of the HuggingFace embedding model to use
@@ -17,7 +58,63 @@ def get_embedding_model(
     Returns:
         EmbeddingsModel: A configured HuggingFace embeddings model instance
     """
-    return get_huggingface_embedding_model(model_id, device)
+    key = (model_id, device)
+    model = _models.get(key)
+    if model is not None:
+        return model
+
+    with _registry_lock:
+        load_lock = _load_locks.setdefault(key, threading.Lock())
+
+    with load_lock:
+        model = _models.get(key)
+        if model is not None:
+            return model
+
+        rss_before = _resident_memory_bytes()
+        start = time.perf_counter()
+        model = get_huggingface_embedding_model(model_id, device)
+        load_seconds = time.perf_counter() - start
+        rss_after = _resident_memory_bytes()
+
+        stats = EmbeddingModelStats(
+            model_id=model_id,
+            device=device,
+            load_seconds=load_seconds,
+            rss_delta_bytes=rss_after - rss_before if rss_before is not None and rss_after is not None else None,
+        )
+        rss = f"{stats.rss_delta_bytes / 1e6:.0f} MB" if stats.rss_delta_bytes is not None else "unknown"
+        logger.info(
+            f"Loaded embedding model | model: {model_id} | device: {device} | load time: {load_seconds:.2f}s | resident memory: +{rss}"
+        )
+
+        _model_stats[key] = stats
+        _models[key] = model
+
+    return model
+
+
+def warm_up_embedding_models(models: list[tuple[str, str]]) -> list[EmbeddingModelStats]:
+    """Load embedding models ahead of their first use, e.g. at startup.
+
+    Each model also embeds a short text, so lazily initialized weights and kernels
+    are ready before the first request.
+
+    Args:
+        models (list[tuple[str, str]]): The (model_id, device) pairs to load.
+
+    Returns:
+        list[EmbeddingModelStats]: The load cost of each model.
+    """
+    for model_id, device in models:
+        get_embedding_model(model_id, device).embed_query("warm up")
+
+    return [_model_stats[key] for key in models if key in _model_stats]
+
+
+def get_embedding_model_stats() -> list[EmbeddingModelStats]:
+    """Get the load cost of the embedding models loaded in this process."""
+    return list(_model_stats.values())
 
 
 def get_huggingface_embedding_model(
@@ -25,6 +122,9 @@ def get_huggingface_embedding_model(
 ) -> HuggingFaceEmbeddings:
     """Gets a HuggingFace embedding model instance.
 
+    Loads the model weights on every call; use `get_embedding_model` for the
+    shared instance.
+
     Args:
         model_id (str): The ID/name of the HuggingFace embedding model to use
         device (str): The compute device to run the model on (e.g. "cpu", "cuda")
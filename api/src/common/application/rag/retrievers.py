@@ -1,10 +1,14 @@
-from langchain_huggingface import HuggingFaceEmbeddings
+from pathlib import Path
+
+from langchain_core.embeddings import Embeddings
 from langchain_mongodb import MongoDBAtlasVectorSearch
 from langchain_mongodb.retrievers import (
     MongoDBAtlasHybridSearchRetriever,
 )
 from loguru import logger
 
+from .batching import get_batched_embedding_model
+from .embedding_cache import CachedEmbeddings, get_embedding_cache
 from .embeddings import get_embedding_model
 
 Retriever = MongoDBAtlasHybridSearchRetriever
@@ -17,6 +21,10 @@ def get_retriever(
     collection_name: str,
     k: int = 3,
     device: str = "cpu",
+    embedding_batch_window_ms: float = 0.0,
+    embedding_max_batch_size: int = 1,
+    embedding_cache_dir: Path | None = None,
+    embedding_cache_dtype: str = "float32",
 ) -> Retriever:
     """Creates and returns a hybrid search retriever with the specified embedding model.
 
@@ -27,6 +35,15 @@ def get_retriever(
         collection_name (str): Collection name for long-term memory.
         k (int, optional): Number of documents to retrieve. Defaults to 3.
         device (str, optional): Device to run the embedding model on. Defaults to "cpu".
+        embedding_batch_window_ms (float, optional): Time concurrent query embeddings
+            wait to be batched together. Defaults to 0.
+        embedding_max_batch_size (int, optional): Maximum query embeddings batched
+            together. Defaults to 1, which disables batching.
+        embedding_cache_dir (Path, optional): Directory of the persistent cache of
+            document embeddings, reused when the same chunks are added again.
+            Defaults to None, which disables the cache.
+        embedding_cache_dtype (str, optional): Storage dtype of cached embeddings.
+            Defaults to "float32".
 
     Returns:
         Retriever: A configured hybrid search retriever.
@@ -35,7 +52,18 @@ def get_retriever(
         f"Initializing retriever | model: {embedding_model_id} | device: {device} | top_k: {k}"
     )
 
-    embedding_model = get_embedding_model(embedding_model_id, device)
+    if embedding_max_batch_size > 1:
+        embedding_model = get_batched_embedding_model(
+            embedding_model_id, device, embedding_batch_window_ms, embedding_max_batch_size
+        )
+    else:
+        embedding_model = get_embedding_model(embedding_model_id, device)
+
+    if embedding_cache_dir is not None:
+        embedding_model = CachedEmbeddings(
+            embedding_model,
+            get_embedding_cache(embedding_cache_dir, embedding_model_id, embedding_cache_dtype),
+        )
 
     return get_hybrid_search_retriever(
         embedding_model, k, mongo_uri, db_name, collection_name
@@ -43,7 +71,7 @@ def get_retriever(
 
 
 def get_hybrid_search_retriever(
-    embedding_model: HuggingFaceEmbeddings, 
+    embedding_model: Embeddings, 
     k: int,
     mongo_uri: str,
     db_name: str,
@@ -52,7 +80,7 @@ def get_hybrid_search_retriever(
     """Creates a MongoDB Atlas hybrid search retriever with the given embedding model.
 
     Args:
-        embedding_model (HuggingFaceEmbeddings): The embedding model to use for vector search.
+        embedding_model (Embeddings): The embedding model to use for vector search.
         k (int): Number of documents to retrieve.
         mongo_uri (str): MongoDB connection URI.
         db_name (str): Database name.
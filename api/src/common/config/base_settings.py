@@ -14,6 +14,14 @@ class BaseAgentSettings(BaseSettings):
     GROQ_API_KEY: str
     GROQ_LLM_MODEL: str = "llama-3.3-70b-versatile"
     GROQ_LLM_MODEL_CONTEXT_SUMMARY: str = "llama-3.1-8b-instant"
+    GROQ_HTTP_MAX_CONNECTIONS: int = Field(
+        default=100,
+        description="Maximum number of connections in the shared Groq HTTP pool.",
+    )
+    GROQ_HTTP_MAX_KEEPALIVE_CONNECTIONS: int = Field(
+        default=20,
+        description="Idle connections kept alive in the shared Groq HTTP pool.",
+    )
     
     # --- OpenAI Configuration (Required for evaluation) ---
     OPENAI_API_KEY: str
@@ -44,3 +52,23 @@ class BaseAgentSettings(BaseSettings):
     RAG_TOP_K: int = 3
     RAG_DEVICE: str = "cpu"
     RAG_CHUNK_SIZE: int = 256
+    RAG_EMBEDDING_BATCH_WINDOW_MS: float = Field(
+        default=5.0,
+        description="Time concurrent query embeddings wait to be encoded in one batch.",
+    )
+    RAG_EMBEDDING_MAX_BATCH_SIZE: int = Field(
+        default=32,
+        description="Maximum query embeddings encoded in one batch. 1 disables batching.",
+    )
+    RAG_WARM_UP_EMBEDDING_MODEL: bool = Field(
+        default=False,
+        description="Load the embedding model at API startup instead of on first use.",
+    )
+    RAG_EMBEDDING_CACHE_DIR: Path | None = Field(
+        default=Path("data/embedding_cache"),
+        description="Directory of the chunk embedding cache used when ingesting long-term memory. None disables it.",
+    )
+    RAG_EMBEDDING_CACHE_DTYPE: str = Field(
+        default="float32",
+        description="Storage dtype of cached embeddings, float32 or float16.",
+    )
@@ -1 +1,24 @@
 # MongoDB infrastructure components
+from .aliases import resolve_collection_alias, swap_collection_alias
+from .async_client import (
+    AsyncMongoClientWrapper,
+    close_async_mongo_clients,
+    get_async_mongo_client,
+)
+from .client import MongoClientWrapper, close_mongo_clients, get_mongo_client
+from .indexes import MongoIndex
+from .ingest import IngestChunkError, IngestReport
+
+__all__ = [
+    "AsyncMongoClientWrapper",
+    "IngestChunkError",
+    "IngestReport",
+    "MongoClientWrapper",
+    "MongoIndex",
+    "close_async_mongo_clients",
+    "close_mongo_clients",
+    "get_async_mongo_client",
+    "get_mongo_client",
+    "resolve_collection_alias",
+    "swap_collection_alias",
+]
@@ -0,0 +1,43 @@
+from pymongo import ReturnDocument
+from pymongo.database import Database
+
+ALIASES_COLLECTION = "collection_aliases"
+
+
+def resolve_collection_alias(database: Database, alias: str) -> str:
+    """Get the collection an alias points to.
+
+    Args:
+        database (Database): The database holding the alias.
+        alias (str): The alias, i.e. the logical collection name.
+
+    Returns:
+        str: The aliased collection, or the alias itself if it was never swapped.
+    """
+    document = database[ALIASES_COLLECTION].find_one({"_id": alias})
+
+    return document["collection"] if document else alias
+
+
+def swap_collection_alias(database: Database, alias: str, collection_name: str) -> str:
+    """Point an alias to another collection.
+
+    The alias is a single document updated in one write, so readers resolve either
+    the previous or the new collection, never anything in between.
+
+    Args:
+        database (Database): The database holding the alias.
+        alias (str): The alias, i.e. the logical collection name.
+        collection_name (str): The collection the alias should point to.
+
+    Returns:
+        str: The collection the alias pointed to before the swap.
+    """
+    previous = database[ALIASES_COLLECTION].find_one_and_update(
+        {"_id": alias},
+        [{"$set": {"collection": collection_name, "previous": "$collection", "updated_at": "$$NOW"}}],
+        upsert=True,
+        return_document=ReturnDocument.BEFORE,
+    )
+
+    return previous["collection"] if previous else alias
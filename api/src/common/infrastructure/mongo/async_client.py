@@ -0,0 +1,289 @@
+import asyncio
+import time
+from typing import AsyncIterator, Generic, Iterable, Type
+from weakref import WeakKeyDictionary
+
+from bson import ObjectId
+from loguru import logger
+from motor.motor_asyncio import AsyncIOMotorClient
+from pymongo import errors
+
+from .client import READ_CODEC_OPTIONS, T, _parse_documents, _scan_query
+from .ingest import IngestReport, chunk_report, iter_chunks, to_write_operations
+
+# One client per cluster and app name for each event loop, as Motor clients are
+# bound to the loop they are first used on.
+_async_clients: "WeakKeyDictionary[asyncio.AbstractEventLoop, dict[tuple[str, str], AsyncIOMotorClient]]" = (
+    WeakKeyDictionary()
+)
+
+
+def get_async_mongo_client(mongodb_uri: str, app_name: str = "ai_agents") -> AsyncIOMotorClient:
+    """Get the shared async MongoDB client of a cluster for the running event loop.
+
+    Args:
+        mongodb_uri (str): URI for connecting to MongoDB instance.
+        app_name (str): Application name for MongoDB connection.
+
+    Returns:
+        AsyncIOMotorClient: The shared client.
+    """
+    loop_clients = _async_clients.setdefault(asyncio.get_running_loop(), {})
+    key = (mongodb_uri, app_name)
+
+    client = loop_clients.get(key)
+    if client is None:
+        client = AsyncIOMotorClient(mongodb_uri, appname=app_name)
+        loop_clients[key] = client
+        logger.debug(f"Created async MongoDB client for app {app_name}")
+
+    return client
+
+
+def close_async_mongo_clients() -> None:
+    """Close the shared async MongoDB clients of the running event loop, e.g. on shutdown."""
+    for client in _async_clients.pop(asyncio.get_running_loop(), {}).values():
+        client.close()
+
+
+class AsyncMongoClientWrapper(Generic[T]):
+    """Async counterpart of `MongoClientWrapper`, built on Motor.
+
+    Offers the same document ingestion, querying and validation operations without
+    blocking the event loop, plus async iteration over query results. The client is
+    shared per cluster and event loop (see `get_async_mongo_client`), so wrappers are
+    cheap to create and closing one leaves the shared pool open. Must be created
+    inside a running event loop.
+
+    Args:
+        model (Type[T]): The Pydantic model class to use for document serialization.
+        collection_name (str): Name of the MongoDB collection to use.
+        database_name (str): Name of the MongoDB database to use.
+        mongodb_uri (str): URI for connecting to MongoDB instance.
+        app_name (str, optional): Application name for MongoDB connection.
+        trusted (bool, optional): Whether read documents skip validation. Only for
+            collections written by this application.
+
+    Attributes:
+        model (Type[T]): The Pydantic model class used for document serialization.
+        collection_name (str): Name of the MongoDB collection.
+        database_name (str): Name of the MongoDB database.
+        client (AsyncIOMotorClient): Shared async MongoDB client instance.
+        database (AsyncIOMotorDatabase): Reference to the target MongoDB database.
+        collection (AsyncIOMotorCollection): Reference to the target MongoDB collection.
+    """
+
+    def __init__(
+        self,
+        model: Type[T],
+        collection_name: str,
+        database_name: str,
+        mongodb_uri: str,
+        app_name: str = "ai_agents",
+        trusted: bool = False,
+    ) -> None:
+        self.model = model
+        self.collection_name = collection_name
+        self.database_name = database_name
+        self.trusted = trusted
+
+        self.client = get_async_mongo_client(mongodb_uri, app_name)
+        self.database = self.client[database_name]
+        self.collection = self.database[collection_name]
+        self._read_collection = self.collection.with_options(codec_options=READ_CODEC_OPTIONS)
+
+    async def __aenter__(self) -> "AsyncMongoClientWrapper":
+        """Enable async context manager support.
+
+        Returns:
+            AsyncMongoClientWrapper: The current instance.
+        """
+
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        """Release the shared client when exiting context."""
+
+        self.close()
+
+    async def ping(self) -> None:
+        """Check the connection to MongoDB.
+
+        Raises:
+            Exception: If MongoDB cannot be reached.
+        """
+
+        await self.client.admin.command("ping")
+
+    async def clear_collection(self) -> None:
+        """Remove all documents from the collection.
+
+        Raises:
+            errors.PyMongoError: If the deletion operation fails.
+        """
+
+        try:
+            result = await self.collection.delete_many({})
+            logger.debug(
+                f"Cleared collection. Deleted {result.deleted_count} documents."
+            )
+        except errors.PyMongoError as e:
+            logger.error(f"Error clearing the collection: {e}")
+            raise
+
+    async def ingest_documents(
+        self,
+        documents: Iterable[T],
+        chunk_size: int = 1000,
+        concurrency: int = 4,
+        upsert_on: list[str] | None = None,
+        content_hash_ids: bool = True,
+    ) -> IngestReport:
+        """Insert documents into the MongoDB collection in parallel, unordered chunks.
+
+        Async counterpart of `MongoClientWrapper.ingest_documents`.
+
+        Args:
+            documents: Pydantic model instances to insert.
+            chunk_size: Documents per bulk write.
+            concurrency: Maximum bulk writes in flight.
+            upsert_on: Fields identifying a document, to upsert on instead of inserting.
+            content_hash_ids: Whether inserted documents get a content hash `_id`.
+
+        Returns:
+            IngestReport: Counts, per-chunk errors and throughput of the ingestion.
+
+        Raises:
+            ValueError: If a chunk is empty or contains non-Pydantic model items.
+        """
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def write_chunk(chunk_index: int, chunk: list[T]) -> IngestReport:
+            try:
+                operations, size = to_write_operations(chunk, upsert_on, content_hash_ids)
+                try:
+                    result = await self.collection.bulk_write(operations, ordered=False)
+                except errors.PyMongoError as e:
+                    return chunk_report(chunk_index, operations, size, error=e)
+
+                return chunk_report(chunk_index, operations, size, result=result)
+            finally:
+                semaphore.release()
+
+        report = IngestReport()
+        start = time.perf_counter()
+        tasks = []
+        for chunk_index, chunk in enumerate(iter_chunks(documents, chunk_size)):
+            await semaphore.acquire()
+            tasks.append(asyncio.create_task(write_chunk(chunk_index, chunk)))
+
+        for chunk in await asyncio.gather(*tasks):
+            report.add(chunk)
+        report.seconds = time.perf_counter() - start
+
+        for chunk_error in report.chunk_errors:
+            logger.error(f"Error inserting chunk {chunk_error.chunk}: {chunk_error.message}")
+        logger.debug(
+            f"Ingested {report.documents} documents into MongoDB | inserted: {report.inserted} | "
+            f"upserted: {report.upserted} | unchanged: {report.unchanged} | failed: {report.failed} | "
+            f"{report.docs_per_second:.0f} docs/s | {report.bytes_per_second / 1e6:.2f} MB/s"
+        )
+
+        return report
+
+    async def fetch_documents(self, limit: int, query: dict) -> list[T]:
+        """Retrieve documents from the MongoDB collection based on a query.
+
+        Args:
+            limit (int): Maximum number of documents to retrieve.
+            query (dict): MongoDB query filter to apply.
+
+        Returns:
+            list[T]: List of Pydantic model instances matching the query criteria.
+
+        Raises:
+            Exception: If the query operation fails.
+        """
+        try:
+            documents = await self._read_collection.find(query).limit(limit).to_list(length=None)
+            logger.debug(f"Fetched {len(documents)} documents with query: {query}")
+            return _parse_documents(self.model, documents, self.trusted)
+        except Exception as e:
+            logger.error(f"Error fetching documents: {e}")
+            raise
+
+    async def iter_documents(
+        self,
+        query: dict | None = None,
+        batch_size: int = 1000,
+        projection: dict | None = None,
+        sort: list[tuple[str, int]] | None = None,
+        after_id: str | ObjectId | None = None,
+        limit: int = 0,
+    ) -> AsyncIterator[T]:
+        """Iterate over the documents matching a query with constant memory.
+
+        Async counterpart of `MongoClientWrapper.iter_documents`.
+
+        Args:
+            query (dict, optional): MongoDB query filter to apply.
+            batch_size (int, optional): Documents fetched and validated at a time.
+            projection (dict, optional): Fields to return; the model must accept them.
+            sort (list[tuple[str, int]], optional): Sort of the scan.
+            after_id (str | ObjectId, optional): Only yield documents after this ID.
+            limit (int, optional): Maximum number of documents to yield. 0 means no limit.
+
+        Yields:
+            T: Pydantic model instances matching the query criteria.
+
+        Raises:
+            ValueError: If `after_id` is combined with a sort on another field.
+        """
+        query, sort = _scan_query(query, sort, after_id)
+        cursor = self._read_collection.find(query, projection, batch_size=batch_size, limit=limit)
+        if sort:
+            cursor = cursor.sort(sort)
+
+        try:
+            batch = []
+            async for document in cursor:
+                batch.append(document)
+                if len(batch) >= batch_size:
+                    for parsed in _parse_documents(self.model, batch, self.trusted):
+                        yield parsed
+                    batch = []
+
+            for parsed in _parse_documents(self.model, batch, self.trusted):
+                yield parsed
+        finally:
+            await cursor.close()
+
+    def __aiter__(self) -> AsyncIterator[T]:
+        """Iterate over every document of the collection."""
+
+        return self.iter_documents()
+
+    async def get_collection_count(self) -> int:
+        """Count the total number of documents in the collection.
+
+        Returns:
+            Total number of documents in the collection.
+
+        Raises:
+            errors.PyMongoError: If the count operation fails.
+        """
+
+        try:
+            return await self.collection.count_documents({})
+        except errors.PyMongoError as e:
+            logger.error(f"Error counting documents in MongoDB: {e}")
+            raise
+
+    def close(self) -> None:
+        """Release the wrapper's handle on the shared MongoDB client.
+
+        The client stays open for other wrappers; it is closed by
+        `close_async_mongo_clients`.
+        """
+
+        self.client = self.database = self.collection = self._read_collection = None
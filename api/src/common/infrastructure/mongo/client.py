@@ -1,12 +1,141 @@
-from typing import Generic, Type, TypeVar
+import os
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from functools import lru_cache
+from typing import Generic, Iterable, Iterator, Type, TypeVar
 
 from bson import ObjectId
+from bson.codec_options import CodecOptions, TypeDecoder, TypeRegistry
 from loguru import logger
-from pydantic import BaseModel
-from pymongo import MongoClient, errors
+from pydantic import BaseModel, TypeAdapter
+from pymongo import ASCENDING, MongoClient, errors
+
+from .ingest import IngestReport, chunk_report, iter_chunks, to_write_operations
 
 T = TypeVar("T", bound=BaseModel)
 
+# One client, and so one connection pool, per cluster and app name in a process.
+_clients: dict[tuple[str, str], MongoClient] = {}
+_clients_pid = os.getpid()
+_clients_lock = threading.Lock()
+
+
+def get_mongo_client(mongodb_uri: str, app_name: str = "ai_agents", ping: bool = False) -> MongoClient:
+    """Get the process-wide MongoDB client of a cluster, creating it on first use.
+
+    Clients are shared by every caller with the same URI and app name. A client is
+    not fork-safe, so a forked process creates its own clients.
+
+    Args:
+        mongodb_uri (str): URI for connecting to MongoDB instance.
+        app_name (str): Application name for MongoDB connection.
+        ping (bool): Whether to check the connection with a ping.
+
+    Returns:
+        MongoClient: The shared client.
+
+    Raises:
+        Exception: If the ping fails.
+    """
+    global _clients_pid
+
+    key = (mongodb_uri, app_name)
+    with _clients_lock:
+        if _clients_pid != os.getpid():
+            _clients.clear()
+            _clients_pid = os.getpid()
+
+        client = _clients.get(key)
+        if client is None:
+            client = MongoClient(mongodb_uri, appname=app_name)
+            _clients[key] = client
+            logger.debug(f"Created MongoDB client for app {app_name}")
+
+    if ping:
+        client.admin.command("ping")
+
+    return client
+
+
+def close_mongo_clients() -> None:
+    """Close every shared MongoDB client, e.g. on shutdown.
+
+    Clients requested afterwards are created again.
+    """
+    with _clients_lock:
+        clients = list(_clients.values())
+        _clients.clear()
+
+    for client in clients:
+        client.close()
+
+
+class _ObjectIdAsStrDecoder(TypeDecoder):
+    bson_type = ObjectId
+
+    def transform_bson(self, value: ObjectId) -> str:
+        return str(value)
+
+
+# Reads decode ObjectIds as strings in the driver, at any depth of the documents.
+READ_CODEC_OPTIONS = CodecOptions(type_registry=TypeRegistry([_ObjectIdAsStrDecoder()]))
+
+
+@lru_cache(maxsize=None)
+def _list_adapter(model: Type[T]) -> TypeAdapter:
+    return TypeAdapter(list[model])
+
+
+def _parse_documents(model: Type[T], documents: list[dict], trusted: bool = False) -> list[T]:
+    """Convert MongoDB documents to Pydantic model instances.
+
+    Expects documents read with `READ_CODEC_OPTIONS`, so ObjectIds are already
+    strings; only `_id` is renamed to `id`. The documents are validated in a single
+    call to a `TypeAdapter(list[model])` cached per model, or built without
+    validation if they are trusted.
+
+    Args:
+        model (Type[T]): The Pydantic model class to validate the documents with.
+        documents (list[dict]): List of MongoDB documents to parse.
+        trusted (bool): Whether to skip validation and build the models with
+            `model_construct`. Only for collections written by this application;
+            it pays off for models with costly validators, as compiled validation
+            of plain models is about as fast.
+
+    Returns:
+        list[T]: List of Pydantic model instances.
+    """
+    for doc in documents:
+        doc["id"] = doc.pop("_id", None)
+
+    if trusted:
+        return [model.model_construct(**doc) for doc in documents]
+
+    return _list_adapter(model).validate_python(documents)
+
+
+def _scan_query(
+    query: dict | None,
+    sort: list[tuple[str, int]] | None,
+    after_id: str | ObjectId | None,
+) -> tuple[dict, list[tuple[str, int]] | None]:
+    """Build the filter and sort of a scan resuming after a document ID.
+
+    Raises:
+        ValueError: If a scan resuming after an ID is sorted by another field.
+    """
+    query = query or {}
+    if after_id is None:
+        return query, sort
+
+    if sort and sort != [("_id", ASCENDING)]:
+        raise ValueError("Resuming after an ID requires sorting by _id.")
+    if isinstance(after_id, str) and ObjectId.is_valid(after_id):
+        after_id = ObjectId(after_id)
+
+    return {"$and": [query, {"_id": {"$gt": after_id}}]}, [("_id", ASCENDING)]
+
 
 class MongoClientWrapper(Generic[T]):
     """Service class for MongoDB operations, supporting ingestion, querying, and validation.
@@ -19,13 +148,20 @@ class MongoClientWrapper(Generic[T]):
         collection_name (str): Name of the MongoDB collection to use.
         database_name (str, optional): Name of the MongoDB database to use.
         mongodb_uri (str, optional): URI for connecting to MongoDB instance.
+        app_name (str, optional): Application name for MongoDB connection.
+        ping (bool, optional): Whether to check the connection on construction.
+        trusted (bool, optional): Whether read documents skip validation. Only for
+            collections written by this application.
+
+    The client is borrowed from the process-wide registry (see `get_mongo_client`),
+    so wrappers are cheap to create and closing one leaves the shared pool open.
 
     Attributes:
         model (Type[T]): The Pydantic model class used for document serialization.
         collection_name (str): Name of the MongoDB collection.
         database_name (str): Name of the MongoDB database.
         mongodb_uri (str): MongoDB connection URI.
-        client (MongoClient): MongoDB client instance for database connections.
+        client (MongoClient): Shared MongoDB client instance for database connections.
         database (Database): Reference to the target MongoDB database.
         collection (Collection): Reference to the target MongoDB collection.
     """
@@ -37,6 +173,8 @@ class MongoClientWrapper(Generic[T]):
         database_name: str,
         mongodb_uri: str,
         app_name: str = "ai_agents",
+        ping: bool = False,
+        trusted: bool = False,
     ) -> None:
         """Initialize a connection to the MongoDB collection.
 
@@ -46,6 +184,8 @@ class MongoClientWrapper(Generic[T]):
             database_name (str): Name of the MongoDB database to use.
             mongodb_uri (str): URI for connecting to MongoDB instance.
             app_name (str): Application name for MongoDB connection.
+            ping (bool): Whether to check the connection with a ping.
+            trusted (bool): Whether read documents skip validation.
 
         Raises:
             Exception: If connection to MongoDB fails.
@@ -55,19 +195,18 @@ class MongoClientWrapper(Generic[T]):
         self.collection_name = collection_name
         self.database_name = database_name
         self.mongodb_uri = mongodb_uri
+        self.trusted = trusted
 
         try:
-            self.client = MongoClient(mongodb_uri, appname=app_name)
-            self.client.admin.command("ping")
+            self.client = get_mongo_client(mongodb_uri, app_name, ping=ping)
         except Exception as e:
             logger.error(f"Failed to initialize MongoDBService: {e}")
             raise
 
         self.database = self.client[database_name]
         self.collection = self.database[collection_name]
-        logger.info(
-            f"Connected to MongoDB instance:\n URI: {mongodb_uri}\n Database: {database_name}\n Collection: {collection_name}"
-        )
+        self._read_collection = self.collection.with_options(codec_options=READ_CODEC_OPTIONS)
+        logger.debug(f"Using MongoDB collection {database_name}.{collection_name}")
 
     def __enter__(self) -> "MongoClientWrapper":
         """Enable context manager support.
@@ -108,34 +247,73 @@ class MongoClientWrapper(Generic[T]):
             logger.error(f"Error clearing the collection: {e}")
             raise
 
-    def ingest_documents(self, documents: list[T]) -> None:
-        """Insert multiple documents into the MongoDB collection.
+    def ingest_documents(
+        self,
+        documents: Iterable[T],
+        chunk_size: int = 1000,
+        concurrency: int = 4,
+        upsert_on: list[str] | None = None,
+        content_hash_ids: bool = True,
+    ) -> IngestReport:
+        """Insert documents into the MongoDB collection in parallel, unordered chunks.
+
+        Documents are consumed lazily, `chunk_size` at a time, with at most
+        `concurrency` bulk writes in flight. A failed write only fails its own
+        documents; the failures are reported per chunk rather than raised.
+
+        Ingestion is idempotent: by default each document gets the hash of its
+        content as `_id`, so re-ingesting it is reported as unchanged. With
+        `upsert_on`, documents instead replace the stored ones with the same values
+        for these fields.
 
         Args:
-            documents: List of Pydantic model instances to insert.
+            documents: Pydantic model instances to insert.
+            chunk_size: Documents per bulk write.
+            concurrency: Maximum bulk writes in flight.
+            upsert_on: Fields identifying a document, to upsert on instead of inserting.
+            content_hash_ids: Whether inserted documents get a content hash `_id`.
+                If False, MongoDB generates the IDs and re-ingestion duplicates them.
+
+        Returns:
+            IngestReport: Counts, per-chunk errors and throughput of the ingestion.
 
         Raises:
-            ValueError: If documents is empty or contains non-Pydantic model items.
-            errors.PyMongoError: If the insertion operation fails.
+            ValueError: If a chunk is empty or contains non-Pydantic model items.
         """
 
-        try:
-            if not documents or not all(
-                isinstance(doc, BaseModel) for doc in documents
-            ):
-                raise ValueError("Documents must be a list of Pycantic models.")
-
-            dict_documents = [doc.model_dump() for doc in documents]
+        def write_chunk(chunk_index: int, chunk: list[T]) -> IngestReport:
+            operations, size = to_write_operations(chunk, upsert_on, content_hash_ids)
+            try:
+                result = self.collection.bulk_write(operations, ordered=False)
+            except errors.PyMongoError as e:
+                return chunk_report(chunk_index, operations, size, error=e)
+
+            return chunk_report(chunk_index, operations, size, result=result)
+
+        report = IngestReport()
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=concurrency) as executor:
+            pending: set[Future] = set()
+            for chunk_index, chunk in enumerate(iter_chunks(documents, chunk_size)):
+                if len(pending) >= concurrency:
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        report.add(future.result())
+                pending.add(executor.submit(write_chunk, chunk_index, chunk))
+
+            for future in pending:
+                report.add(future.result())
+        report.seconds = time.perf_counter() - start
+
+        for chunk_error in report.chunk_errors:
+            logger.error(f"Error inserting chunk {chunk_error.chunk}: {chunk_error.message}")
+        logger.debug(
+            f"Ingested {report.documents} documents into MongoDB | inserted: {report.inserted} | "
+            f"upserted: {report.upserted} | unchanged: {report.unchanged} | failed: {report.failed} | "
+            f"{report.docs_per_second:.0f} docs/s | {report.bytes_per_second / 1e6:.2f} MB/s"
+        )
 
-            # Remove '_id' fields to avoid duplicate key errors
-            for doc in dict_documents:
-                doc.pop("_id", None)
-
-            self.collection.insert_many(dict_documents)
-            logger.debug(f"Inserted {len(documents)} documents into MongoDB.")
-        except errors.PyMongoError as e:
-            logger.error(f"Error inserting documents: {e}")
-            raise
+        return report
 
     def fetch_documents(self, limit: int, query: dict) -> list[T]:
         """Retrieve documents from the MongoDB collection based on a query.
@@ -151,38 +329,57 @@ class MongoClientWrapper(Generic[T]):
             Exception: If the query operation fails.
         """
         try:
-            documents = list(self.collection.find(query).limit(limit))
+            documents = list(self._read_collection.find(query).limit(limit))
             logger.debug(f"Fetched {len(documents)} documents with query: {query}")
-            return self.__parse_documents(documents)
+            return _parse_documents(self.model, documents, self.trusted)
         except Exception as e:
             logger.error(f"Error fetching documents: {e}")
             raise
 
-    def __parse_documents(self, documents: list[dict]) -> list[T]:
-        """Convert MongoDB documents to Pydantic model instances.
-
-        Converts MongoDB ObjectId fields to strings and transforms the document structure
-        to match the Pydantic model schema.
+    def iter_documents(
+        self,
+        query: dict | None = None,
+        batch_size: int = 1000,
+        projection: dict | None = None,
+        sort: list[tuple[str, int]] | None = None,
+        after_id: str | ObjectId | None = None,
+        limit: int = 0,
+    ) -> Iterator[T]:
+        """Iterate over the documents matching a query with constant memory.
+
+        Documents are fetched and validated `batch_size` at a time. A scan sorted
+        by `[("_id", 1)]` can be resumed by passing the `id` of the last document
+        it yielded as `after_id`.
 
         Args:
-            documents (list[dict]): List of MongoDB documents to parse.
-
-        Returns:
-            list[T]: List of validated Pydantic model instances.
-        """
-        parsed_documents = []
-        for doc in documents:
-            for key, value in doc.items():
-                if isinstance(value, ObjectId):
-                    doc[key] = str(value)
+            query (dict, optional): MongoDB query filter to apply.
+            batch_size (int, optional): Documents fetched and validated at a time.
+            projection (dict, optional): Fields to return; the model must accept them.
+            sort (list[tuple[str, int]], optional): Sort of the scan.
+            after_id (str | ObjectId, optional): Only yield documents after this ID.
+            limit (int, optional): Maximum number of documents to yield. 0 means no limit.
 
-            _id = doc.pop("_id", None)
-            doc["id"] = _id
+        Yields:
+            T: Pydantic model instances matching the query criteria.
 
-            parsed_doc = self.model.model_validate(doc)
-            parsed_documents.append(parsed_doc)
-
-        return parsed_documents
+        Raises:
+            ValueError: If `after_id` is combined with a sort on another field.
+        """
+        query, sort = _scan_query(query, sort, after_id)
+        cursor = self._read_collection.find(query, projection, batch_size=batch_size, limit=limit)
+        if sort:
+            cursor = cursor.sort(sort)
+
+        with cursor:
+            batch = []
+            for document in cursor:
+                batch.append(document)
+                if len(batch) >= batch_size:
+                    yield from _parse_documents(self.model, batch, self.trusted)
+                    batch = []
+
+            if batch:
+                yield from _parse_documents(self.model, batch, self.trusted)
 
     def get_collection_count(self) -> int:
         """Count the total number of documents in the collection.
@@ -201,11 +398,10 @@ class MongoClientWrapper(Generic[T]):
             raise
 
     def close(self) -> None:
-        """Close the MongoDB connection.
+        """Release the wrapper's handle on the shared MongoDB client.
 
-        This method should be called when the service is no longer needed
-        to properly release resources, unless using the context manager.
+        The client and its connection pool stay open for other wrappers; they are
+        closed by `close_mongo_clients`.
         """
 
-        self.client.close()
-        logger.debug("Closed MongoDB connection.")
+        self.client = self.database = self.collection = self._read_collection = None
@@ -0,0 +1,152 @@
+from typing import Any
+
+from motor.motor_asyncio import AsyncIOMotorCollection
+from pydantic import BaseModel, Field
+from pymongo import IndexModel
+from pymongo.collection import Collection
+
+
+class IndexSpec(BaseModel):
+    """A secondary index a collection is required to have.
+
+    Indexes are matched on their key pattern, so an index created under another
+    name (e.g. by a library) satisfies the spec.
+
+    Attributes:
+        keys (list[tuple[str, int]]): Fields and directions of the index.
+        name (str): Name used when the index is created.
+        unique (bool): Whether the index enforces uniqueness.
+    """
+
+    keys: list[tuple[str, int]]
+    name: str
+    unique: bool = False
+
+    def to_index_model(self) -> IndexModel:
+        return IndexModel(self.keys, name=self.name, unique=self.unique)
+
+
+class HotQuery(BaseModel):
+    """A frequent or expensive query whose plan should be served by an index.
+
+    Attributes:
+        name (str): Human-readable name of the query.
+        collection (str): Collection the query runs on.
+        filter (dict): Representative query filter.
+        sort (list[tuple[str, int]], optional): Sort of the query.
+    """
+
+    name: str
+    collection: str
+    filter: dict
+    sort: list[tuple[str, int]] | None = None
+
+
+class QueryPlan(BaseModel):
+    """Summary of the winning plan of an explained query.
+
+    Attributes:
+        stages (list[str]): Stages of the winning plan, outermost first.
+        index_names (list[str]): Indexes the plan scans.
+    """
+
+    stages: list[str] = Field(default_factory=list)
+    index_names: list[str] = Field(default_factory=list)
+
+    @property
+    def uses_collection_scan(self) -> bool:
+        return "COLLSCAN" in self.stages
+
+    @property
+    def is_empty_collection(self) -> bool:
+        return self.stages == ["EOF"]
+
+
+def _key_pattern(keys) -> tuple[tuple[str, int], ...]:
+    return tuple((field, int(direction)) for field, direction in keys)
+
+
+def _missing_indexes(index_information: dict, specs: list[IndexSpec]) -> list[IndexSpec]:
+    existing = {_key_pattern(info["key"]) for info in index_information.values()}
+
+    return [spec for spec in specs if _key_pattern(spec.keys) not in existing]
+
+
+async def find_missing_indexes(
+    collection: AsyncIOMotorCollection, specs: list[IndexSpec]
+) -> list[IndexSpec]:
+    """Get the specs whose key pattern has no index on the collection."""
+    return _missing_indexes(await collection.index_information(), specs)
+
+
+async def ensure_indexes(
+    collection: AsyncIOMotorCollection, specs: list[IndexSpec]
+) -> list[IndexSpec]:
+    """Create the missing indexes of a collection. Safe to call repeatedly.
+
+    Returns:
+        list[IndexSpec]: The indexes that were missing and have been created.
+    """
+    missing = await find_missing_indexes(collection, specs)
+    if missing:
+        await collection.create_indexes([spec.to_index_model() for spec in missing])
+
+    return missing
+
+
+def find_missing_indexes_sync(collection: Collection, specs: list[IndexSpec]) -> list[IndexSpec]:
+    """Synchronous `find_missing_indexes` for pymongo collections."""
+    return _missing_indexes(collection.index_information(), specs)
+
+
+def ensure_indexes_sync(collection: Collection, specs: list[IndexSpec]) -> list[IndexSpec]:
+    """Synchronous `ensure_indexes` for pymongo collections."""
+    missing = find_missing_indexes_sync(collection, specs)
+    if missing:
+        collection.create_indexes([spec.to_index_model() for spec in missing])
+
+    return missing
+
+
+def _collect_plan(stage: dict[str, Any], plan: QueryPlan) -> None:
+    plan.stages.append(stage.get("stage", "UNKNOWN"))
+    if "indexName" in stage:
+        plan.index_names.append(stage["indexName"])
+
+    children = stage.get("inputStages", [])
+    if "inputStage" in stage:
+        children = [stage["inputStage"], *children]
+    for child in children:
+        _collect_plan(child, plan)
+
+
+async def explain_query(
+    collection: AsyncIOMotorCollection,
+    filter: dict,
+    sort: list[tuple[str, int]] | None = None,
+) -> QueryPlan:
+    """Explain a find query and summarize its winning plan.
+
+    Delete and update filters can be checked by explaining them as a find.
+
+    Args:
+        collection: The collection the query runs on.
+        filter: The query filter.
+        sort: Optional sort of the query.
+
+    Returns:
+        QueryPlan: The stages and indexes of the winning plan.
+    """
+    cursor = collection.find(filter)
+    if sort:
+        cursor = cursor.sort(sort)
+    explanation = await cursor.explain()
+
+    winning_plan = explanation["queryPlanner"]["winningPlan"]
+    # Slot-based engine plans nest the classic plan under "queryPlan".
+    winning_plan = winning_plan.get("queryPlan", winning_plan)
+
+    plan = QueryPlan()
+    _collect_plan(winning_plan, plan)
+
+    return plan
@@ -16,15 +16,43 @@ class MongoIndex:
         self,
         embedding_dim: int,
         is_hybrid: bool = False,
-    ) -> None:
+        wait_until_complete: float | None = None,
+    ) -> list[str]:
+        """Create the search indexes of the retriever that do not exist yet.
+
+        Existing indexes are left untouched, so calling this after every ingestion
+        does not rebuild them.
+
+        Args:
+            embedding_dim (int): Dimension of the embeddings.
+            is_hybrid (bool): Whether to create the full-text index as well.
+            wait_until_complete (float, optional): Seconds to wait for each created
+                index to be queryable. Defaults to not waiting.
+
+        Returns:
+            list[str]: Names of the created indexes.
+        """
         vectorstore = self.retriever.vectorstore
+        existing = self.get_search_index_names()
+        created = []
 
-        vectorstore.create_vector_search_index(
-            dimensions=embedding_dim,
-        )
-        if is_hybrid:
+        if vectorstore._index_name not in existing:
+            vectorstore.create_vector_search_index(
+                dimensions=embedding_dim,
+                wait_until_complete=wait_until_complete,
+            )
+            created.append(vectorstore._index_name)
+        if is_hybrid and self.retriever.search_index_name not in existing:
             create_fulltext_search_index(
                 collection=self.mongodb_client.collection,
                 field=vectorstore._text_key,
                 index_name=self.retriever.search_index_name,
+                wait_until_complete=wait_until_complete,
             )
+            created.append(self.retriever.search_index_name)
+
+        return created
+
+    def get_search_index_names(self) -> set[str]:
+        """Get the names of the Atlas Search indexes of the collection."""
+        return {index["name"] for index in self.mongodb_client.collection.list_search_indexes()}
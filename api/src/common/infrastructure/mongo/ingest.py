@@ -0,0 +1,180 @@
+import hashlib
+from itertools import islice
+from typing import Iterable, Iterator
+
+import bson
+from pydantic import BaseModel, Field
+from pymongo import InsertOne, ReplaceOne, errors
+from pymongo.results import BulkWriteResult
+
+_DUPLICATE_KEY_ERROR = 11000
+
+
+class IngestChunkError(BaseModel):
+    """Failure of one chunk of an ingestion.
+
+    Attributes:
+        chunk (int): Index of the chunk in the ingested documents.
+        failed (int): Documents of the chunk that were not written.
+        message (str): First error reported for the chunk.
+    """
+
+    chunk: int
+    failed: int
+    message: str
+
+
+class IngestReport(BaseModel):
+    """Outcome and throughput of an ingestion.
+
+    Attributes:
+        documents (int): Documents submitted.
+        inserted (int): Documents inserted.
+        upserted (int): Documents inserted by an upsert.
+        unchanged (int): Documents already stored, found by content hash or upsert key.
+        failed (int): Documents not written.
+        chunks (int): Bulk writes sent.
+        bytes (int): BSON size of the submitted documents.
+        seconds (float): Wall time of the ingestion.
+        chunk_errors (list[IngestChunkError]): Errors of the chunks that failed.
+    """
+
+    documents: int = 0
+    inserted: int = 0
+    upserted: int = 0
+    unchanged: int = 0
+    failed: int = 0
+    chunks: int = 0
+    bytes: int = 0
+    seconds: float = 0.0
+    chunk_errors: list[IngestChunkError] = Field(default_factory=list)
+
+    @property
+    def docs_per_second(self) -> float:
+        return self.documents / self.seconds if self.seconds else 0.0
+
+    @property
+    def bytes_per_second(self) -> float:
+        return self.bytes / self.seconds if self.seconds else 0.0
+
+    def add(self, chunk: "IngestReport") -> None:
+        """Add the counts of a chunk to the report."""
+        self.documents += chunk.documents
+        self.inserted += chunk.inserted
+        self.upserted += chunk.upserted
+        self.unchanged += chunk.unchanged
+        self.failed += chunk.failed
+        self.chunks += chunk.chunks
+        self.bytes += chunk.bytes
+        self.chunk_errors.extend(chunk.chunk_errors)
+
+
+def _to_mongo_documents(documents: list[BaseModel]) -> list[dict]:
+    """Convert Pydantic model instances to documents ready to be inserted.
+
+    Raises:
+        ValueError: If documents is empty or contains non-Pydantic model items.
+    """
+    if not documents or not all(isinstance(doc, BaseModel) for doc in documents):
+        raise ValueError("Documents must be a list of Pycantic models.")
+
+    dict_documents = [doc.model_dump() for doc in documents]
+
+    # Remove '_id' fields to avoid duplicate key errors
+    for doc in dict_documents:
+        doc.pop("_id", None)
+
+    return dict_documents
+
+
+def iter_chunks(documents: Iterable[BaseModel], chunk_size: int) -> Iterator[list[BaseModel]]:
+    """Split documents into lists of `chunk_size`, consuming them lazily."""
+    iterator = iter(documents)
+    while chunk := list(islice(iterator, chunk_size)):
+        yield chunk
+
+
+def to_write_operations(
+    documents: list[BaseModel],
+    upsert_on: list[str] | None = None,
+    content_hash_ids: bool = True,
+) -> tuple[list[InsertOne | ReplaceOne], int]:
+    """Build the bulk write operations ingesting a chunk of documents.
+
+    Args:
+        documents: The chunk of Pydantic model instances.
+        upsert_on: Fields identifying a document. If set, each document replaces
+            the stored one with the same values, or is inserted.
+        content_hash_ids: Whether inserted documents get the SHA-256 of their BSON
+            as `_id`, so ingesting the same content again inserts nothing.
+
+    Returns:
+        tuple[list[InsertOne | ReplaceOne], int]: The operations and the BSON size
+            of the documents in bytes.
+    """
+    operations = []
+    size = 0
+    for doc in _to_mongo_documents(documents):
+        encoded = bson.encode(doc)
+        size += len(encoded)
+        if upsert_on:
+            operations.append(ReplaceOne({field: doc.get(field) for field in upsert_on}, doc, upsert=True))
+            continue
+
+        if content_hash_ids:
+            doc["_id"] = hashlib.sha256(encoded).hexdigest()
+        operations.append(InsertOne(doc))
+
+    return operations, size
+
+
+def chunk_report(
+    chunk: int,
+    operations: list,
+    size: int,
+    result: BulkWriteResult | None = None,
+    error: errors.PyMongoError | None = None,
+) -> IngestReport:
+    """Report the outcome of the unordered bulk write of a chunk.
+
+    Duplicate key errors mean the document is already stored, so they count as
+    unchanged; other write errors count as failed.
+
+    Args:
+        chunk: Index of the chunk.
+        operations: The bulk write operations of the chunk.
+        size: BSON size of the chunk in bytes.
+        result: Result of the bulk write, if it succeeded.
+        error: Error raised by the bulk write, if it failed.
+
+    Returns:
+        IngestReport: The outcome of the chunk.
+    """
+    report = IngestReport(documents=len(operations), chunks=1, bytes=size)
+    if isinstance(error, errors.BulkWriteError):
+        details = error.details
+    elif error is not None:
+        report.failed = len(operations)
+        report.chunk_errors.append(IngestChunkError(chunk=chunk, failed=len(operations), message=str(error)))
+        return report
+    else:
+        details = {
+            "nInserted": result.inserted_count,
+            "nUpserted": result.upserted_count,
+            "nMatched": result.matched_count,
+        }
+
+    report.inserted = details.get("nInserted", 0)
+    report.upserted = details.get("nUpserted", 0)
+    report.unchanged = details.get("nMatched", 0)
+
+    write_errors = details.get("writeErrors", [])
+    report.unchanged += sum(1 for e in write_errors if e.get("code") == _DUPLICATE_KEY_ERROR)
+    failed = [e for e in write_errors if e.get("code") != _DUPLICATE_KEY_ERROR]
+    if failed:
+        report.failed = len(failed)
+        report.chunk_errors.append(
+            IngestChunkError(chunk=chunk, failed=len(failed), message=failed[0].get("errmsg", ""))
+        )
+
+    return report
@@ -0,0 +1,82 @@
+import threading
+from typing import Any
+
+import zstandard
+from langgraph.checkpoint.serde.base import SerializerProtocol
+from langgraph.checkpoint.serde.jsonplus import JsonPlusSerializer
+
+ZSTD_TYPE_SUFFIX = "+zstd"
+
+
+class ZstdCompressedSerializer(SerializerProtocol):
+    """Checkpoint serializer that zstd-compresses large payloads.
+
+    Values are encoded with the wrapped serializer (msgpack for LangGraph's default
+    `JsonPlusSerializer`). Payloads of at least `threshold_bytes` are compressed and
+    stored with a `+zstd` suffix on their type, e.g. `msgpack+zstd`. Anything without
+    the suffix is handed to the wrapped serializer unchanged, so documents written
+    before compression was enabled are read transparently.
+
+    Args:
+        threshold_bytes (int): Minimum encoded size before compression is attempted.
+        level (int): zstd compression level.
+        serde (SerializerProtocol, optional): The serializer producing the encoded
+            payloads. Defaults to `JsonPlusSerializer`.
+    """
+
+    def __init__(
+        self,
+        threshold_bytes: int = 1024,
+        level: int = 3,
+        serde: SerializerProtocol | None = None,
+    ) -> None:
+        self.threshold_bytes = threshold_bytes
+        self.level = level
+        self.serde = serde or JsonPlusSerializer()
+        # zstd contexts are not thread-safe, so each thread gets its own.
+        self._local = threading.local()
+
+    def _compressor(self) -> zstandard.ZstdCompressor:
+        compressor = getattr(self._local, "compressor", None)
+        if compressor is None:
+            compressor = zstandard.ZstdCompressor(level=self.level)
+            self._local.compressor = compressor
+
+        return compressor
+
+    def _decompressor(self) -> zstandard.ZstdDecompressor:
+        decompressor = getattr(self._local, "decompressor", None)
+        if decompressor is None:
+            decompressor = zstandard.ZstdDecompressor()
+            self._local.decompressor = decompressor
+
+        return decompressor
+
+    def dumps(self, obj: Any) -> bytes:
+        return self.serde.dumps(obj)
+
+    def loads(self, data: bytes) -> Any:
+        return self.serde.loads(data)
+
+    def dumps_typed(self, obj: Any) -> tuple[str, bytes]:
+        type_, data = self.serde.dumps_typed(obj)
+        if type_ == "null" or len(data) < self.threshold_bytes:
+            return type_, data
+
+        compressed = self._compressor().compress(data)
+        if len(compressed) >= len(data):
+            return type_, data
+
+        return f"{type_}{ZSTD_TYPE_SUFFIX}", compressed
+
+    def loads_typed(self, data: tuple[str, bytes]) -> Any:
+        type_, payload = data
+        if type_.endswith(ZSTD_TYPE_SUFFIX):
+            return self.serde.loads_typed(
+                (
+                    type_[: -len(ZSTD_TYPE_SUFFIX)],
+                    self._decompressor().decompress(payload),
+                )
+            )
+
+        return self.serde.loads_typed(data)
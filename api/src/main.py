@@ -10,21 +10,35 @@ All APIs are mounted as sub-applications with their own routes.
 """
 
 import os
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
 # Import the various API modules
 from .career_coaches.infrastructure.api import app as career_coach_app
+from .career_coaches.infrastructure.api import lifespan as career_coach_lifespan
 from .resume_editor.interfaces.api import app as resume_editor_app
 from .material_generator.infrastructure.api import app as material_generator_app
 
 
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Runs the lifespans of mounted sub-applications.
+
+    Starlette does not run lifespan handlers of mounted apps, so shared resources
+    such as the career coach checkpointer are opened and closed from here.
+    """
+    async with career_coach_lifespan(career_coach_app):
+        yield
+
 
 # Create main FastAPI application
 app = FastAPI(
     title="Career Coach Agents Platform API",
     description="Combined API for career coaching, resume editing, and job materials generation",
     version="1.0.0",
+    lifespan=lifespan,
 )
 
 # Add CORS middleware
@@ -47,6 +47,18 @@ class ResumeRepository(ABC):
             True if successful, False otherwise
         """
         pass
+    
+    @abstractmethod
+    def delete_resume(self, user_id: str) -> bool:
+        """Delete the resume of a user.
+        
+        Args:
+            user_id: User identifier
+            
+        Returns:
+            True if a resume was deleted, False otherwise
+        """
+        pass
 
 
 class ChatHistoryRepository(ABC):
@@ -130,6 +130,29 @@ class FileResumeRepository(ResumeRepository):
         except Exception as e:
             logger.error(f"Error updating resume section {section} for user {user_id}: {e}")
             return False
+    
+    def delete_resume(self, user_id: str) -> bool:
+        """Delete the resume of a user.
+        
+        Args:
+            user_id: User identifier
+            
+        Returns:
+            True if a resume was deleted, False otherwise
+        """
+        resume_path = self._get_resume_path(user_id)
+        if resume_path.resolve().parent != self.storage_path.resolve():
+            logger.warning(f"Refusing to delete resume outside of {self.storage_path} for user {user_id}")
+            return False
+        
+        try:
+            resume_path.unlink()
+            return True
+        except FileNotFoundError:
+            return False
+        except Exception as e:
+            logger.error(f"Error deleting resume for user {user_id}: {e}")
+            return False
 
 
 class InMemoryChatHistoryRepository(ChatHistoryRepository):
@@ -183,7 +206,14 @@ class InMemoryChatHistoryRepository(ChatHistoryRepository):
 
 # Optional MongoDB implementation if available
 try:
-    from pymongo import MongoClient
+    from pymongo import ASCENDING, MongoClient
+
+    from common.infrastructure.mongo.index_registry import IndexSpec, ensure_indexes_sync
+
+    # Serves the per-user history query, sorted by timestamp.
+    CHAT_HISTORY_INDEXES = [
+        IndexSpec(keys=[("user_id", ASCENDING), ("timestamp", ASCENDING)], name="user_id_timestamp"),
+    ]
     
     class MongoDBChatHistoryRepository(ChatHistoryRepository):
         """MongoDB implementation of the chat history repository."""
@@ -199,6 +229,15 @@ try:
             self.client = MongoClient(mongo_uri)
             self.db = self.client[db_name]
             self.collection = self.db[collection_name]
+
+            try:
+                created = ensure_indexes_sync(self.collection, CHAT_HISTORY_INDEXES)
+                if created:
+                    logger.warning(
+                        f"Created missing indexes on {collection_name}: {', '.join(spec.name for spec in created)}"
+                    )
+            except Exception as e:
+                logger.error(f"Error ensuring chat history indexes: {e}")
         
         def save_message(self, user_id: str, is_user: bool, content: str) -> bool:
             """Save a message to the chat history.
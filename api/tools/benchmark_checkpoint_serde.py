@@ -0,0 +1,116 @@
+import random
+import time
+import uuid
+
+import click
+from langchain_core.messages import AIMessage, HumanMessage
+from langgraph.checkpoint.base import empty_checkpoint
+from langgraph.checkpoint.serde.jsonplus import JsonPlusSerializer
+
+from career_coaches.config import settings
+from common.infrastructure.serde import ZstdCompressedSerializer
+
+WORDS = (
+    "career resume interview skills experience role company team project impact "
+    "leadership growth network linkedin profile goals strengths feedback salary "
+    "industry market opportunity manager engineer product data design strategy"
+).split()
+
+
+def build_checkpoint(messages: int, seed: int = 0) -> dict:
+    """Build a checkpoint shaped like a career coach conversation.
+
+    Args:
+        messages: Number of messages in the conversation history.
+        seed: Seed for the generated message text.
+
+    Returns:
+        dict: A LangGraph checkpoint holding the conversation state.
+    """
+    rng = random.Random(seed)
+    history = []
+    for index in range(messages):
+        if index % 2 == 0:
+            text = " ".join(rng.choices(WORDS, k=rng.randint(15, 40)))
+            history.append(HumanMessage(content=text, id=str(uuid.UUID(int=rng.getrandbits(128)))))
+        else:
+            text = " ".join(rng.choices(WORDS, k=rng.randint(120, 250)))
+            history.append(AIMessage(content=text, id=str(uuid.UUID(int=rng.getrandbits(128)))))
+
+    checkpoint = empty_checkpoint()
+    checkpoint["channel_values"] = {
+        "messages": history,
+        "summary": " ".join(rng.choices(WORDS, k=120)),
+        "coach_id": "career_assessment",
+        "user_context": "",
+        "use_web_tools": False,
+    }
+
+    return checkpoint
+
+
+def measure(serde, checkpoint: dict, rounds: int) -> tuple[str, int, float]:
+    """Return the type tag, encoded size and mean round-trip time in milliseconds."""
+    type_, data = serde.dumps_typed(checkpoint)
+
+    start = time.perf_counter()
+    for _ in range(rounds):
+        serde.loads_typed(serde.dumps_typed(checkpoint))
+    elapsed_ms = (time.perf_counter() - start) * 1000 / rounds
+
+    return type_, len(data), elapsed_ms
+
+
+@click.command()
+@click.option(
+    "--sizes",
+    type=str,
+    default="5,30,100",
+    help="Comma-separated conversation lengths, in messages, to measure.",
+)
+@click.option(
+    "--rounds",
+    type=int,
+    default=200,
+    help="Number of serialize/deserialize round trips per measurement.",
+)
+def main(sizes: str, rounds: int) -> None:
+    """CLI command to compare checkpoint payload size and serialization time.
+
+    Compares LangGraph's default serializer with the zstd-compressed serializer used
+    by the career coach checkpointer, on synthetic conversations of the given
+    lengths. No MongoDB connection is needed.
+
+    Args:
+        sizes: Comma-separated conversation lengths, in messages, to measure.
+        rounds: Number of serialize/deserialize round trips per measurement.
+    """
+
+    default_serde = JsonPlusSerializer()
+    compressed_serde = ZstdCompressedSerializer(
+        threshold_bytes=settings.CAREER_COACH_CHECKPOINT_COMPRESSION_THRESHOLD_BYTES,
+        level=settings.CAREER_COACH_CHECKPOINT_COMPRESSION_LEVEL,
+    )
+
+    for size in (int(size) for size in sizes.split(",")):
+        checkpoint = build_checkpoint(size)
+        measure(default_serde, checkpoint, 5)
+        measure(compressed_serde, checkpoint, 5)
+
+        default_type, default_bytes, default_ms = measure(default_serde, checkpoint, rounds)
+        compressed_type, compressed_bytes, compressed_ms = measure(
+            compressed_serde, checkpoint, rounds
+        )
+
+        print(f"\033[32mMessages: {size}\033[0m")
+        print(
+            f"\033[32m  {default_type:<14} {default_bytes:>9,} bytes  {default_ms:.3f} ms/round trip\033[0m"
+        )
+        print(
+            f"\033[32m  {compressed_type:<14} {compressed_bytes:>9,} bytes  {compressed_ms:.3f} ms/round trip\033[0m"
+        )
+        print(f"\033[32m  Size reduction: {default_bytes / compressed_bytes:.1f}x\033[0m")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+import random
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import click
+from langchain_core.embeddings import Embeddings
+
+from career_coaches.config import settings
+from common.application.rag.batching import MicroBatchedEmbeddings
+from common.application.rag.embeddings import get_embedding_model
+
+WORDS = (
+    "career resume interview skills experience role company team project impact "
+    "leadership growth network linkedin profile goals strengths feedback salary"
+).split()
+
+
+def build_queries(count: int, seed: int = 0) -> list[str]:
+    """Build short chat-like queries."""
+    rng = random.Random(seed)
+
+    return [" ".join(rng.choices(WORDS, k=rng.randint(6, 16))) for _ in range(count)]
+
+
+def measure(model: Embeddings, queries: list[str], concurrency: int) -> float:
+    """Embed the queries from `concurrency` threads and return the queries per second."""
+    start = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        list(executor.map(model.embed_query, queries))
+
+    return len(queries) / (time.perf_counter() - start)
+
+
+@click.command()
+@click.option(
+    "--concurrency",
+    type=str,
+    default="1,4,16,64",
+    help="Comma-separated numbers of concurrent callers to measure.",
+)
+@click.option("--queries", type=int, default=512, help="Queries embedded per measurement.")
+@click.option(
+    "--window-ms",
+    type=float,
+    default=settings.RAG_EMBEDDING_BATCH_WINDOW_MS,
+    help="Batching window of the micro-batcher.",
+)
+@click.option(
+    "--max-batch-size",
+    type=int,
+    default=settings.RAG_EMBEDDING_MAX_BATCH_SIZE,
+    help="Maximum batch size of the micro-batcher.",
+)
+def main(concurrency: str, queries: int, window_ms: float, max_batch_size: int) -> None:
+    """CLI command to compare query embedding throughput with and without micro-batching.
+
+    Embeds short queries from concurrent threads, first one forward pass per query,
+    then through the micro-batcher, using the configured embedding model. No MongoDB
+    connection is needed.
+
+    Args:
+        concurrency: Comma-separated numbers of concurrent callers to measure.
+        queries: Queries embedded per measurement.
+        window_ms: Batching window of the micro-batcher.
+        max_batch_size: Maximum batch size of the micro-batcher.
+    """
+
+    model = get_embedding_model(settings.RAG_TEXT_EMBEDDING_MODEL_ID, settings.RAG_DEVICE)
+    texts = build_queries(queries)
+    model.embed_documents(texts[:max_batch_size])
+
+    print(
+        f"\033[32mModel: {settings.RAG_TEXT_EMBEDDING_MODEL_ID} | device: {settings.RAG_DEVICE} | window: {window_ms} ms | max batch: {max_batch_size}\033[0m"
+    )
+    for callers in (int(value) for value in concurrency.split(",")):
+        batcher = MicroBatchedEmbeddings(model, window_ms, max_batch_size)
+        direct_qps = measure(model, texts, callers)
+        batched_qps = measure(batcher, texts, callers)
+        batcher.close()
+
+        print(
+            f"\033[32m  Concurrency {callers:>3}: direct {direct_qps:>8.0f} q/s | batched {batched_qps:>8.0f} q/s "
+            f"({batched_qps / direct_qps:.1f}x, mean batch {batcher.mean_batch_size:.1f})\033[0m"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,144 @@
+import asyncio
+import statistics
+import time
+from functools import wraps
+
+import click
+import httpx
+
+from career_coaches.infrastructure.api import app, lifespan
+
+
+def async_command(f):
+    """Decorator to run an async click command."""
+
+    @wraps(f)
+    def wrapper(*args, **kwargs):
+        return asyncio.run(f(*args, **kwargs))
+
+    return wrapper
+
+
+async def simulate_stream(interval_ms: float, stop: asyncio.Event, delays: list[float]) -> None:
+    """Emit a frame every `interval_ms`, recording how late each frame was in milliseconds.
+
+    Stands in for an in-flight chat stream: any blocking call on the event loop shows
+    up as frames delivered late.
+    """
+    interval = interval_ms / 1000
+    while not stop.is_set():
+        start = time.perf_counter()
+        await asyncio.sleep(interval)
+        delays.append((time.perf_counter() - start - interval) * 1000)
+
+
+async def run_phase(
+    client: httpx.AsyncClient | None,
+    paths: list[str],
+    streams: int,
+    requests: int,
+    concurrency: int,
+    interval_ms: float,
+    duration_s: float,
+) -> tuple[list[float], list[float]]:
+    """Run simulated streams, optionally alongside history requests.
+
+    Returns:
+        The frame delays of the streams and the latencies of the history requests,
+        both in milliseconds.
+    """
+    stop = asyncio.Event()
+    delays: list[float] = []
+    latencies: list[float] = []
+    stream_tasks = [
+        asyncio.create_task(simulate_stream(interval_ms, stop, delays))
+        for _ in range(streams)
+    ]
+
+    if client is None:
+        await asyncio.sleep(duration_s)
+    else:
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def call(path: str) -> None:
+            async with semaphore:
+                start = time.perf_counter()
+                response = await client.get(path)
+                response.raise_for_status()
+                latencies.append((time.perf_counter() - start) * 1000)
+
+        await asyncio.gather(*(call(paths[i % len(paths)]) for i in range(requests)))
+
+    stop.set()
+    await asyncio.gather(*stream_tasks)
+
+    return delays, latencies
+
+
+def percentile(values: list[float], q: int) -> float:
+    if len(values) < 2:
+        return values[0] if values else 0.0
+
+    return statistics.quantiles(values, n=100)[q - 1]
+
+
+@click.command()
+@click.option("--user-id", type=str, required=True, help="User whose history is requested.")
+@click.option("--streams", type=int, default=50, help="Number of simulated in-flight chat streams.")
+@click.option("--requests", type=int, default=200, help="Number of history requests to send.")
+@click.option("--concurrency", type=int, default=20, help="Maximum history requests in flight.")
+@click.option("--interval-ms", type=float, default=20.0, help="Frame interval of the simulated streams.")
+@async_command
+async def main(
+    user_id: str,
+    streams: int,
+    requests: int,
+    concurrency: int,
+    interval_ms: float,
+) -> None:
+    """CLI command to check that history requests do not stall in-flight chat streams.
+
+    Runs simulated chat streams on the API's event loop, first alone and then while
+    `/history/users` and `/history/sessions/{user_id}` are called concurrently, and
+    compares how late stream frames are delivered. Requires MongoDB at `MONGO_URI`.
+
+    Args:
+        user_id: User whose history is requested.
+        streams: Number of simulated in-flight chat streams.
+        requests: Number of history requests to send.
+        concurrency: Maximum history requests in flight.
+        interval_ms: Frame interval of the simulated streams.
+    """
+
+    paths = ["/history/users", f"/history/sessions/{user_id}"]
+
+    async with lifespan(app):
+        transport = httpx.ASGITransport(app=app)
+        async with httpx.AsyncClient(transport=transport, base_url="http://api") as client:
+            # Warm up connections and indexes.
+            for path in paths:
+                (await client.get(path)).raise_for_status()
+
+            start = time.perf_counter()
+            loaded_delays, latencies = await run_phase(
+                client, paths, streams, requests, concurrency, interval_ms, 0
+            )
+            elapsed = time.perf_counter() - start
+            idle_delays, _ = await run_phase(
+                None, paths, streams, 0, concurrency, interval_ms, elapsed
+            )
+
+    print(f"\033[32mStreams: {streams} | history requests: {requests} | concurrency: {concurrency}\033[0m")
+    print(
+        f"\033[32mFrame delay, idle:         p50 {percentile(idle_delays, 50):.2f} ms | p99 {percentile(idle_delays, 99):.2f} ms | max {max(idle_delays, default=0):.2f} ms\033[0m"
+    )
+    print(
+        f"\033[32mFrame delay, with history: p50 {percentile(loaded_delays, 50):.2f} ms | p99 {percentile(loaded_delays, 99):.2f} ms | max {max(loaded_delays, default=0):.2f} ms\033[0m"
+    )
+    print(
+        f"\033[32mHistory latency:           p50 {percentile(latencies, 50):.2f} ms | p99 {percentile(latencies, 99):.2f} ms\033[0m"
+    )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,148 @@
+import random
+import time
+from datetime import datetime, timedelta, timezone
+
+import bson
+import click
+from bson import ObjectId
+from langchain_core.documents import Document
+from pydantic import BaseModel
+
+from common.infrastructure.mongo.client import READ_CODEC_OPTIONS, _parse_documents
+
+WORDS = (
+    "career resume interview skills experience role company team project impact "
+    "leadership growth network linkedin profile goals strengths feedback salary"
+).split()
+
+
+class BenchmarkDocument(BaseModel):
+    id: str
+    user_id: str
+    source_id: str
+    text: str
+    score: float
+    tags: list[str]
+    created_at: datetime
+
+
+MODELS = {"flat": BenchmarkDocument, "document": Document}
+
+
+def build_document(model: str, index: int, rng: random.Random) -> dict:
+    """Build a stored document for the given model."""
+    text = " ".join(rng.choices(WORDS, k=rng.randint(20, 60)))
+    if model == "document":
+        return {
+            "_id": ObjectId(),
+            "page_content": text,
+            "metadata": {"user_id": f"user_{index % 1000:04d}", "source_id": ObjectId()},
+            "type": "Document",
+        }
+
+    return {
+        "_id": ObjectId(),
+        "user_id": f"user_{index % 1000:04d}",
+        "source_id": ObjectId(),
+        "text": text,
+        "score": rng.random(),
+        "tags": rng.sample(WORDS, k=3),
+        "created_at": datetime(2024, 1, 1, tzinfo=timezone.utc) + timedelta(seconds=index),
+    }
+
+
+def build_batches(model: str, documents: int, batch_size: int, seed: int = 0) -> list[bytes]:
+    """Encode synthetic documents into BSON batches, as the driver receives them."""
+    rng = random.Random(seed)
+    batches = []
+    for offset in range(0, documents, batch_size):
+        batches.append(
+            b"".join(
+                bson.encode(build_document(model, index, rng))
+                for index in range(offset, min(offset + batch_size, documents))
+            )
+        )
+
+    return batches
+
+
+def parse_per_document(model: type[BaseModel], batches: list[bytes]) -> int:
+    """Previous path: default decoding, ObjectIds converted in Python, one validation per document."""
+    parsed = 0
+    for batch in batches:
+        for doc in bson.decode_all(batch):
+            for key, value in doc.items():
+                if isinstance(value, ObjectId):
+                    doc[key] = str(value)
+            doc["id"] = doc.pop("_id", None)
+            model.model_validate(doc)
+            parsed += 1
+
+    return parsed
+
+
+def parse_batched(model: type[BaseModel], batches: list[bytes], trusted: bool) -> int:
+    """Current path: ObjectIds decoded as strings by the codec, batch validation or trusted construction."""
+    parsed = 0
+    for batch in batches:
+        documents = bson.decode_all(batch, codec_options=READ_CODEC_OPTIONS)
+        parsed += len(_parse_documents(model, documents, trusted))
+
+    return parsed
+
+
+def measure(parse, rounds: int) -> float:
+    """Return the best time of `rounds` runs, in seconds."""
+    best = float("inf")
+    for _ in range(rounds):
+        start = time.perf_counter()
+        parse()
+        best = min(best, time.perf_counter() - start)
+
+    return best
+
+
+@click.command()
+@click.option(
+    "--model",
+    type=click.Choice(list(MODELS)),
+    default="flat",
+    help="Model to parse into: a flat Pydantic model or a LangChain Document.",
+)
+@click.option("--documents", type=int, default=100_000, help="Number of documents to parse.")
+@click.option("--batch-size", type=int, default=1000, help="Documents per cursor batch.")
+@click.option("--rounds", type=int, default=3, help="Runs per path; the best is reported.")
+def main(model: str, documents: int, batch_size: int, rounds: int) -> None:
+    """CLI command to compare the document parsing paths of the Mongo client wrappers.
+
+    Decodes synthetic BSON cursor batches and builds Pydantic models from them with
+    the previous per-document path, the codec plus batch validation path, and the
+    trusted `model_construct` path. No MongoDB connection is needed.
+
+    Args:
+        model: Model to parse into: a flat Pydantic model or a LangChain Document.
+        documents: Number of documents to parse.
+        batch_size: Documents per cursor batch.
+        rounds: Runs per path; the best is reported.
+    """
+
+    model_class = MODELS[model]
+    batches = build_batches(model, documents, batch_size)
+    paths = [
+        ("per-document validate", lambda: parse_per_document(model_class, batches)),
+        ("codec + batch validate", lambda: parse_batched(model_class, batches, trusted=False)),
+        ("codec + trusted construct", lambda: parse_batched(model_class, batches, trusted=True)),
+    ]
+
+    baseline = None
+    print(f"\033[32mModel: {model} | documents: {documents:,} | batch size: {batch_size}\033[0m")
+    for name, parse in paths:
+        seconds = measure(parse, rounds)
+        baseline = baseline or seconds
+        print(
+            f"\033[32m  {name:<26} {seconds * 1000:>8.1f} ms  {documents / seconds:>10,.0f} docs/s  {baseline / seconds:.1f}x\033[0m"
+        )
+
+
+if __name__ == "__main__":
+    main()
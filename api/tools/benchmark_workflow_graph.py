@@ -0,0 +1,69 @@
+import time
+
+import click
+from langgraph.checkpoint.memory import MemorySaver
+from opik.integrations.langchain import OpikTracer
+
+from career_coaches.application.conversation_service.workflow.graph import (
+    create_career_coach_workflow_graph,
+    get_career_coach_graph_definition,
+    get_compiled_career_coach_workflow_graph,
+)
+
+
+def compile_per_turn(checkpointer: MemorySaver) -> None:
+    """Per-turn setup as done before the compiled graph registry."""
+    graph = create_career_coach_workflow_graph().compile(checkpointer=checkpointer)
+    OpikTracer(graph=graph.get_graph(xray=True))
+
+
+def compile_from_registry(checkpointer: MemorySaver) -> None:
+    """Per-turn setup using the compiled graph registry."""
+    get_compiled_career_coach_workflow_graph(checkpointer)
+    OpikTracer(metadata={"_opik_graph_definition": get_career_coach_graph_definition()})
+
+
+def measure(setup, checkpointer: MemorySaver, turns: int) -> float:
+    """Return the mean per-turn setup time in milliseconds."""
+    start = time.perf_counter()
+    for _ in range(turns):
+        setup(checkpointer)
+
+    return (time.perf_counter() - start) * 1000 / turns
+
+
+@click.command()
+@click.option(
+    "--turns",
+    type=int,
+    default=200,
+    help="Number of simulated conversation turns to measure.",
+)
+def main(turns: int) -> None:
+    """CLI command to measure the per-turn graph setup overhead.
+
+    Compares compiling the workflow and rendering its xray graph on every turn with
+    reusing the compiled graph and graph definition from the registry. No LLM or
+    MongoDB calls are made; an in-memory checkpointer stands in for Mongo.
+
+    Args:
+        turns: Number of simulated conversation turns to measure.
+    """
+
+    checkpointer = MemorySaver()
+
+    # Warm up both paths so one-off import and cache costs are not measured.
+    compile_per_turn(checkpointer)
+    compile_from_registry(checkpointer)
+
+    before_ms = measure(compile_per_turn, checkpointer, turns)
+    after_ms = measure(compile_from_registry, checkpointer, turns)
+
+    print(f"\033[32mTurns measured: {turns}\033[0m")
+    print(f"\033[32mCompile per turn:    {before_ms:.3f} ms/turn\033[0m")
+    print(f"\033[32mCompiled registry:   {after_ms:.3f} ms/turn\033[0m")
+    print(f"\033[32mSpeed-up:            {before_ms / after_ms:.1f}x\033[0m")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,97 @@
+import asyncio
+import json
+import time
+
+import click
+
+from career_coaches.config import settings
+from career_coaches.infrastructure.streaming import stream_coalesced, stream_per_chunk
+
+
+class FakeWebSocket:
+    """Stands in for a websocket client that takes ``send_delay_ms`` to read a frame."""
+
+    def __init__(self, send_delay_ms: float) -> None:
+        self.send_delay = send_delay_ms / 1000
+        self.bytes_sent = 0
+
+    async def send_json(self, data: dict) -> None:
+        self.bytes_sent += len(json.dumps(data))
+        await asyncio.sleep(self.send_delay)
+
+
+async def fake_token_stream(tokens: int, token_interval_ms: float):
+    """Yield ``tokens`` short chunks, one every ``token_interval_ms``."""
+    for i in range(tokens):
+        await asyncio.sleep(token_interval_ms / 1000)
+        yield f"token{i} "
+
+
+async def run_mode(
+    mode: str, sockets: int, tokens: int, token_interval_ms: float, send_delay_ms: float
+) -> dict:
+    """Stream one response on each of ``sockets`` concurrent fake clients."""
+    websockets = [FakeWebSocket(send_delay_ms) for _ in range(sockets)]
+
+    async def one_turn(websocket: FakeWebSocket):
+        stream = fake_token_stream(tokens, token_interval_ms)
+        if mode == "chunk":
+            return await stream_per_chunk(websocket, stream)
+        return await stream_coalesced(
+            websocket,
+            stream,
+            flush_interval_ms=settings.CAREER_COACH_WS_FLUSH_INTERVAL_MS,
+            flush_max_chars=settings.CAREER_COACH_WS_FLUSH_MAX_CHARS,
+            send_queue_size=settings.CAREER_COACH_WS_SEND_QUEUE_SIZE,
+        )
+
+    cpu_start, wall_start = time.process_time(), time.perf_counter()
+    results = await asyncio.gather(*(one_turn(ws) for ws in websockets))
+    cpu_ms = (time.process_time() - cpu_start) * 1000
+    wall_ms = (time.perf_counter() - wall_start) * 1000
+
+    return {
+        "frames_per_turn": sum(r.stats.frames_sent for r in results) / sockets,
+        "bytes_per_turn": sum(ws.bytes_sent for ws in websockets) / sockets,
+        "cpu_ms_per_turn": cpu_ms / sockets,
+        "wall_ms": wall_ms,
+    }
+
+
+@click.command()
+@click.option("--sockets", type=int, default=200, help="Number of concurrent websocket clients.")
+@click.option("--tokens", type=int, default=400, help="Chunks streamed per response.")
+@click.option("--token-interval-ms", type=float, default=5.0, help="Delay between LLM chunks.")
+@click.option("--send-delay-ms", type=float, default=1.0, help="Time a client takes to read a frame.")
+def main(sockets: int, tokens: int, token_interval_ms: float, send_delay_ms: float) -> None:
+    """CLI command to compare per-chunk and coalesced websocket streaming.
+
+    Streams a synthetic response to many concurrent fake clients and reports frames,
+    bytes and process CPU time per turn for each streaming mode.
+
+    Args:
+        sockets: Number of concurrent websocket clients.
+        tokens: Chunks streamed per response.
+        token_interval_ms: Delay between LLM chunks.
+        send_delay_ms: Time a client takes to read a frame.
+    """
+
+    print(
+        f"\033[32mSockets: {sockets} | chunks per response: {tokens} | "
+        f"flush window: {settings.CAREER_COACH_WS_FLUSH_INTERVAL_MS} ms / "
+        f"{settings.CAREER_COACH_WS_FLUSH_MAX_CHARS} chars\033[0m"
+    )
+    for mode in ("chunk", "coalesced"):
+        result = asyncio.run(
+            run_mode(mode, sockets, tokens, token_interval_ms, send_delay_ms)
+        )
+        print(
+            f"\033[32m{mode:>10}: {result['frames_per_turn']:8.1f} frames/turn | "
+            f"{result['bytes_per_turn']:9.0f} bytes/turn | "
+            f"{result['cpu_ms_per_turn']:7.2f} CPU ms/turn | "
+            f"{result['wall_ms']:8.0f} ms wall\033[0m"
+        )
+
+
+if __name__ == "__main__":
+    main()
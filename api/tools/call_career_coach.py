@@ -69,10 +69,6 @@ async def main(coach_id: str, user_id: str, query: str, user_context: str) -> No
         messages=query,
         user_id=user_id,
         coach_id=coach_id,
-        coach_name=coach.name,
-        coach_specialty=coach.specialty,
-        coach_approach=coach.approach,
-        coach_focus_areas=coach.focus_areas,
         user_context=user_context,
     ):
         print(f"\033[32m{chunk}\033[0m", end="", flush=True)
@@ -0,0 +1,75 @@
+import asyncio
+from functools import wraps
+
+import click
+from motor.motor_asyncio import AsyncIOMotorClient
+
+from career_coaches.config import settings
+from career_coaches.infrastructure.indexes import (
+    ensure_career_coach_indexes,
+    explain_hot_queries,
+    find_missing_career_coach_indexes,
+)
+
+
+def async_command(f):
+    """Decorator to run an async click command."""
+
+    @wraps(f)
+    def wrapper(*args, **kwargs):
+        return asyncio.run(f(*args, **kwargs))
+
+    return wrapper
+
+
+@click.command()
+@click.option(
+    "--create",
+    is_flag=True,
+    default=False,
+    help="Create the missing indexes before checking the query plans.",
+)
+@async_command
+async def main(create: bool) -> None:
+    """CLI command to report missing career coach indexes and check hot query plans.
+
+    Lists the required indexes missing from each collection, optionally creates
+    them, then explains the hot history and purge queries and flags any plan that
+    scans a whole collection.
+
+    Args:
+        create: Create the missing indexes before checking the query plans.
+    """
+
+    client = AsyncIOMotorClient(settings.MONGO_URI, appname="career_coaches")
+    db = client[settings.MONGO_DB_NAME]
+
+    try:
+        missing = await find_missing_career_coach_indexes(db)
+        if not missing:
+            print("\033[32m✓ All required indexes exist\033[0m")
+        for collection_name, specs in missing.items():
+            for spec in specs:
+                print(f"\033[31m✗ Missing index {spec.name} on {collection_name}: {spec.keys}\033[0m")
+
+        if missing and create:
+            created = await ensure_career_coach_indexes(db)
+            for collection_name, names in created.items():
+                print(f"\033[32m✓ Created {', '.join(names)} on {collection_name}\033[0m")
+
+        for query, plan in await explain_hot_queries(db):
+            stages = " <- ".join(plan.stages)
+            if plan.is_empty_collection:
+                print(f"\033[33m- {query.name}: collection is empty, plan not checked\033[0m")
+            elif plan.uses_collection_scan:
+                print(f"\033[31m✗ {query.name}: collection scan ({stages})\033[0m")
+            else:
+                print(f"\033[32m✓ {query.name}: {', '.join(plan.index_names)} ({stages})\033[0m")
+    except Exception as e:
+        print(f"\033[31m✗ Error checking indexes: {e}\033[0m")
+    finally:
+        client.close()
+
+
+if __name__ == "__main__":
+    main()
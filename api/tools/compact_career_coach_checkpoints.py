@@ -0,0 +1,78 @@
+import asyncio
+from functools import wraps
+
+import click
+
+from career_coaches.application.conversation_service.compact_checkpoints import (
+    compact_checkpoints,
+)
+from career_coaches.config import settings
+
+
+def async_command(f):
+    """Decorator to run an async click command."""
+
+    @wraps(f)
+    def wrapper(*args, **kwargs):
+        return asyncio.run(f(*args, **kwargs))
+
+    return wrapper
+
+
+@click.command()
+@click.option(
+    "--keep-last",
+    type=int,
+    default=settings.CAREER_COACH_CHECKPOINT_KEEP_LAST,
+    help="Number of most recent checkpoints to keep per conversation thread.",
+)
+@click.option(
+    "--ttl-days",
+    type=int,
+    default=settings.CAREER_COACH_CHECKPOINT_THREAD_TTL_DAYS,
+    help="Delete threads without activity for this many days. Disabled if not provided.",
+)
+@click.option(
+    "--batch-size",
+    type=int,
+    default=500,
+    help="Maximum number of checkpoints deleted per delete command.",
+)
+@click.option(
+    "--dry-run",
+    is_flag=True,
+    default=False,
+    help="Only report what would be deleted.",
+)
+@async_command
+async def main(keep_last: int, ttl_days: int | None, batch_size: int, dry_run: bool) -> None:
+    """CLI command to prune old career coach checkpoints and their writes.
+
+    Args:
+        keep_last: Number of most recent checkpoints to keep per conversation thread.
+        ttl_days: Delete threads without activity for this many days.
+        batch_size: Maximum number of checkpoints deleted per delete command.
+        dry_run: Only report what would be deleted.
+    """
+
+    print(
+        f"\033[33m{'[dry run] ' if dry_run else ''}Compacting career coach checkpoints | keep last: {keep_last} | TTL: {f'{ttl_days} days' if ttl_days is not None else 'disabled'}\033[0m"
+    )
+
+    try:
+        result = await compact_checkpoints(
+            keep_last=keep_last,
+            ttl_days=ttl_days,
+            batch_size=batch_size,
+            dry_run=dry_run,
+        )
+        print(f"\033[32m✓ Threads scanned: {result['threads_scanned']}\033[0m")
+        print(f"\033[32m✓ Threads expired: {result['threads_expired']}\033[0m")
+        print(f"\033[32m✓ Checkpoints deleted: {result['checkpoints_deleted']}\033[0m")
+        print(f"\033[32m✓ Writes deleted: {result['writes_deleted']}\033[0m")
+    except Exception as e:
+        print(f"\033[31m✗ Error compacting checkpoints: {e}\033[0m")
+
+
+if __name__ == "__main__":
+    main()
@@ -3,6 +3,7 @@ from loguru import logger
 
 from career_coaches.application.data.extract import create_sample_career_documents
 from career_coaches.application.long_term_memory import CareerCoachLongTermMemoryCreator
+from career_coaches.config import settings
 
 
 @click.command()
@@ -12,11 +13,21 @@ from career_coaches.application.long_term_memory import CareerCoachLongTermMemor
     default=True,
     help="Use sample career coaching data to create memory.",
 )
-def main(use_sample_data: bool) -> None:
-    """CLI command to create long-term memory for career coaches.
+@click.option(
+    "--mode",
+    type=click.Choice(["incremental", "blue_green"]),
+    default=settings.CAREER_LONG_TERM_MEMORY_SYNC_MODE,
+    help="Update memory in place, or rebuild it in a shadow collection and swap it in.",
+)
+def main(use_sample_data: bool, mode: str) -> None:
+    """CLI command to create or update long-term memory for career coaches.
+
+    Only the documents added, changed or removed since the last run are
+    re-embedded, unless the blue/green mode rebuilds the whole memory.
 
     Args:
         use_sample_data: Whether to use sample career coaching data.
+        mode: Update memory in place, or rebuild it in a shadow collection and swap it in.
     """
 
     logger.info("Creating long-term memory for career coaches...")
@@ -30,9 +41,13 @@ def main(use_sample_data: bool) -> None:
             documents = create_sample_career_documents()
             
             logger.info(f"Processing {len(documents)} sample documents...")
-            memory_creator.create_memory_from_documents(documents)
+            report = memory_creator.create_memory_from_documents(documents, mode=mode)
             
-            print(f"\033[32m✓ Successfully created career coach long-term memory with {len(documents)} sample documents\033[0m")
+            print(f"\033[32m✓ Successfully synced career coach long-term memory with {len(documents)} sample documents\033[0m")
+            print(
+                f"\033[32m  Collection: {report.collection} | added: {report.added} | changed: {report.changed} | "
+                f"removed: {report.removed} | unchanged: {report.unchanged}\033[0m"
+            )
             print("\033[32mSample data includes:\033[0m")
             print("  • Career assessment guidance")
             print("  • Resume writing best practices")
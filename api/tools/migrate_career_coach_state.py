@@ -0,0 +1,47 @@
+import asyncio
+from functools import wraps
+
+import click
+
+from career_coaches.application.conversation_service.migrate_state import (
+    compact_legacy_persona_state,
+)
+
+
+def async_command(f):
+    """Decorator to run an async click command."""
+
+    @wraps(f)
+    def wrapper(*args, **kwargs):
+        return asyncio.run(f(*args, **kwargs))
+
+    return wrapper
+
+
+@click.command()
+@click.option(
+    "--batch-size",
+    type=int,
+    default=500,
+    help="Number of checkpoints rewritten per bulk write.",
+)
+@async_command
+async def main(batch_size: int) -> None:
+    """CLI command to strip copied coach persona text from stored checkpoints.
+
+    Args:
+        batch_size: Number of checkpoints rewritten per bulk write.
+    """
+
+    print("\033[33mCompacting coach persona state in career coach checkpoints\033[0m")
+
+    try:
+        result = await compact_legacy_persona_state(batch_size=batch_size)
+        print(f"\033[32m✓ Checkpoints updated: {result['checkpoints_updated']}\033[0m")
+        print(f"\033[32m✓ Writes deleted: {result['writes_deleted']}\033[0m")
+    except Exception as e:
+        print(f"\033[31m✗ Error compacting checkpoints: {e}\033[0m")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,47 @@
+import asyncio
+from functools import wraps
+
+import click
+
+from career_coaches.application.conversation_service.conversation_index import (
+    rebuild_conversation_index,
+)
+
+
+def async_command(f):
+    """Decorator to run an async click command."""
+
+    @wraps(f)
+    def wrapper(*args, **kwargs):
+        return asyncio.run(f(*args, **kwargs))
+
+    return wrapper
+
+
+@click.command()
+@click.option(
+    "--batch-size",
+    type=int,
+    default=500,
+    help="Number of index entries written per bulk write.",
+)
+@async_command
+async def main(batch_size: int) -> None:
+    """CLI command to rebuild the conversation index from stored checkpoints.
+
+    Args:
+        batch_size: Number of index entries written per bulk write.
+    """
+
+    print("\033[33mRebuilding the career coach conversation index\033[0m")
+
+    try:
+        result = await rebuild_conversation_index(batch_size=batch_size)
+        print(f"\033[32m✓ Threads indexed: {result['threads_indexed']}\033[0m")
+        print(f"\033[32m✓ Threads skipped: {result['threads_skipped']}\033[0m")
+    except Exception as e:
+        print(f"\033[31m✗ Error rebuilding conversation index: {e}\033[0m")
+
+
+if __name__ == "__main__":
+    main()